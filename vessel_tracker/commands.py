@@ -1,11 +1,30 @@
 import click
+import frappe
+from frappe.commands import get_site, pass_context
 
 from vessel_tracker.vessel_tracker.workers.ais_stream import run as ais_run
 
 @click.command('ais-worker')
-def ais_worker():
+@pass_context
+def ais_worker(context):
+    """Stream the whole AIS bounding box in the foreground, for sites with the scheduler disabled"""
+    site = get_site(context)
+    
+    # With the scheduler on, start_ais_stream_shards already streams every tile
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        from frappe.utils.scheduler import is_scheduler_inactive
+        scheduled = not is_scheduler_inactive()
+    finally:
+        frappe.destroy()
+        
+    if scheduled:
+        click.secho(f"The scheduler streams AIS shards for {site}; not starting a duplicate worker", fg="red")
+        raise SystemExit(1)
+        
     print("Starting AIS Worker...")
-    ais_run()
+    ais_run(site=site)
 
     
-commands = [ais_worker]
\ No newline at end of file
+commands = [ais_worker]
@@ -149,9 +149,12 @@ after_install = "vessel_tracker.vessel_tracker.install.after_install"
 # ---------------
 
 scheduler_events = {
-	"daily_long": [
-		"vessel_tracker.vessel_tracker.workers.ais_stream.run"
-	],
+	"cron": {
+		# Respawns any stream shard that crashed or timed out
+		"* * * * *": [
+			"vessel_tracker.vessel_tracker.workers.ais_stream.start_ais_stream_shards"
+		]
+	},
 }
 
 # Testing
@@ -0,0 +1,14 @@
+import frappe
+
+
+def execute():
+    """
+    Add a composite index on vessel positions for bounding-box lookups
+    """
+    # Vessels comes from another app; sites without it have nothing to index
+    if not frappe.db.table_exists("Vessels"):
+        return
+        
+    frappe.db.add_index(
+        "Vessels", ["ais_last_position_lat", "ais_last_position_lon"], index_name="idx_vessels_position"
+    )
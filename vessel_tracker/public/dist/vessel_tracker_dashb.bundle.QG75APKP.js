@@ -6,7 +6,7 @@
 `+f[u].replace(" at new "," at ");return l.displayName&&y.includes("<anonymous>")&&(y=y.replace("<anonymous>",l.displayName)),y}while(1<=u&&0<=e);break}}}finally{Ti=!1,Error.prepareStackTrace=a}return(a=l?l.displayName||l.name:"")?fa(a):""}function Rm(l,t){switch(l.tag){case 26:case 27:case 5:return fa(l.type);case 16:return fa("Lazy");case 13:return l.child!==t&&t!==null?fa("Suspense Fallback"):fa("Suspense");case 19:return fa("SuspenseList");case 0:case 15:return Ei(l.type,!1);case 11:return Ei(l.type.render,!1);case 1:return Ei(l.type,!0);case 31:return fa("Activity");default:return""}}function x0(l){try{var t="",a=null;do t+=Rm(l,a),a=l,l=l.return;while(l);return t}catch(u){return`
 Error generating stack: `+u.message+`
 `+u.stack}}var cc=Object.prototype.hasOwnProperty,Fc=dl.unstable_scheduleCallback,Ai=dl.unstable_cancelCallback,Cm=dl.unstable_shouldYield,xm=dl.unstable_requestPaint,Bl=dl.unstable_now,Bm=dl.unstable_getCurrentPriorityLevel,so=dl.unstable_ImmediatePriority,oo=dl.unstable_UserBlockingPriority,vn=dl.unstable_NormalPriority,qm=dl.unstable_LowPriority,mo=dl.unstable_IdlePriority,Ym=dl.log,Gm=dl.unstable_setDisableYieldValue,me=null,ql=null;function Xt(l){if(typeof Ym=="function"&&Gm(l),ql&&typeof ql.setStrictMode=="function")try{ql.setStrictMode(me,l)}catch(t){}}var Yl=Math.clz32?Math.clz32:Zm,Xm=Math.log,Qm=Math.LN2;function Zm(l){return l>>>=0,l===0?32:31-(Xm(l)/Qm|0)|0}var He=256,Re=262144,Ce=4194304;function sa(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Xn(l,t,a){var u=l.pendingLanes;if(u===0)return 0;var e=0,n=l.suspendedLanes,i=l.pingedLanes;l=l.warmLanes;var c=u&134217727;return c!==0?(u=c&~n,u!==0?e=sa(u):(i&=c,i!==0?e=sa(i):a||(a=c&~l,a!==0&&(e=sa(a))))):(c=u&~n,c!==0?e=sa(c):i!==0?e=sa(i):a||(a=u&~l,a!==0&&(e=sa(a)))),e===0?0:t!==0&&t!==e&&(t&n)===0&&(n=e&-e,a=t&-t,n>=a||n===32&&(a&4194048)!==0)?t:e}function ve(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function jm(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function vo(){var l=Ce;return Ce<<=1,(Ce&62914560)===0&&(Ce=4194304),l}function _i(l){for(var t=[],a=0;31>a;a++)t.push(l);return t}function ye(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function Lm(l,t,a,u,e,n){var i=l.pendingLanes;l.pendingLanes=a,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=a,l.entangledLanes&=a,l.errorRecoveryDisabledLanes&=a,l.shellSuspendCounter=0;var c=l.entanglements,f=l.expirationTimes,d=l.hiddenUpdates;for(a=i&~a;0<a;){var y=31-Yl(a),S=1<<y;c[y]=0,f[y]=-1;var v=d[y];if(v!==null)for(d[y]=null,y=0;y<v.length;y++){var h=v[y];h!==null&&(h.lane&=-536870913)}a&=~S}u!==0&&yo(l,u,0),n!==0&&e===0&&l.tag!==0&&(l.suspendedLanes|=n&~(i&~t))}function yo(l,t,a){l.pendingLanes|=t,l.suspendedLanes&=~t;var u=31-Yl(t);l.entangledLanes|=t,l.entanglements[u]=l.entanglements[u]|1073741824|a&261930}function ho(l,t){var a=l.entangledLanes|=t;for(l=l.entanglements;a;){var u=31-Yl(a),e=1<<u;e&t|l[u]&t&&(l[u]|=t),a&=~e}}function go(l,t){var a=t&-t;return a=(a&42)!==0?1:Ic(a),(a&(l.suspendedLanes|t))!==0?0:a}function Ic(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function Pc(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function So(){var l=Q.p;return l!==0?l:(l=window.event,l===void 0?32:Q1(l.type))}function B0(l,t){var a=Q.p;try{return Q.p=l,t()}finally{Q.p=a}}var ua=Math.random().toString(36).slice(2),gl="__reactFiber$"+ua,Nl="__reactProps$"+ua,mu="__reactContainer$"+ua,fc="__reactEvents$"+ua,Vm="__reactListeners$"+ua,Km="__reactHandles$"+ua,q0="__reactResources$"+ua,he="__reactMarker$"+ua;function lf(l){delete l[gl],delete l[Nl],delete l[fc],delete l[Vm],delete l[Km]}function Ga(l){var t=l[gl];if(t)return t;for(var a=l.parentNode;a;){if(t=a[mu]||a[gl]){if(a=t.alternate,t.child!==null||a!==null&&a.child!==null)for(l=Vs(l);l!==null;){if(a=l[gl])return a;l=Vs(l)}return t}l=a,a=l.parentNode}return null}function vu(l){if(l=l[gl]||l[mu]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Bu(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(b(33))}function Wa(l){var t=l[q0];return t||(t=l[q0]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function vl(l){l[he]=!0}var bo=new Set,ro={};function Ta(l,t){au(l,t),au(l+"Capture",t)}function au(l,t){for(ro[l]=t,l=0;l<t.length;l++)bo.add(t[l])}var Jm=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Y0={},G0={};function wm(l){return cc.call(G0,l)?!0:cc.call(Y0,l)?!1:Jm.test(l)?G0[l]=!0:(Y0[l]=!0,!1)}function We(l,t,a){if(wm(t))if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var u=t.toLowerCase().slice(0,5);if(u!=="data-"&&u!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+a)}}function xe(l,t,a){if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+a)}}function dt(l,t,a,u){if(u===null)l.removeAttribute(a);else{switch(typeof u){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(a);return}l.setAttributeNS(t,a,""+u)}}function Ll(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function zo(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Wm(l,t,a){var u=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof u!="undefined"&&typeof u.get=="function"&&typeof u.set=="function"){var e=u.get,n=u.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return e.call(this)},set:function(i){a=""+i,n.call(this,i)}}),Object.defineProperty(l,t,{enumerable:u.enumerable}),{getValue:function(){return a},setValue:function(i){a=""+i},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function sc(l){if(!l._valueTracker){var t=zo(l)?"checked":"value";l._valueTracker=Wm(l,t,""+l[t])}}function po(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var a=t.getValue(),u="";return l&&(u=zo(l)?l.checked?"true":"false":l.value),l=u,l!==a?(t.setValue(l),!0):!1}function yn(l){if(l=l||(typeof document!="undefined"?document:void 0),typeof l=="undefined")return null;try{return l.activeElement||l.body}catch(t){return l.body}}var $m=/[\n"\\]/g;function Jl(l){return l.replace($m,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function oc(l,t,a,u,e,n,i,c){l.name="",i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?l.type=i:l.removeAttribute("type"),t!=null?i==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+Ll(t)):l.value!==""+Ll(t)&&(l.value=""+Ll(t)):i!=="submit"&&i!=="reset"||l.removeAttribute("value"),t!=null?dc(l,i,Ll(t)):a!=null?dc(l,i,Ll(a)):u!=null&&l.removeAttribute("value"),e==null&&n!=null&&(l.defaultChecked=!!n),e!=null&&(l.checked=e&&typeof e!="function"&&typeof e!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.name=""+Ll(c):l.removeAttribute("name")}function To(l,t,a,u,e,n,i,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||a!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){sc(l);return}a=a!=null?""+Ll(a):"",t=t!=null?""+Ll(t):a,c||t===l.value||(l.value=t),l.defaultValue=t}u=u!=null?u:e,u=typeof u!="function"&&typeof u!="symbol"&&!!u,l.checked=c?l.checked:!!u,l.defaultChecked=!!u,i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"&&(l.name=i),sc(l)}function dc(l,t,a){t==="number"&&yn(l.ownerDocument)===l||l.defaultValue===""+a||(l.defaultValue=""+a)}function $a(l,t,a,u){if(l=l.options,t){t={};for(var e=0;e<a.length;e++)t["$"+a[e]]=!0;for(a=0;a<l.length;a++)e=t.hasOwnProperty("$"+l[a].value),l[a].selected!==e&&(l[a].selected=e),e&&u&&(l[a].defaultSelected=!0)}else{for(a=""+Ll(a),t=null,e=0;e<l.length;e++){if(l[e].value===a){l[e].selected=!0,u&&(l[e].defaultSelected=!0);return}t!==null||l[e].disabled||(t=l[e])}t!==null&&(t.selected=!0)}}function Eo(l,t,a){if(t!=null&&(t=""+Ll(t),t!==l.value&&(l.value=t),a==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=a!=null?""+Ll(a):""}function Ao(l,t,a,u){if(t==null){if(u!=null){if(a!=null)throw Error(b(92));if(xu(u)){if(1<u.length)throw Error(b(93));u=u[0]}a=u}a==null&&(a=""),t=a}a=Ll(t),l.defaultValue=a,u=l.textContent,u===a&&u!==""&&u!==null&&(l.value=u),sc(l)}function uu(l,t){if(t){var a=l.firstChild;if(a&&a===l.lastChild&&a.nodeType===3){a.nodeValue=t;return}}l.textContent=t}var km=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function X0(l,t,a){var u=t.indexOf("--")===0;a==null||typeof a=="boolean"||a===""?u?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":u?l.setProperty(t,a):typeof a!="number"||a===0||km.has(t)?t==="float"?l.cssFloat=a:l[t]=(""+a).trim():l[t]=a+"px"}function _o(l,t,a){if(t!=null&&typeof t!="object")throw Error(b(62));if(l=l.style,a!=null){for(var u in a)!a.hasOwnProperty(u)||t!=null&&t.hasOwnProperty(u)||(u.indexOf("--")===0?l.setProperty(u,""):u==="float"?l.cssFloat="":l[u]="");for(var e in t)u=t[e],t.hasOwnProperty(e)&&a[e]!==u&&X0(l,e,u)}else for(var n in t)t.hasOwnProperty(n)&&X0(l,n,t[n])}function tf(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Fm=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Im=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function $e(l){return Im.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function rt(){}var mc=null;function af(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var Xa=null,ka=null;function Q0(l){var t=vu(l);if(t&&(l=t.stateNode)){var a=l[Nl]||null;l:switch(l=t.stateNode,t.type){case"input":if(oc(l,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name),t=a.name,a.type==="radio"&&t!=null){for(a=l;a.parentNode;)a=a.parentNode;for(a=a.querySelectorAll('input[name="'+Jl(""+t)+'"][type="radio"]'),t=0;t<a.length;t++){var u=a[t];if(u!==l&&u.form===l.form){var e=u[Nl]||null;if(!e)throw Error(b(90));oc(u,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name)}}for(t=0;t<a.length;t++)u=a[t],u.form===l.form&&po(u)}break l;case"textarea":Eo(l,a.value,a.defaultValue);break l;case"select":t=a.value,t!=null&&$a(l,!!a.multiple,t,!1)}}}var Mi=!1;function Mo(l,t,a){if(Mi)return l(t,a);Mi=!0;try{var u=l(t);return u}finally{if(Mi=!1,(Xa!==null||ka!==null)&&(Fn(),Xa&&(t=Xa,l=ka,ka=Xa=null,Q0(t),l)))for(t=0;t<l.length;t++)Q0(l[t])}}function Iu(l,t){var a=l.stateNode;if(a===null)return null;var u=a[Nl]||null;if(u===null)return null;a=u[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(u=!u.disabled)||(l=l.type,u=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!u;break l;default:l=!1}if(l)return null;if(a&&typeof a!="function")throw Error(b(231,t,typeof a));return a}var At=!(typeof window=="undefined"||typeof window.document=="undefined"||typeof window.document.createElement=="undefined"),vc=!1;if(At)try{Ha={},Object.defineProperty(Ha,"passive",{get:function(){vc=!0}}),window.addEventListener("test",Ha,Ha),window.removeEventListener("test",Ha,Ha)}catch(l){vc=!1}var Ha,Qt=null,uf=null,ke=null;function Oo(){if(ke)return ke;var l,t=uf,a=t.length,u,e="value"in Qt?Qt.value:Qt.textContent,n=e.length;for(l=0;l<a&&t[l]===e[l];l++);var i=a-l;for(u=1;u<=i&&t[a-u]===e[n-u];u++);return ke=e.slice(l,1<u?1-u:void 0)}function Fe(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function Be(){return!0}function Z0(){return!1}function Ul(l){function t(a,u,e,n,i){this._reactName=a,this._targetInst=e,this.type=u,this.nativeEvent=n,this.target=i,this.currentTarget=null;for(var c in l)l.hasOwnProperty(c)&&(a=l[c],this[c]=a?a(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?Be:Z0,this.isPropagationStopped=Z0,this}return I(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var a=this.nativeEvent;a&&(a.preventDefault?a.preventDefault():typeof a.returnValue!="unknown"&&(a.returnValue=!1),this.isDefaultPrevented=Be)},stopPropagation:function(){var a=this.nativeEvent;a&&(a.stopPropagation?a.stopPropagation():typeof a.cancelBubble!="unknown"&&(a.cancelBubble=!0),this.isPropagationStopped=Be)},persist:function(){},isPersistent:Be}),t}var Ea={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Qn=Ul(Ea),ge=I({},Ea,{view:0,detail:0}),Pm=Ul(ge),Oi,Di,Ou,Zn=I({},ge,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:ef,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==Ou&&(Ou&&l.type==="mousemove"?(Oi=l.screenX-Ou.screenX,Di=l.screenY-Ou.screenY):Di=Oi=0,Ou=l),Oi)},movementY:function(l){return"movementY"in l?l.movementY:Di}}),j0=Ul(Zn),lv=I({},Zn,{dataTransfer:0}),tv=Ul(lv),av=I({},ge,{relatedTarget:0}),Ni=Ul(av),uv=I({},Ea,{animationName:0,elapsedTime:0,pseudoElement:0}),ev=Ul(uv),nv=I({},Ea,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),iv=Ul(nv),cv=I({},Ea,{data:0}),L0=Ul(cv),fv={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},sv={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},ov={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function dv(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=ov[l])?!!t[l]:!1}function ef(){return dv}var mv=I({},ge,{key:function(l){if(l.key){var t=fv[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=Fe(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?sv[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:ef,charCode:function(l){return l.type==="keypress"?Fe(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?Fe(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),vv=Ul(mv),yv=I({},Zn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),V0=Ul(yv),hv=I({},ge,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:ef}),gv=Ul(hv),Sv=I({},Ea,{propertyName:0,elapsedTime:0,pseudoElement:0}),bv=Ul(Sv),rv=I({},Zn,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),zv=Ul(rv),pv=I({},Ea,{newState:0,oldState:0}),Tv=Ul(pv),Ev=[9,13,27,32],nf=At&&"CompositionEvent"in window,Gu=null;At&&"documentMode"in document&&(Gu=document.documentMode);var Av=At&&"TextEvent"in window&&!Gu,Do=At&&(!nf||Gu&&8<Gu&&11>=Gu),K0=String.fromCharCode(32),J0=!1;function No(l,t){switch(l){case"keyup":return Ev.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Uo(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var Qa=!1;function _v(l,t){switch(l){case"compositionend":return Uo(t);case"keypress":return t.which!==32?null:(J0=!0,K0);case"textInput":return l=t.data,l===K0&&J0?null:l;default:return null}}function Mv(l,t){if(Qa)return l==="compositionend"||!nf&&No(l,t)?(l=Oo(),ke=uf=Qt=null,Qa=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Do&&t.locale!=="ko"?null:t.data;default:return null}}var Ov={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function w0(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!Ov[l.type]:t==="textarea"}function Ho(l,t,a,u){Xa?ka?ka.push(u):ka=[u]:Xa=u,t=Rn(t,"onChange"),0<t.length&&(a=new Qn("onChange","change",null,a,u),l.push({event:a,listeners:t}))}var Xu=null,Pu=null;function Dv(l){M1(l,0)}function jn(l){var t=Bu(l);if(po(t))return l}function W0(l,t){if(l==="change")return t}var Ro=!1;At&&(At?(Ye="oninput"in document,Ye||(Ui=document.createElement("div"),Ui.setAttribute("oninput","return;"),Ye=typeof Ui.oninput=="function"),qe=Ye):qe=!1,Ro=qe&&(!document.documentMode||9<document.documentMode));var qe,Ye,Ui;function $0(){Xu&&(Xu.detachEvent("onpropertychange",Co),Pu=Xu=null)}function Co(l){if(l.propertyName==="value"&&jn(Pu)){var t=[];Ho(t,Pu,l,af(l)),Mo(Dv,t)}}function Nv(l,t,a){l==="focusin"?($0(),Xu=t,Pu=a,Xu.attachEvent("onpropertychange",Co)):l==="focusout"&&$0()}function Uv(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return jn(Pu)}function Hv(l,t){if(l==="click")return jn(t)}function Rv(l,t){if(l==="input"||l==="change")return jn(t)}function Cv(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var Xl=typeof Object.is=="function"?Object.is:Cv;function le(l,t){if(Xl(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var a=Object.keys(l),u=Object.keys(t);if(a.length!==u.length)return!1;for(u=0;u<a.length;u++){var e=a[u];if(!cc.call(t,e)||!Xl(l[e],t[e]))return!1}return!0}function k0(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function F0(l,t){var a=k0(l);l=0;for(var u;a;){if(a.nodeType===3){if(u=l+a.textContent.length,l<=t&&u>=t)return{node:a,offset:t-l};l=u}l:{for(;a;){if(a.nextSibling){a=a.nextSibling;break l}a=a.parentNode}a=void 0}a=k0(a)}}function xo(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?xo(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function Bo(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=yn(l.document);t instanceof l.HTMLIFrameElement;){try{var a=typeof t.contentWindow.location.href=="string"}catch(u){a=!1}if(a)l=t.contentWindow;else break;t=yn(l.document)}return t}function cf(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var xv=At&&"documentMode"in document&&11>=document.documentMode,Za=null,yc=null,Qu=null,hc=!1;function I0(l,t,a){var u=a.window===a?a.document:a.nodeType===9?a:a.ownerDocument;hc||Za==null||Za!==yn(u)||(u=Za,"selectionStart"in u&&cf(u)?u={start:u.selectionStart,end:u.selectionEnd}:(u=(u.ownerDocument&&u.ownerDocument.defaultView||window).getSelection(),u={anchorNode:u.anchorNode,anchorOffset:u.anchorOffset,focusNode:u.focusNode,focusOffset:u.focusOffset}),Qu&&le(Qu,u)||(Qu=u,u=Rn(yc,"onSelect"),0<u.length&&(t=new Qn("onSelect","select",null,t,a),l.push({event:t,listeners:u}),t.target=Za)))}function ca(l,t){var a={};return a[l.toLowerCase()]=t.toLowerCase(),a["Webkit"+l]="webkit"+t,a["Moz"+l]="moz"+t,a}var ja={animationend:ca("Animation","AnimationEnd"),animationiteration:ca("Animation","AnimationIteration"),animationstart:ca("Animation","AnimationStart"),transitionrun:ca("Transition","TransitionRun"),transitionstart:ca("Transition","TransitionStart"),transitioncancel:ca("Transition","TransitionCancel"),transitionend:ca("Transition","TransitionEnd")},Hi={},qo={};At&&(qo=document.createElement("div").style,"AnimationEvent"in window||(delete ja.animationend.animation,delete ja.animationiteration.animation,delete ja.animationstart.animation),"TransitionEvent"in window||delete ja.transitionend.transition);function Aa(l){if(Hi[l])return Hi[l];if(!ja[l])return l;var t=ja[l],a;for(a in t)if(t.hasOwnProperty(a)&&a in qo)return Hi[l]=t[a];return l}var Yo=Aa("animationend"),Go=Aa("animationiteration"),Xo=Aa("animationstart"),Bv=Aa("transitionrun"),qv=Aa("transitionstart"),Yv=Aa("transitioncancel"),Qo=Aa("transitionend"),Zo=new Map,gc="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");gc.push("scrollEnd");function lt(l,t){Zo.set(l,t),Ta(t,[l])}var hn=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},jl=[],La=0,ff=0;function Ln(){for(var l=La,t=ff=La=0;t<l;){var a=jl[t];jl[t++]=null;var u=jl[t];jl[t++]=null;var e=jl[t];jl[t++]=null;var n=jl[t];if(jl[t++]=null,u!==null&&e!==null){var i=u.pending;i===null?e.next=e:(e.next=i.next,i.next=e),u.pending=e}n!==0&&jo(a,e,n)}}function Vn(l,t,a,u){jl[La++]=l,jl[La++]=t,jl[La++]=a,jl[La++]=u,ff|=u,l.lanes|=u,l=l.alternate,l!==null&&(l.lanes|=u)}function sf(l,t,a,u){return Vn(l,t,a,u),gn(l)}function _a(l,t){return Vn(l,null,null,t),gn(l)}function jo(l,t,a){l.lanes|=a;var u=l.alternate;u!==null&&(u.lanes|=a);for(var e=!1,n=l.return;n!==null;)n.childLanes|=a,u=n.alternate,u!==null&&(u.childLanes|=a),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(e=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,e&&t!==null&&(e=31-Yl(a),l=n.hiddenUpdates,u=l[e],u===null?l[e]=[t]:u.push(t),t.lane=a|536870912),n):null}function gn(l){if(50<$u)throw $u=0,Yc=null,Error(b(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var Va={};function Gv(l,t,a,u){this.tag=l,this.key=a,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=u,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Cl(l,t,a,u){return new Gv(l,t,a,u)}function of(l){return l=l.prototype,!(!l||!l.isReactComponent)}function pt(l,t){var a=l.alternate;return a===null?(a=Cl(l.tag,t,l.key,l.mode),a.elementType=l.elementType,a.type=l.type,a.stateNode=l.stateNode,a.alternate=l,l.alternate=a):(a.pendingProps=t,a.type=l.type,a.flags=0,a.subtreeFlags=0,a.deletions=null),a.flags=l.flags&65011712,a.childLanes=l.childLanes,a.lanes=l.lanes,a.child=l.child,a.memoizedProps=l.memoizedProps,a.memoizedState=l.memoizedState,a.updateQueue=l.updateQueue,t=l.dependencies,a.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},a.sibling=l.sibling,a.index=l.index,a.ref=l.ref,a.refCleanup=l.refCleanup,a}function Lo(l,t){l.flags&=65011714;var a=l.alternate;return a===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=a.childLanes,l.lanes=a.lanes,l.child=a.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=a.memoizedProps,l.memoizedState=a.memoizedState,l.updateQueue=a.updateQueue,l.type=a.type,t=a.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function Ie(l,t,a,u,e,n){var i=0;if(u=l,typeof l=="function")of(l)&&(i=1);else if(typeof l=="string")i=Zy(l,a,it.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case uc:return l=Cl(31,a,t,e),l.elementType=uc,l.lanes=n,l;case qa:return va(a.children,e,n,t);case co:i=8,e|=24;break;case lc:return l=Cl(12,a,t,e|2),l.elementType=lc,l.lanes=n,l;case tc:return l=Cl(13,a,t,e),l.elementType=tc,l.lanes=n,l;case ac:return l=Cl(19,a,t,e),l.elementType=ac,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case bt:i=10;break l;case fo:i=9;break l;case $c:i=11;break l;case kc:i=14;break l;case Ct:i=16,u=null;break l}i=29,a=Error(b(130,l===null?"null":typeof l,"")),u=null}return t=Cl(i,a,t,e),t.elementType=l,t.type=u,t.lanes=n,t}function va(l,t,a,u){return l=Cl(7,l,u,t),l.lanes=a,l}function Ri(l,t,a){return l=Cl(6,l,null,t),l.lanes=a,l}function Vo(l){var t=Cl(18,null,null,0);return t.stateNode=l,t}function Ci(l,t,a){return t=Cl(4,l.children!==null?l.children:[],l.key,t),t.lanes=a,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var P0=new WeakMap;function wl(l,t){if(typeof l=="object"&&l!==null){var a=P0.get(l);return a!==void 0?a:(t={value:l,source:t,stack:x0(t)},P0.set(l,t),t)}return{value:l,source:t,stack:x0(t)}}var Ka=[],Ja=0,Sn=null,te=0,Vl=[],Kl=0,Pt=null,ut=1,et="";function gt(l,t){Ka[Ja++]=te,Ka[Ja++]=Sn,Sn=l,te=t}function Ko(l,t,a){Vl[Kl++]=ut,Vl[Kl++]=et,Vl[Kl++]=Pt,Pt=l;var u=ut;l=et;var e=32-Yl(u)-1;u&=~(1<<e),a+=1;var n=32-Yl(t)+e;if(30<n){var i=e-e%5;n=(u&(1<<i)-1).toString(32),u>>=i,e-=i,ut=1<<32-Yl(t)+e|a<<e|u,et=n+l}else ut=1<<n|a<<e|u,et=l}function df(l){l.return!==null&&(gt(l,1),Ko(l,1,0))}function mf(l){for(;l===Sn;)Sn=Ka[--Ja],Ka[Ja]=null,te=Ka[--Ja],Ka[Ja]=null;for(;l===Pt;)Pt=Vl[--Kl],Vl[Kl]=null,et=Vl[--Kl],Vl[Kl]=null,ut=Vl[--Kl],Vl[Kl]=null}function Jo(l,t){Vl[Kl++]=ut,Vl[Kl++]=et,Vl[Kl++]=Pt,ut=t.id,et=t.overflow,Pt=l}var Sl=null,F=null,q=!1,Kt=null,Wl=!1,Sc=Error(b(519));function la(l){var t=Error(b(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw ae(wl(t,l)),Sc}function ls(l){var t=l.stateNode,a=l.type,u=l.memoizedProps;switch(t[gl]=l,t[Nl]=u,a){case"dialog":R("cancel",t),R("close",t);break;case"iframe":case"object":case"embed":R("load",t);break;case"video":case"audio":for(a=0;a<ie.length;a++)R(ie[a],t);break;case"source":R("error",t);break;case"img":case"image":case"link":R("error",t),R("load",t);break;case"details":R("toggle",t);break;case"input":R("invalid",t),To(t,u.value,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name,!0);break;case"select":R("invalid",t);break;case"textarea":R("invalid",t),Ao(t,u.value,u.defaultValue,u.children)}a=u.children,typeof a!="string"&&typeof a!="number"&&typeof a!="bigint"||t.textContent===""+a||u.suppressHydrationWarning===!0||D1(t.textContent,a)?(u.popover!=null&&(R("beforetoggle",t),R("toggle",t)),u.onScroll!=null&&R("scroll",t),u.onScrollEnd!=null&&R("scrollend",t),u.onClick!=null&&(t.onclick=rt),t=!0):t=!1,t||la(l,!0)}function ts(l){for(Sl=l.return;Sl;)switch(Sl.tag){case 5:case 31:case 13:Wl=!1;return;case 27:case 3:Wl=!0;return;default:Sl=Sl.return}}function Ra(l){if(l!==Sl)return!1;if(!q)return ts(l),q=!0,!1;var t=l.tag,a;if((a=t!==3&&t!==27)&&((a=t===5)&&(a=l.type,a=!(a!=="form"&&a!=="button")||jc(l.type,l.memoizedProps)),a=!a),a&&F&&la(l),ts(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(b(317));F=Ls(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(b(317));F=Ls(l)}else t===27?(t=F,ea(l.type)?(l=Jc,Jc=null,F=l):F=t):F=Sl?kl(l.stateNode.nextSibling):null;return!0}function Sa(){F=Sl=null,q=!1}function xi(){var l=Kt;return l!==null&&(Ol===null?Ol=l:Ol.push.apply(Ol,l),Kt=null),l}function ae(l){Kt===null?Kt=[l]:Kt.push(l)}var bc=ct(null),Ma=null,zt=null;function Bt(l,t,a){w(bc,t._currentValue),t._currentValue=a}function Tt(l){l._currentValue=bc.current,yl(bc)}function rc(l,t,a){for(;l!==null;){var u=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,u!==null&&(u.childLanes|=t)):u!==null&&(u.childLanes&t)!==t&&(u.childLanes|=t),l===a)break;l=l.return}}function zc(l,t,a,u){var e=l.child;for(e!==null&&(e.return=l);e!==null;){var n=e.dependencies;if(n!==null){var i=e.child;n=n.firstContext;l:for(;n!==null;){var c=n;n=e;for(var f=0;f<t.length;f++)if(c.context===t[f]){n.lanes|=a,c=n.alternate,c!==null&&(c.lanes|=a),rc(n.return,a,l),u||(i=null);break l}n=c.next}}else if(e.tag===18){if(i=e.return,i===null)throw Error(b(341));i.lanes|=a,n=i.alternate,n!==null&&(n.lanes|=a),rc(i,a,l),i=null}else i=e.child;if(i!==null)i.return=e;else for(i=e;i!==null;){if(i===l){i=null;break}if(e=i.sibling,e!==null){e.return=i.return,i=e;break}i=i.return}e=i}}function yu(l,t,a,u){l=null;for(var e=t,n=!1;e!==null;){if(!n){if((e.flags&524288)!==0)n=!0;else if((e.flags&262144)!==0)break}if(e.tag===10){var i=e.alternate;if(i===null)throw Error(b(387));if(i=i.memoizedProps,i!==null){var c=e.type;Xl(e.pendingProps.value,i.value)||(l!==null?l.push(c):l=[c])}}else if(e===on.current){if(i=e.alternate,i===null)throw Error(b(387));i.memoizedState.memoizedState!==e.memoizedState.memoizedState&&(l!==null?l.push(fe):l=[fe])}e=e.return}l!==null&&zc(t,l,a,u),t.flags|=262144}function bn(l){for(l=l.firstContext;l!==null;){if(!Xl(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function ba(l){Ma=l,zt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function bl(l){return wo(Ma,l)}function Ge(l,t){return Ma===null&&ba(l),wo(l,t)}function wo(l,t){var a=t._currentValue;if(t={context:t,memoizedValue:a,next:null},zt===null){if(l===null)throw Error(b(308));zt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else zt=zt.next=t;return a}var Xv=typeof AbortController!="undefined"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(a,u){l.push(u)}};this.abort=function(){t.aborted=!0,l.forEach(function(a){return a()})}},Qv=dl.unstable_scheduleCallback,Zv=dl.unstable_NormalPriority,fl={$$typeof:bt,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function vf(){return{controller:new Xv,data:new Map,refCount:0}}function Se(l){l.refCount--,l.refCount===0&&Qv(Zv,function(){l.controller.abort()})}var Zu=null,pc=0,eu=0,Fa=null;function jv(l,t){if(Zu===null){var a=Zu=[];pc=0,eu=Gf(),Fa={status:"pending",value:void 0,then:function(u){a.push(u)}}}return pc++,t.then(as,as),t}function as(){if(--pc===0&&Zu!==null){Fa!==null&&(Fa.status="fulfilled");var l=Zu;Zu=null,eu=0,Fa=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Lv(l,t){var a=[],u={status:"pending",value:null,reason:null,then:function(e){a.push(e)}};return l.then(function(){u.status="fulfilled",u.value=t;for(var e=0;e<a.length;e++)(0,a[e])(t)},function(e){for(u.status="rejected",u.reason=e,e=0;e<a.length;e++)(0,a[e])(void 0)}),u}var us=O.S;O.S=function(l,t){c1=Bl(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&jv(l,t),us!==null&&us(l,t)};var ya=ct(null);function yf(){var l=ya.current;return l!==null?l:J.pooledCache}function Pe(l,t){t===null?w(ya,ya.current):w(ya,t.pool)}function Wo(){var l=yf();return l===null?null:{parent:fl._currentValue,pool:l}}var hu=Error(b(460)),hf=Error(b(474)),Kn=Error(b(542)),rn={then:function(){}};function es(l){return l=l.status,l==="fulfilled"||l==="rejected"}function $o(l,t,a){switch(a=l[a],a===void 0?l.push(t):a!==t&&(t.then(rt,rt),t=a),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,is(l),l;default:if(typeof t.status=="string")t.then(rt,rt);else{if(l=J,l!==null&&100<l.shellSuspendCounter)throw Error(b(482));l=t,l.status="pending",l.then(function(u){if(t.status==="pending"){var e=t;e.status="fulfilled",e.value=u}},function(u){if(t.status==="pending"){var e=t;e.status="rejected",e.reason=u}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,is(l),l}throw ha=t,hu}}function oa(l){try{var t=l._init;return t(l._payload)}catch(a){throw a!==null&&typeof a=="object"&&typeof a.then=="function"?(ha=a,hu):a}}var ha=null;function ns(){if(ha===null)throw Error(b(459));var l=ha;return ha=null,l}function is(l){if(l===hu||l===Kn)throw Error(b(483))}var Ia=null,ue=0;function Xe(l){var t=ue;return ue+=1,Ia===null&&(Ia=[]),$o(Ia,l,t)}function Du(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function Qe(l,t){throw t.$$typeof===Nm?Error(b(525)):(l=Object.prototype.toString.call(t),Error(b(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function ko(l){function t(o,s){if(l){var m=o.deletions;m===null?(o.deletions=[s],o.flags|=16):m.push(s)}}function a(o,s){if(!l)return null;for(;s!==null;)t(o,s),s=s.sibling;return null}function u(o){for(var s=new Map;o!==null;)o.key!==null?s.set(o.key,o):s.set(o.index,o),o=o.sibling;return s}function e(o,s){return o=pt(o,s),o.index=0,o.sibling=null,o}function n(o,s,m){return o.index=m,l?(m=o.alternate,m!==null?(m=m.index,m<s?(o.flags|=67108866,s):m):(o.flags|=67108866,s)):(o.flags|=1048576,s)}function i(o){return l&&o.alternate===null&&(o.flags|=67108866),o}function c(o,s,m,g){return s===null||s.tag!==6?(s=Ri(m,o.mode,g),s.return=o,s):(s=e(s,m),s.return=o,s)}function f(o,s,m,g){var _=m.type;return _===qa?y(o,s,m.props.children,g,m.key):s!==null&&(s.elementType===_||typeof _=="object"&&_!==null&&_.$$typeof===Ct&&oa(_)===s.type)?(s=e(s,m.props),Du(s,m),s.return=o,s):(s=Ie(m.type,m.key,m.props,null,o.mode,g),Du(s,m),s.return=o,s)}function d(o,s,m,g){return s===null||s.tag!==4||s.stateNode.containerInfo!==m.containerInfo||s.stateNode.implementation!==m.implementation?(s=Ci(m,o.mode,g),s.return=o,s):(s=e(s,m.children||[]),s.return=o,s)}function y(o,s,m,g,_){return s===null||s.tag!==7?(s=va(m,o.mode,g,_),s.return=o,s):(s=e(s,m),s.return=o,s)}function S(o,s,m){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Ri(""+s,o.mode,m),s.return=o,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Ue:return m=Ie(s.type,s.key,s.props,null,o.mode,m),Du(m,s),m.return=o,m;case Cu:return s=Ci(s,o.mode,m),s.return=o,s;case Ct:return s=oa(s),S(o,s,m)}if(xu(s)||Mu(s))return s=va(s,o.mode,m,null),s.return=o,s;if(typeof s.then=="function")return S(o,Xe(s),m);if(s.$$typeof===bt)return S(o,Ge(o,s),m);Qe(o,s)}return null}function v(o,s,m,g){var _=s!==null?s.key:null;if(typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint")return _!==null?null:c(o,s,""+m,g);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case Ue:return m.key===_?f(o,s,m,g):null;case Cu:return m.key===_?d(o,s,m,g):null;case Ct:return m=oa(m),v(o,s,m,g)}if(xu(m)||Mu(m))return _!==null?null:y(o,s,m,g,null);if(typeof m.then=="function")return v(o,s,Xe(m),g);if(m.$$typeof===bt)return v(o,s,Ge(o,m),g);Qe(o,m)}return null}function h(o,s,m,g,_){if(typeof g=="string"&&g!==""||typeof g=="number"||typeof g=="bigint")return o=o.get(m)||null,c(s,o,""+g,_);if(typeof g=="object"&&g!==null){switch(g.$$typeof){case Ue:return o=o.get(g.key===null?m:g.key)||null,f(s,o,g,_);case Cu:return o=o.get(g.key===null?m:g.key)||null,d(s,o,g,_);case Ct:return g=oa(g),h(o,s,m,g,_)}if(xu(g)||Mu(g))return o=o.get(m)||null,y(s,o,g,_,null);if(typeof g.then=="function")return h(o,s,m,Xe(g),_);if(g.$$typeof===bt)return h(o,s,m,Ge(s,g),_);Qe(s,g)}return null}function p(o,s,m,g){for(var _=null,B=null,E=s,D=s=0,H=null;E!==null&&D<m.length;D++){E.index>D?(H=E,E=null):H=E.sibling;var Y=v(o,E,m[D],g);if(Y===null){E===null&&(E=H);break}l&&E&&Y.alternate===null&&t(o,E),s=n(Y,s,D),B===null?_=Y:B.sibling=Y,B=Y,E=H}if(D===m.length)return a(o,E),q&&gt(o,D),_;if(E===null){for(;D<m.length;D++)E=S(o,m[D],g),E!==null&&(s=n(E,s,D),B===null?_=E:B.sibling=E,B=E);return q&&gt(o,D),_}for(E=u(E);D<m.length;D++)H=h(E,o,D,m[D],g),H!==null&&(l&&H.alternate!==null&&E.delete(H.key===null?D:H.key),s=n(H,s,D),B===null?_=H:B.sibling=H,B=H);return l&&E.forEach(function(tt){return t(o,tt)}),q&&gt(o,D),_}function M(o,s,m,g){if(m==null)throw Error(b(151));for(var _=null,B=null,E=s,D=s=0,H=null,Y=m.next();E!==null&&!Y.done;D++,Y=m.next()){E.index>D?(H=E,E=null):H=E.sibling;var tt=v(o,E,Y.value,g);if(tt===null){E===null&&(E=H);break}l&&E&&tt.alternate===null&&t(o,E),s=n(tt,s,D),B===null?_=tt:B.sibling=tt,B=tt,E=H}if(Y.done)return a(o,E),q&&gt(o,D),_;if(E===null){for(;!Y.done;D++,Y=m.next())Y=S(o,Y.value,g),Y!==null&&(s=n(Y,s,D),B===null?_=Y:B.sibling=Y,B=Y);return q&&gt(o,D),_}for(E=u(E);!Y.done;D++,Y=m.next())Y=h(E,o,D,Y.value,g),Y!==null&&(l&&Y.alternate!==null&&E.delete(Y.key===null?D:Y.key),s=n(Y,s,D),B===null?_=Y:B.sibling=Y,B=Y);return l&&E.forEach(function(ui){return t(o,ui)}),q&&gt(o,D),_}function G(o,s,m,g){if(typeof m=="object"&&m!==null&&m.type===qa&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case Ue:l:{for(var _=m.key;s!==null;){if(s.key===_){if(_=m.type,_===qa){if(s.tag===7){a(o,s.sibling),g=e(s,m.props.children),g.return=o,o=g;break l}}else if(s.elementType===_||typeof _=="object"&&_!==null&&_.$$typeof===Ct&&oa(_)===s.type){a(o,s.sibling),g=e(s,m.props),Du(g,m),g.return=o,o=g;break l}a(o,s);break}else t(o,s);s=s.sibling}m.type===qa?(g=va(m.props.children,o.mode,g,m.key),g.return=o,o=g):(g=Ie(m.type,m.key,m.props,null,o.mode,g),Du(g,m),g.return=o,o=g)}return i(o);case Cu:l:{for(_=m.key;s!==null;){if(s.key===_)if(s.tag===4&&s.stateNode.containerInfo===m.containerInfo&&s.stateNode.implementation===m.implementation){a(o,s.sibling),g=e(s,m.children||[]),g.return=o,o=g;break l}else{a(o,s);break}else t(o,s);s=s.sibling}g=Ci(m,o.mode,g),g.return=o,o=g}return i(o);case Ct:return m=oa(m),G(o,s,m,g)}if(xu(m))return p(o,s,m,g);if(Mu(m)){if(_=Mu(m),typeof _!="function")throw Error(b(150));return m=_.call(m),M(o,s,m,g)}if(typeof m.then=="function")return G(o,s,Xe(m),g);if(m.$$typeof===bt)return G(o,s,Ge(o,m),g);Qe(o,m)}return typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint"?(m=""+m,s!==null&&s.tag===6?(a(o,s.sibling),g=e(s,m),g.return=o,o=g):(a(o,s),g=Ri(m,o.mode,g),g.return=o,o=g),i(o)):a(o,s)}return function(o,s,m,g){try{ue=0;var _=G(o,s,m,g);return Ia=null,_}catch(E){if(E===hu||E===Kn)throw E;var B=Cl(29,E,null,o.mode);return B.lanes=g,B.return=o,B}finally{}}}var ra=ko(!0),Fo=ko(!1),xt=!1;function gf(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Tc(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function Jt(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function wt(l,t,a){var u=l.updateQueue;if(u===null)return null;if(u=u.shared,(X&2)!==0){var e=u.pending;return e===null?t.next=t:(t.next=e.next,e.next=t),u.pending=t,t=gn(l),jo(l,null,a),t}return Vn(l,u,t,a),gn(l)}function ju(l,t,a){if(t=t.updateQueue,t!==null&&(t=t.shared,(a&4194048)!==0)){var u=t.lanes;u&=l.pendingLanes,a|=u,t.lanes=a,ho(l,a)}}function Bi(l,t){var a=l.updateQueue,u=l.alternate;if(u!==null&&(u=u.updateQueue,a===u)){var e=null,n=null;if(a=a.firstBaseUpdate,a!==null){do{var i={lane:a.lane,tag:a.tag,payload:a.payload,callback:null,next:null};n===null?e=n=i:n=n.next=i,a=a.next}while(a!==null);n===null?e=n=t:n=n.next=t}else e=n=t;a={baseState:u.baseState,firstBaseUpdate:e,lastBaseUpdate:n,shared:u.shared,callbacks:u.callbacks},l.updateQueue=a;return}l=a.lastBaseUpdate,l===null?a.firstBaseUpdate=t:l.next=t,a.lastBaseUpdate=t}var Ec=!1;function Lu(){if(Ec){var l=Fa;if(l!==null)throw l}}function Vu(l,t,a,u){Ec=!1;var e=l.updateQueue;xt=!1;var n=e.firstBaseUpdate,i=e.lastBaseUpdate,c=e.shared.pending;if(c!==null){e.shared.pending=null;var f=c,d=f.next;f.next=null,i===null?n=d:i.next=d,i=f;var y=l.alternate;y!==null&&(y=y.updateQueue,c=y.lastBaseUpdate,c!==i&&(c===null?y.firstBaseUpdate=d:c.next=d,y.lastBaseUpdate=f))}if(n!==null){var S=e.baseState;i=0,y=d=f=null,c=n;do{var v=c.lane&-536870913,h=v!==c.lane;if(h?(x&v)===v:(u&v)===v){v!==0&&v===eu&&(Ec=!0),y!==null&&(y=y.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});l:{var p=l,M=c;v=t;var G=a;switch(M.tag){case 1:if(p=M.payload,typeof p=="function"){S=p.call(G,S,v);break l}S=p;break l;case 3:p.flags=p.flags&-65537|128;case 0:if(p=M.payload,v=typeof p=="function"?p.call(G,S,v):p,v==null)break l;S=I({},S,v);break l;case 2:xt=!0}}v=c.callback,v!==null&&(l.flags|=64,h&&(l.flags|=8192),h=e.callbacks,h===null?e.callbacks=[v]:h.push(v))}else h={lane:v,tag:c.tag,payload:c.payload,callback:c.callback,next:null},y===null?(d=y=h,f=S):y=y.next=h,i|=v;if(c=c.next,c===null){if(c=e.shared.pending,c===null)break;h=c,c=h.next,h.next=null,e.lastBaseUpdate=h,e.shared.pending=null}}while(1);y===null&&(f=S),e.baseState=f,e.firstBaseUpdate=d,e.lastBaseUpdate=y,n===null&&(e.shared.lanes=0),aa|=i,l.lanes=i,l.memoizedState=S}}function Io(l,t){if(typeof l!="function")throw Error(b(191,l));l.call(t)}function Po(l,t){var a=l.callbacks;if(a!==null)for(l.callbacks=null,l=0;l<a.length;l++)Io(a[l],t)}var nu=ct(null),zn=ct(0);function cs(l,t){l=Dt,w(zn,l),w(nu,t),Dt=l|t.baseLanes}function Ac(){w(zn,Dt),w(nu,nu.current)}function Sf(){Dt=zn.current,yl(nu),yl(zn)}var Ql=ct(null),$l=null;function qt(l){var t=l.alternate;w(el,el.current&1),w(Ql,l),$l===null&&(t===null||nu.current!==null||t.memoizedState!==null)&&($l=l)}function _c(l){w(el,el.current),w(Ql,l),$l===null&&($l=l)}function ld(l){l.tag===22?(w(el,el.current),w(Ql,l),$l===null&&($l=l)):Yt(l)}function Yt(){w(el,el.current),w(Ql,Ql.current)}function Rl(l){yl(Ql),$l===l&&($l=null),yl(el)}var el=ct(0);function pn(l){for(var t=l;t!==null;){if(t.tag===13){var a=t.memoizedState;if(a!==null&&(a=a.dehydrated,a===null||Vc(a)||Kc(a)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var _t=0,U=null,K=null,il=null,Tn=!1,Pa=!1,za=!1,En=0,ee=0,lu=null,Vv=0;function al(){throw Error(b(321))}function bf(l,t){if(t===null)return!1;for(var a=0;a<t.length&&a<l.length;a++)if(!Xl(l[a],t[a]))return!1;return!0}function rf(l,t,a,u,e,n){return _t=n,U=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,O.H=l===null||l.memoizedState===null?Hd:Uf,za=!1,n=a(u,e),za=!1,Pa&&(n=ad(t,a,u,e)),td(l),n}function td(l){O.H=ne;var t=K!==null&&K.next!==null;if(_t=0,il=K=U=null,Tn=!1,ee=0,lu=null,t)throw Error(b(300));l===null||sl||(l=l.dependencies,l!==null&&bn(l)&&(sl=!0))}function ad(l,t,a,u){U=l;var e=0;do{if(Pa&&(lu=null),ee=0,Pa=!1,25<=e)throw Error(b(301));if(e+=1,il=K=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}O.H=Rd,n=t(a,u)}while(Pa);return n}function Kv(){var l=O.H,t=l.useState()[0];return t=typeof t.then=="function"?be(t):t,l=l.useState()[0],(K!==null?K.memoizedState:null)!==l&&(U.flags|=1024),t}function zf(){var l=En!==0;return En=0,l}function pf(l,t,a){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~a}function Tf(l){if(Tn){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}Tn=!1}_t=0,il=K=U=null,Pa=!1,ee=En=0,lu=null}function El(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return il===null?U.memoizedState=il=l:il=il.next=l,il}function nl(){if(K===null){var l=U.alternate;l=l!==null?l.memoizedState:null}else l=K.next;var t=il===null?U.memoizedState:il.next;if(t!==null)il=t,K=l;else{if(l===null)throw U.alternate===null?Error(b(467)):Error(b(310));K=l,l={memoizedState:K.memoizedState,baseState:K.baseState,baseQueue:K.baseQueue,queue:K.queue,next:null},il===null?U.memoizedState=il=l:il=il.next=l}return il}function Jn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function be(l){var t=ee;return ee+=1,lu===null&&(lu=[]),l=$o(lu,l,t),t=U,(il===null?t.memoizedState:il.next)===null&&(t=t.alternate,O.H=t===null||t.memoizedState===null?Hd:Uf),l}function wn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return be(l);if(l.$$typeof===bt)return bl(l)}throw Error(b(438,String(l)))}function Ef(l){var t=null,a=U.updateQueue;if(a!==null&&(t=a.memoCache),t==null){var u=U.alternate;u!==null&&(u=u.updateQueue,u!==null&&(u=u.memoCache,u!=null&&(t={data:u.data.map(function(e){return e.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),a===null&&(a=Jn(),U.updateQueue=a),a.memoCache=t,a=t.data[t.index],a===void 0)for(a=t.data[t.index]=Array(l),u=0;u<l;u++)a[u]=Um;return t.index++,a}function Mt(l,t){return typeof t=="function"?t(l):t}function ln(l){var t=nl();return Af(t,K,l)}function Af(l,t,a){var u=l.queue;if(u===null)throw Error(b(311));u.lastRenderedReducer=a;var e=l.baseQueue,n=u.pending;if(n!==null){if(e!==null){var i=e.next;e.next=n.next,n.next=i}t.baseQueue=e=n,u.pending=null}if(n=l.baseState,e===null)l.memoizedState=n;else{t=e.next;var c=i=null,f=null,d=t,y=!1;do{var S=d.lane&-536870913;if(S!==d.lane?(x&S)===S:(_t&S)===S){var v=d.revertLane;if(v===0)f!==null&&(f=f.next={lane:0,revertLane:0,gesture:null,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null}),S===eu&&(y=!0);else if((_t&v)===v){d=d.next,v===eu&&(y=!0);continue}else S={lane:0,revertLane:d.revertLane,gesture:null,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null},f===null?(c=f=S,i=n):f=f.next=S,U.lanes|=v,aa|=v;S=d.action,za&&a(n,S),n=d.hasEagerState?d.eagerState:a(n,S)}else v={lane:S,revertLane:d.revertLane,gesture:d.gesture,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null},f===null?(c=f=v,i=n):f=f.next=v,U.lanes|=S,aa|=S;d=d.next}while(d!==null&&d!==t);if(f===null?i=n:f.next=c,!Xl(n,l.memoizedState)&&(sl=!0,y&&(a=Fa,a!==null)))throw a;l.memoizedState=n,l.baseState=i,l.baseQueue=f,u.lastRenderedState=n}return e===null&&(u.lanes=0),[l.memoizedState,u.dispatch]}function qi(l){var t=nl(),a=t.queue;if(a===null)throw Error(b(311));a.lastRenderedReducer=l;var u=a.dispatch,e=a.pending,n=t.memoizedState;if(e!==null){a.pending=null;var i=e=e.next;do n=l(n,i.action),i=i.next;while(i!==e);Xl(n,t.memoizedState)||(sl=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),a.lastRenderedState=n}return[n,u]}function ud(l,t,a){var u=U,e=nl(),n=q;if(n){if(a===void 0)throw Error(b(407));a=a()}else a=t();var i=!Xl((K||e).memoizedState,a);if(i&&(e.memoizedState=a,sl=!0),e=e.queue,_f(id.bind(null,u,e,l),[l]),e.getSnapshot!==t||i||il!==null&&il.memoizedState.tag&1){if(u.flags|=2048,iu(9,{destroy:void 0},nd.bind(null,u,e,a,t),null),J===null)throw Error(b(349));n||(_t&127)!==0||ed(u,t,a)}return a}function ed(l,t,a){l.flags|=16384,l={getSnapshot:t,value:a},t=U.updateQueue,t===null?(t=Jn(),U.updateQueue=t,t.stores=[l]):(a=t.stores,a===null?t.stores=[l]:a.push(l))}function nd(l,t,a,u){t.value=a,t.getSnapshot=u,cd(t)&&fd(l)}function id(l,t,a){return a(function(){cd(t)&&fd(l)})}function cd(l){var t=l.getSnapshot;l=l.value;try{var a=t();return!Xl(l,a)}catch(u){return!0}}function fd(l){var t=_a(l,2);t!==null&&Dl(t,l,2)}function Mc(l){var t=El();if(typeof l=="function"){var a=l;if(l=a(),za){Xt(!0);try{a()}finally{Xt(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Mt,lastRenderedState:l},t}function sd(l,t,a,u){return l.baseState=a,Af(l,K,typeof u=="function"?u:Mt)}function Jv(l,t,a,u,e){if($n(l))throw Error(b(485));if(l=t.action,l!==null){var n={payload:e,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(i){n.listeners.push(i)}};O.T!==null?a(!0):n.isTransition=!1,u(n),a=t.pending,a===null?(n.next=t.pending=n,od(t,n)):(n.next=a.next,t.pending=a.next=n)}}function od(l,t){var a=t.action,u=t.payload,e=l.state;if(t.isTransition){var n=O.T,i={};O.T=i;try{var c=a(e,u),f=O.S;f!==null&&f(i,c),fs(l,t,c)}catch(d){Oc(l,t,d)}finally{n!==null&&i.types!==null&&(n.types=i.types),O.T=n}}else try{n=a(e,u),fs(l,t,n)}catch(d){Oc(l,t,d)}}function fs(l,t,a){a!==null&&typeof a=="object"&&typeof a.then=="function"?a.then(function(u){ss(l,t,u)},function(u){return Oc(l,t,u)}):ss(l,t,a)}function ss(l,t,a){t.status="fulfilled",t.value=a,dd(t),l.state=a,t=l.pending,t!==null&&(a=t.next,a===t?l.pending=null:(a=a.next,t.next=a,od(l,a)))}function Oc(l,t,a){var u=l.pending;if(l.pending=null,u!==null){u=u.next;do t.status="rejected",t.reason=a,dd(t),t=t.next;while(t!==u)}l.action=null}function dd(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function md(l,t){return t}function os(l,t){if(q){var a=J.formState;if(a!==null){l:{var u=U;if(q){if(F){t:{for(var e=F,n=Wl;e.nodeType!==8;){if(!n){e=null;break t}if(e=kl(e.nextSibling),e===null){e=null;break t}}n=e.data,e=n==="F!"||n==="F"?e:null}if(e){F=kl(e.nextSibling),u=e.data==="F!";break l}}la(u)}u=!1}u&&(t=a[0])}}return a=El(),a.memoizedState=a.baseState=t,u={pending:null,lanes:0,dispatch:null,lastRenderedReducer:md,lastRenderedState:t},a.queue=u,a=Dd.bind(null,U,u),u.dispatch=a,u=Mc(!1),n=Nf.bind(null,U,!1,u.queue),u=El(),e={state:t,dispatch:null,action:l,pending:null},u.queue=e,a=Jv.bind(null,U,e,n,a),e.dispatch=a,u.memoizedState=l,[t,a,!1]}function ds(l){var t=nl();return vd(t,K,l)}function vd(l,t,a){if(t=Af(l,t,md)[0],l=ln(Mt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var u=be(t)}catch(i){throw i===hu?Kn:i}else u=t;t=nl();var e=t.queue,n=e.dispatch;return a!==t.memoizedState&&(U.flags|=2048,iu(9,{destroy:void 0},wv.bind(null,e,a),null)),[u,n,l]}function wv(l,t){l.action=t}function ms(l){var t=nl(),a=K;if(a!==null)return vd(t,a,l);nl(),t=t.memoizedState,a=nl();var u=a.queue.dispatch;return a.memoizedState=l,[t,u,!1]}function iu(l,t,a,u){return l={tag:l,create:a,deps:u,inst:t,next:null},t=U.updateQueue,t===null&&(t=Jn(),U.updateQueue=t),a=t.lastEffect,a===null?t.lastEffect=l.next=l:(u=a.next,a.next=l,l.next=u,t.lastEffect=l),l}function yd(){return nl().memoizedState}function tn(l,t,a,u){var e=El();U.flags|=l,e.memoizedState=iu(1|t,{destroy:void 0},a,u===void 0?null:u)}function Wn(l,t,a,u){var e=nl();u=u===void 0?null:u;var n=e.memoizedState.inst;K!==null&&u!==null&&bf(u,K.memoizedState.deps)?e.memoizedState=iu(t,n,a,u):(U.flags|=l,e.memoizedState=iu(1|t,n,a,u))}function vs(l,t){tn(8390656,8,l,t)}function _f(l,t){Wn(2048,8,l,t)}function Wv(l){U.flags|=4;var t=U.updateQueue;if(t===null)t=Jn(),U.updateQueue=t,t.events=[l];else{var a=t.events;a===null?t.events=[l]:a.push(l)}}function hd(l){var t=nl().memoizedState;return Wv({ref:t,nextImpl:l}),function(){if((X&2)!==0)throw Error(b(440));return t.impl.apply(void 0,arguments)}}function gd(l,t){return Wn(4,2,l,t)}function Sd(l,t){return Wn(4,4,l,t)}function bd(l,t){if(typeof t=="function"){l=l();var a=t(l);return function(){typeof a=="function"?a():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function rd(l,t,a){a=a!=null?a.concat([l]):null,Wn(4,4,bd.bind(null,t,l),a)}function Mf(){}function zd(l,t){var a=nl();t=t===void 0?null:t;var u=a.memoizedState;return t!==null&&bf(t,u[1])?u[0]:(a.memoizedState=[l,t],l)}function pd(l,t){var a=nl();t=t===void 0?null:t;var u=a.memoizedState;if(t!==null&&bf(t,u[1]))return u[0];if(u=l(),za){Xt(!0);try{l()}finally{Xt(!1)}}return a.memoizedState=[u,t],u}function Of(l,t,a){return a===void 0||(_t&1073741824)!==0&&(x&261930)===0?l.memoizedState=t:(l.memoizedState=a,l=s1(),U.lanes|=l,aa|=l,a)}function Td(l,t,a,u){return Xl(a,t)?a:nu.current!==null?(l=Of(l,a,u),Xl(l,t)||(sl=!0),l):(_t&42)===0||(_t&1073741824)!==0&&(x&261930)===0?(sl=!0,l.memoizedState=a):(l=s1(),U.lanes|=l,aa|=l,t)}function Ed(l,t,a,u,e){var n=Q.p;Q.p=n!==0&&8>n?n:8;var i=O.T,c={};O.T=c,Nf(l,!1,t,a);try{var f=e(),d=O.S;if(d!==null&&d(c,f),f!==null&&typeof f=="object"&&typeof f.then=="function"){var y=Lv(f,u);Ku(l,t,y,Gl(l))}else Ku(l,t,u,Gl(l))}catch(S){Ku(l,t,{then:function(){},status:"rejected",reason:S},Gl())}finally{Q.p=n,i!==null&&c.types!==null&&(i.types=c.types),O.T=i}}function $v(){}function Dc(l,t,a,u){if(l.tag!==5)throw Error(b(476));var e=Ad(l).queue;Ed(l,e,t,ma,a===null?$v:function(){return _d(l),a(u)})}function Ad(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:ma,baseState:ma,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Mt,lastRenderedState:ma},next:null};var a={};return t.next={memoizedState:a,baseState:a,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Mt,lastRenderedState:a},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function _d(l){var t=Ad(l);t.next===null&&(t=l.alternate.memoizedState),Ku(l,t.next.queue,{},Gl())}function Df(){return bl(fe)}function Md(){return nl().memoizedState}function Od(){return nl().memoizedState}function kv(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var a=Gl();l=Jt(a);var u=wt(t,l,a);u!==null&&(Dl(u,t,a),ju(u,t,a)),t={cache:vf()},l.payload=t;return}t=t.return}}function Fv(l,t,a){var u=Gl();a={lane:u,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},$n(l)?Nd(t,a):(a=sf(l,t,a,u),a!==null&&(Dl(a,l,u),Ud(a,t,u)))}function Dd(l,t,a){var u=Gl();Ku(l,t,a,u)}function Ku(l,t,a,u){var e={lane:u,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null};if($n(l))Nd(t,e);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var i=t.lastRenderedState,c=n(i,a);if(e.hasEagerState=!0,e.eagerState=c,Xl(c,i))return Vn(l,t,e,0),J===null&&Ln(),!1}catch(f){}finally{}if(a=sf(l,t,e,u),a!==null)return Dl(a,l,u),Ud(a,t,u),!0}return!1}function Nf(l,t,a,u){if(u={lane:2,revertLane:Gf(),gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null},$n(l)){if(t)throw Error(b(479))}else t=sf(l,a,u,2),t!==null&&Dl(t,l,2)}function $n(l){var t=l.alternate;return l===U||t!==null&&t===U}function Nd(l,t){Pa=Tn=!0;var a=l.pending;a===null?t.next=t:(t.next=a.next,a.next=t),l.pending=t}function Ud(l,t,a){if((a&4194048)!==0){var u=t.lanes;u&=l.pendingLanes,a|=u,t.lanes=a,ho(l,a)}}var ne={readContext:bl,use:wn,useCallback:al,useContext:al,useEffect:al,useImperativeHandle:al,useLayoutEffect:al,useInsertionEffect:al,useMemo:al,useReducer:al,useRef:al,useState:al,useDebugValue:al,useDeferredValue:al,useTransition:al,useSyncExternalStore:al,useId:al,useHostTransitionStatus:al,useFormState:al,useActionState:al,useOptimistic:al,useMemoCache:al,useCacheRefresh:al};ne.useEffectEvent=al;var Hd={readContext:bl,use:wn,useCallback:function(l,t){return El().memoizedState=[l,t===void 0?null:t],l},useContext:bl,useEffect:vs,useImperativeHandle:function(l,t,a){a=a!=null?a.concat([l]):null,tn(4194308,4,bd.bind(null,t,l),a)},useLayoutEffect:function(l,t){return tn(4194308,4,l,t)},useInsertionEffect:function(l,t){tn(4,2,l,t)},useMemo:function(l,t){var a=El();t=t===void 0?null:t;var u=l();if(za){Xt(!0);try{l()}finally{Xt(!1)}}return a.memoizedState=[u,t],u},useReducer:function(l,t,a){var u=El();if(a!==void 0){var e=a(t);if(za){Xt(!0);try{a(t)}finally{Xt(!1)}}}else e=t;return u.memoizedState=u.baseState=e,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:e},u.queue=l,l=l.dispatch=Fv.bind(null,U,l),[u.memoizedState,l]},useRef:function(l){var t=El();return l={current:l},t.memoizedState=l},useState:function(l){l=Mc(l);var t=l.queue,a=Dd.bind(null,U,t);return t.dispatch=a,[l.memoizedState,a]},useDebugValue:Mf,useDeferredValue:function(l,t){var a=El();return Of(a,l,t)},useTransition:function(){var l=Mc(!1);return l=Ed.bind(null,U,l.queue,!0,!1),El().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,a){var u=U,e=El();if(q){if(a===void 0)throw Error(b(407));a=a()}else{if(a=t(),J===null)throw Error(b(349));(x&127)!==0||ed(u,t,a)}e.memoizedState=a;var n={value:a,getSnapshot:t};return e.queue=n,vs(id.bind(null,u,n,l),[l]),u.flags|=2048,iu(9,{destroy:void 0},nd.bind(null,u,n,a,t),null),a},useId:function(){var l=El(),t=J.identifierPrefix;if(q){var a=et,u=ut;a=(u&~(1<<32-Yl(u)-1)).toString(32)+a,t="_"+t+"R_"+a,a=En++,0<a&&(t+="H"+a.toString(32)),t+="_"}else a=Vv++,t="_"+t+"r_"+a.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:Df,useFormState:os,useActionState:os,useOptimistic:function(l){var t=El();t.memoizedState=t.baseState=l;var a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=a,t=Nf.bind(null,U,!0,a),a.dispatch=t,[l,t]},useMemoCache:Ef,useCacheRefresh:function(){return El().memoizedState=kv.bind(null,U)},useEffectEvent:function(l){var t=El(),a={impl:l};return t.memoizedState=a,function(){if((X&2)!==0)throw Error(b(440));return a.impl.apply(void 0,arguments)}}},Uf={readContext:bl,use:wn,useCallback:zd,useContext:bl,useEffect:_f,useImperativeHandle:rd,useInsertionEffect:gd,useLayoutEffect:Sd,useMemo:pd,useReducer:ln,useRef:yd,useState:function(){return ln(Mt)},useDebugValue:Mf,useDeferredValue:function(l,t){var a=nl();return Td(a,K.memoizedState,l,t)},useTransition:function(){var l=ln(Mt)[0],t=nl().memoizedState;return[typeof l=="boolean"?l:be(l),t]},useSyncExternalStore:ud,useId:Md,useHostTransitionStatus:Df,useFormState:ds,useActionState:ds,useOptimistic:function(l,t){var a=nl();return sd(a,K,l,t)},useMemoCache:Ef,useCacheRefresh:Od};Uf.useEffectEvent=hd;var Rd={readContext:bl,use:wn,useCallback:zd,useContext:bl,useEffect:_f,useImperativeHandle:rd,useInsertionEffect:gd,useLayoutEffect:Sd,useMemo:pd,useReducer:qi,useRef:yd,useState:function(){return qi(Mt)},useDebugValue:Mf,useDeferredValue:function(l,t){var a=nl();return K===null?Of(a,l,t):Td(a,K.memoizedState,l,t)},useTransition:function(){var l=qi(Mt)[0],t=nl().memoizedState;return[typeof l=="boolean"?l:be(l),t]},useSyncExternalStore:ud,useId:Md,useHostTransitionStatus:Df,useFormState:ms,useActionState:ms,useOptimistic:function(l,t){var a=nl();return K!==null?sd(a,K,l,t):(a.baseState=l,[l,a.queue.dispatch])},useMemoCache:Ef,useCacheRefresh:Od};Rd.useEffectEvent=hd;function Yi(l,t,a,u){t=l.memoizedState,a=a(u,t),a=a==null?t:I({},t,a),l.memoizedState=a,l.lanes===0&&(l.updateQueue.baseState=a)}var Nc={enqueueSetState:function(l,t,a){l=l._reactInternals;var u=Gl(),e=Jt(u);e.payload=t,a!=null&&(e.callback=a),t=wt(l,e,u),t!==null&&(Dl(t,l,u),ju(t,l,u))},enqueueReplaceState:function(l,t,a){l=l._reactInternals;var u=Gl(),e=Jt(u);e.tag=1,e.payload=t,a!=null&&(e.callback=a),t=wt(l,e,u),t!==null&&(Dl(t,l,u),ju(t,l,u))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var a=Gl(),u=Jt(a);u.tag=2,t!=null&&(u.callback=t),t=wt(l,u,a),t!==null&&(Dl(t,l,a),ju(t,l,a))}};function ys(l,t,a,u,e,n,i){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(u,n,i):t.prototype&&t.prototype.isPureReactComponent?!le(a,u)||!le(e,n):!0}function hs(l,t,a,u){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(a,u),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(a,u),t.state!==l&&Nc.enqueueReplaceState(t,t.state,null)}function pa(l,t){var a=t;if("ref"in t){a={};for(var u in t)u!=="ref"&&(a[u]=t[u])}if(l=l.defaultProps){a===t&&(a=I({},a));for(var e in l)a[e]===void 0&&(a[e]=l[e])}return a}function Cd(l){hn(l)}function xd(l){console.error(l)}function Bd(l){hn(l)}function An(l,t){try{var a=l.onUncaughtError;a(t.value,{componentStack:t.stack})}catch(u){setTimeout(function(){throw u})}}function gs(l,t,a){try{var u=l.onCaughtError;u(a.value,{componentStack:a.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(e){setTimeout(function(){throw e})}}function Uc(l,t,a){return a=Jt(a),a.tag=3,a.payload={element:null},a.callback=function(){An(l,t)},a}function qd(l){return l=Jt(l),l.tag=3,l}function Yd(l,t,a,u){var e=a.type.getDerivedStateFromError;if(typeof e=="function"){var n=u.value;l.payload=function(){return e(n)},l.callback=function(){gs(t,a,u)}}var i=a.stateNode;i!==null&&typeof i.componentDidCatch=="function"&&(l.callback=function(){gs(t,a,u),typeof e!="function"&&(Wt===null?Wt=new Set([this]):Wt.add(this));var c=u.stack;this.componentDidCatch(u.value,{componentStack:c!==null?c:""})})}function Iv(l,t,a,u,e){if(a.flags|=32768,u!==null&&typeof u=="object"&&typeof u.then=="function"){if(t=a.alternate,t!==null&&yu(t,a,e,!0),a=Ql.current,a!==null){switch(a.tag){case 31:case 13:return $l===null?Nn():a.alternate===null&&ul===0&&(ul=3),a.flags&=-257,a.flags|=65536,a.lanes=e,u===rn?a.flags|=16384:(t=a.updateQueue,t===null?a.updateQueue=new Set([u]):t.add(u),Wi(l,u,e)),!1;case 22:return a.flags|=65536,u===rn?a.flags|=16384:(t=a.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([u])},a.updateQueue=t):(a=t.retryQueue,a===null?t.retryQueue=new Set([u]):a.add(u)),Wi(l,u,e)),!1}throw Error(b(435,a.tag))}return Wi(l,u,e),Nn(),!1}if(q)return t=Ql.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=e,u!==Sc&&(l=Error(b(422),{cause:u}),ae(wl(l,a)))):(u!==Sc&&(t=Error(b(423),{cause:u}),ae(wl(t,a))),l=l.current.alternate,l.flags|=65536,e&=-e,l.lanes|=e,u=wl(u,a),e=Uc(l.stateNode,u,e),Bi(l,e),ul!==4&&(ul=2)),!1;var n=Error(b(520),{cause:u});if(n=wl(n,a),Wu===null?Wu=[n]:Wu.push(n),ul!==4&&(ul=2),t===null)return!0;u=wl(u,a),a=t;do{switch(a.tag){case 3:return a.flags|=65536,l=e&-e,a.lanes|=l,l=Uc(a.stateNode,u,l),Bi(a,l),!1;case 1:if(t=a.type,n=a.stateNode,(a.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(Wt===null||!Wt.has(n))))return a.flags|=65536,e&=-e,a.lanes|=e,e=qd(e),Yd(e,l,a,u),Bi(a,e),!1}a=a.return}while(a!==null);return!1}var Hf=Error(b(461)),sl=!1;function hl(l,t,a,u){t.child=l===null?Fo(t,null,a,u):ra(t,l.child,a,u)}function Ss(l,t,a,u,e){a=a.render;var n=t.ref;if("ref"in u){var i={};for(var c in u)c!=="ref"&&(i[c]=u[c])}else i=u;return ba(t),u=rf(l,t,a,i,n,e),c=zf(),l!==null&&!sl?(pf(l,t,e),Ot(l,t,e)):(q&&c&&df(t),t.flags|=1,hl(l,t,u,e),t.child)}function bs(l,t,a,u,e){if(l===null){var n=a.type;return typeof n=="function"&&!of(n)&&n.defaultProps===void 0&&a.compare===null?(t.tag=15,t.type=n,Gd(l,t,n,u,e)):(l=Ie(a.type,null,u,t,t.mode,e),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!Rf(l,e)){var i=n.memoizedProps;if(a=a.compare,a=a!==null?a:le,a(i,u)&&l.ref===t.ref)return Ot(l,t,e)}return t.flags|=1,l=pt(n,u),l.ref=t.ref,l.return=t,t.child=l}function Gd(l,t,a,u,e){if(l!==null){var n=l.memoizedProps;if(le(n,u)&&l.ref===t.ref)if(sl=!1,t.pendingProps=u=n,Rf(l,e))(l.flags&131072)!==0&&(sl=!0);else return t.lanes=l.lanes,Ot(l,t,e)}return Hc(l,t,a,u,e)}function Xd(l,t,a,u){var e=u.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),u.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|a:a,l!==null){for(u=t.child=l.child,e=0;u!==null;)e=e|u.lanes|u.childLanes,u=u.sibling;u=e&~n}else u=0,t.child=null;return rs(l,t,n,a,u)}if((a&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&Pe(t,n!==null?n.cachePool:null),n!==null?cs(t,n):Ac(),ld(t);else return u=t.lanes=536870912,rs(l,t,n!==null?n.baseLanes|a:a,a,u)}else n!==null?(Pe(t,n.cachePool),cs(t,n),Yt(t),t.memoizedState=null):(l!==null&&Pe(t,null),Ac(),Yt(t));return hl(l,t,e,a),t.child}function qu(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function rs(l,t,a,u,e){var n=yf();return n=n===null?null:{parent:fl._currentValue,pool:n},t.memoizedState={baseLanes:a,cachePool:n},l!==null&&Pe(t,null),Ac(),ld(t),l!==null&&yu(l,t,u,!0),t.childLanes=e,null}function an(l,t){return t=_n({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function zs(l,t,a){return ra(t,l.child,null,a),l=an(t,t.pendingProps),l.flags|=2,Rl(t),t.memoizedState=null,l}function Pv(l,t,a){var u=t.pendingProps,e=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(q){if(u.mode==="hidden")return l=an(t,u),t.lanes=536870912,qu(null,l);if(_c(t),(l=F)?(l=H1(l,Wl),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:Pt!==null?{id:ut,overflow:et}:null,retryLane:536870912,hydrationErrors:null},a=Vo(l),a.return=t,t.child=a,Sl=t,F=null)):l=null,l===null)throw la(t);return t.lanes=536870912,null}return an(t,u)}var n=l.memoizedState;if(n!==null){var i=n.dehydrated;if(_c(t),e)if(t.flags&256)t.flags&=-257,t=zs(l,t,a);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(b(558));else if(sl||yu(l,t,a,!1),e=(a&l.childLanes)!==0,sl||e){if(u=J,u!==null&&(i=go(u,a),i!==0&&i!==n.retryLane))throw n.retryLane=i,_a(l,i),Dl(u,l,i),Hf;Nn(),t=zs(l,t,a)}else l=n.treeContext,F=kl(i.nextSibling),Sl=t,q=!0,Kt=null,Wl=!1,l!==null&&Jo(t,l),t=an(t,u),t.flags|=4096;return t}return l=pt(l.child,{mode:u.mode,children:u.children}),l.ref=t.ref,t.child=l,l.return=t,l}function un(l,t){var a=t.ref;if(a===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof a!="function"&&typeof a!="object")throw Error(b(284));(l===null||l.ref!==a)&&(t.flags|=4194816)}}function Hc(l,t,a,u,e){return ba(t),a=rf(l,t,a,u,void 0,e),u=zf(),l!==null&&!sl?(pf(l,t,e),Ot(l,t,e)):(q&&u&&df(t),t.flags|=1,hl(l,t,a,e),t.child)}function ps(l,t,a,u,e,n){return ba(t),t.updateQueue=null,a=ad(t,u,a,e),td(l),u=zf(),l!==null&&!sl?(pf(l,t,n),Ot(l,t,n)):(q&&u&&df(t),t.flags|=1,hl(l,t,a,n),t.child)}function Ts(l,t,a,u,e){if(ba(t),t.stateNode===null){var n=Va,i=a.contextType;typeof i=="object"&&i!==null&&(n=bl(i)),n=new a(u,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=Nc,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=u,n.state=t.memoizedState,n.refs={},gf(t),i=a.contextType,n.context=typeof i=="object"&&i!==null?bl(i):Va,n.state=t.memoizedState,i=a.getDerivedStateFromProps,typeof i=="function"&&(Yi(t,a,i,u),n.state=t.memoizedState),typeof a.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(i=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),i!==n.state&&Nc.enqueueReplaceState(n,n.state,null),Vu(t,u,n,e),Lu(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),u=!0}else if(l===null){n=t.stateNode;var c=t.memoizedProps,f=pa(a,c);n.props=f;var d=n.context,y=a.contextType;i=Va,typeof y=="object"&&y!==null&&(i=bl(y));var S=a.getDerivedStateFromProps;y=typeof S=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=t.pendingProps!==c,y||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||d!==i)&&hs(t,n,u,i),xt=!1;var v=t.memoizedState;n.state=v,Vu(t,u,n,e),Lu(),d=t.memoizedState,c||v!==d||xt?(typeof S=="function"&&(Yi(t,a,S,u),d=t.memoizedState),(f=xt||ys(t,a,f,u,v,d,i))?(y||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=u,t.memoizedState=d),n.props=u,n.state=d,n.context=i,u=f):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),u=!1)}else{n=t.stateNode,Tc(l,t),i=t.memoizedProps,y=pa(a,i),n.props=y,S=t.pendingProps,v=n.context,d=a.contextType,f=Va,typeof d=="object"&&d!==null&&(f=bl(d)),c=a.getDerivedStateFromProps,(d=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i!==S||v!==f)&&hs(t,n,u,f),xt=!1,v=t.memoizedState,n.state=v,Vu(t,u,n,e),Lu();var h=t.memoizedState;i!==S||v!==h||xt||l!==null&&l.dependencies!==null&&bn(l.dependencies)?(typeof c=="function"&&(Yi(t,a,c,u),h=t.memoizedState),(y=xt||ys(t,a,y,u,v,h,f)||l!==null&&l.dependencies!==null&&bn(l.dependencies))?(d||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(u,h,f),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(u,h,f)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||i===l.memoizedProps&&v===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===l.memoizedProps&&v===l.memoizedState||(t.flags|=1024),t.memoizedProps=u,t.memoizedState=h),n.props=u,n.state=h,n.context=f,u=y):(typeof n.componentDidUpdate!="function"||i===l.memoizedProps&&v===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===l.memoizedProps&&v===l.memoizedState||(t.flags|=1024),u=!1)}return n=u,un(l,t),u=(t.flags&128)!==0,n||u?(n=t.stateNode,a=u&&typeof a.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&u?(t.child=ra(t,l.child,null,e),t.child=ra(t,null,a,e)):hl(l,t,a,e),t.memoizedState=n.state,l=t.child):l=Ot(l,t,e),l}function Es(l,t,a,u){return Sa(),t.flags|=256,hl(l,t,a,u),t.child}var Gi={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Xi(l){return{baseLanes:l,cachePool:Wo()}}function Qi(l,t,a){return l=l!==null?l.childLanes&~a:0,t&&(l|=xl),l}function Qd(l,t,a){var u=t.pendingProps,e=!1,n=(t.flags&128)!==0,i;if((i=n)||(i=l!==null&&l.memoizedState===null?!1:(el.current&2)!==0),i&&(e=!0,t.flags&=-129),i=(t.flags&32)!==0,t.flags&=-33,l===null){if(q){if(e?qt(t):Yt(t),(l=F)?(l=H1(l,Wl),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:Pt!==null?{id:ut,overflow:et}:null,retryLane:536870912,hydrationErrors:null},a=Vo(l),a.return=t,t.child=a,Sl=t,F=null)):l=null,l===null)throw la(t);return Kc(l)?t.lanes=32:t.lanes=536870912,null}var c=u.children;return u=u.fallback,e?(Yt(t),e=t.mode,c=_n({mode:"hidden",children:c},e),u=va(u,e,a,null),c.return=t,u.return=t,c.sibling=u,t.child=c,u=t.child,u.memoizedState=Xi(a),u.childLanes=Qi(l,i,a),t.memoizedState=Gi,qu(null,u)):(qt(t),Rc(t,c))}var f=l.memoizedState;if(f!==null&&(c=f.dehydrated,c!==null)){if(n)t.flags&256?(qt(t),t.flags&=-257,t=Zi(l,t,a)):t.memoizedState!==null?(Yt(t),t.child=l.child,t.flags|=128,t=null):(Yt(t),c=u.fallback,e=t.mode,u=_n({mode:"visible",children:u.children},e),c=va(c,e,a,null),c.flags|=2,u.return=t,c.return=t,u.sibling=c,t.child=u,ra(t,l.child,null,a),u=t.child,u.memoizedState=Xi(a),u.childLanes=Qi(l,i,a),t.memoizedState=Gi,t=qu(null,u));else if(qt(t),Kc(c)){if(i=c.nextSibling&&c.nextSibling.dataset,i)var d=i.dgst;i=d,u=Error(b(419)),u.stack="",u.digest=i,ae({value:u,source:null,stack:null}),t=Zi(l,t,a)}else if(sl||yu(l,t,a,!1),i=(a&l.childLanes)!==0,sl||i){if(i=J,i!==null&&(u=go(i,a),u!==0&&u!==f.retryLane))throw f.retryLane=u,_a(l,u),Dl(i,l,u),Hf;Vc(c)||Nn(),t=Zi(l,t,a)}else Vc(c)?(t.flags|=192,t.child=l.child,t=null):(l=f.treeContext,F=kl(c.nextSibling),Sl=t,q=!0,Kt=null,Wl=!1,l!==null&&Jo(t,l),t=Rc(t,u.children),t.flags|=4096);return t}return e?(Yt(t),c=u.fallback,e=t.mode,f=l.child,d=f.sibling,u=pt(f,{mode:"hidden",children:u.children}),u.subtreeFlags=f.subtreeFlags&65011712,d!==null?c=pt(d,c):(c=va(c,e,a,null),c.flags|=2),c.return=t,u.return=t,u.sibling=c,t.child=u,qu(null,u),u=t.child,c=l.child.memoizedState,c===null?c=Xi(a):(e=c.cachePool,e!==null?(f=fl._currentValue,e=e.parent!==f?{parent:f,pool:f}:e):e=Wo(),c={baseLanes:c.baseLanes|a,cachePool:e}),u.memoizedState=c,u.childLanes=Qi(l,i,a),t.memoizedState=Gi,qu(l.child,u)):(qt(t),a=l.child,l=a.sibling,a=pt(a,{mode:"visible",children:u.children}),a.return=t,a.sibling=null,l!==null&&(i=t.deletions,i===null?(t.deletions=[l],t.flags|=16):i.push(l)),t.child=a,t.memoizedState=null,a)}function Rc(l,t){return t=_n({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function _n(l,t){return l=Cl(22,l,null,t),l.lanes=0,l}function Zi(l,t,a){return ra(t,l.child,null,a),l=Rc(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function As(l,t,a){l.lanes|=t;var u=l.alternate;u!==null&&(u.lanes|=t),rc(l.return,t,a)}function ji(l,t,a,u,e,n){var i=l.memoizedState;i===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:u,tail:a,tailMode:e,treeForkCount:n}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=u,i.tail=a,i.tailMode=e,i.treeForkCount=n)}function Zd(l,t,a){var u=t.pendingProps,e=u.revealOrder,n=u.tail;u=u.children;var i=el.current,c=(i&2)!==0;if(c?(i=i&1|2,t.flags|=128):i&=1,w(el,i),hl(l,t,u,a),u=q?te:0,!c&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&As(l,a,t);else if(l.tag===19)As(l,a,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(e){case"forwards":for(a=t.child,e=null;a!==null;)l=a.alternate,l!==null&&pn(l)===null&&(e=a),a=a.sibling;a=e,a===null?(e=t.child,t.child=null):(e=a.sibling,a.sibling=null),ji(t,!1,e,a,n,u);break;case"backwards":case"unstable_legacy-backwards":for(a=null,e=t.child,t.child=null;e!==null;){if(l=e.alternate,l!==null&&pn(l)===null){t.child=e;break}l=e.sibling,e.sibling=a,a=e,e=l}ji(t,!0,a,null,n,u);break;case"together":ji(t,!1,null,null,void 0,u);break;default:t.memoizedState=null}return t.child}function Ot(l,t,a){if(l!==null&&(t.dependencies=l.dependencies),aa|=t.lanes,(a&t.childLanes)===0)if(l!==null){if(yu(l,t,a,!1),(a&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(b(153));if(t.child!==null){for(l=t.child,a=pt(l,l.pendingProps),t.child=a,a.return=t;l.sibling!==null;)l=l.sibling,a=a.sibling=pt(l,l.pendingProps),a.return=t;a.sibling=null}return t.child}function Rf(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&bn(l)))}function ly(l,t,a){switch(t.tag){case 3:dn(t,t.stateNode.containerInfo),Bt(t,fl,l.memoizedState.cache),Sa();break;case 27:case 5:ic(t);break;case 4:dn(t,t.stateNode.containerInfo);break;case 10:Bt(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,_c(t),null;break;case 13:var u=t.memoizedState;if(u!==null)return u.dehydrated!==null?(qt(t),t.flags|=128,null):(a&t.child.childLanes)!==0?Qd(l,t,a):(qt(t),l=Ot(l,t,a),l!==null?l.sibling:null);qt(t);break;case 19:var e=(l.flags&128)!==0;if(u=(a&t.childLanes)!==0,u||(yu(l,t,a,!1),u=(a&t.childLanes)!==0),e){if(u)return Zd(l,t,a);t.flags|=128}if(e=t.memoizedState,e!==null&&(e.rendering=null,e.tail=null,e.lastEffect=null),w(el,el.current),u)break;return null;case 22:return t.lanes=0,Xd(l,t,a,t.pendingProps);case 24:Bt(t,fl,l.memoizedState.cache)}return Ot(l,t,a)}function jd(l,t,a){if(l!==null)if(l.memoizedProps!==t.pendingProps)sl=!0;else{if(!Rf(l,a)&&(t.flags&128)===0)return sl=!1,ly(l,t,a);sl=(l.flags&131072)!==0}else sl=!1,q&&(t.flags&1048576)!==0&&Ko(t,te,t.index);switch(t.lanes=0,t.tag){case 16:l:{var u=t.pendingProps;if(l=oa(t.elementType),t.type=l,typeof l=="function")of(l)?(u=pa(l,u),t.tag=1,t=Ts(null,t,l,u,a)):(t.tag=0,t=Hc(null,t,l,u,a));else{if(l!=null){var e=l.$$typeof;if(e===$c){t.tag=11,t=Ss(null,t,l,u,a);break l}else if(e===kc){t.tag=14,t=bs(null,t,l,u,a);break l}}throw t=ec(l)||l,Error(b(306,t,""))}}return t;case 0:return Hc(l,t,t.type,t.pendingProps,a);case 1:return u=t.type,e=pa(u,t.pendingProps),Ts(l,t,u,e,a);case 3:l:{if(dn(t,t.stateNode.containerInfo),l===null)throw Error(b(387));u=t.pendingProps;var n=t.memoizedState;e=n.element,Tc(l,t),Vu(t,u,null,a);var i=t.memoizedState;if(u=i.cache,Bt(t,fl,u),u!==n.cache&&zc(t,[fl],a,!0),Lu(),u=i.element,n.isDehydrated)if(n={element:u,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=Es(l,t,u,a);break l}else if(u!==e){e=wl(Error(b(424)),t),ae(e),t=Es(l,t,u,a);break l}else{switch(l=t.stateNode.containerInfo,l.nodeType){case 9:l=l.body;break;default:l=l.nodeName==="HTML"?l.ownerDocument.body:l}for(F=kl(l.firstChild),Sl=t,q=!0,Kt=null,Wl=!0,a=Fo(t,null,u,a),t.child=a;a;)a.flags=a.flags&-3|4096,a=a.sibling}else{if(Sa(),u===e){t=Ot(l,t,a);break l}hl(l,t,u,a)}t=t.child}return t;case 26:return un(l,t),l===null?(a=Js(t.type,null,t.pendingProps,null))?t.memoizedState=a:q||(a=t.type,l=t.pendingProps,u=Cn(Vt.current).createElement(a),u[gl]=t,u[Nl]=l,rl(u,a,l),vl(u),t.stateNode=u):t.memoizedState=Js(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return ic(t),l===null&&q&&(u=t.stateNode=R1(t.type,t.pendingProps,Vt.current),Sl=t,Wl=!0,e=F,ea(t.type)?(Jc=e,F=kl(u.firstChild)):F=e),hl(l,t,t.pendingProps.children,a),un(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&q&&((e=u=F)&&(u=Dy(u,t.type,t.pendingProps,Wl),u!==null?(t.stateNode=u,Sl=t,F=kl(u.firstChild),Wl=!1,e=!0):e=!1),e||la(t)),ic(t),e=t.type,n=t.pendingProps,i=l!==null?l.memoizedProps:null,u=n.children,jc(e,n)?u=null:i!==null&&jc(e,i)&&(t.flags|=32),t.memoizedState!==null&&(e=rf(l,t,Kv,null,null,a),fe._currentValue=e),un(l,t),hl(l,t,u,a),t.child;case 6:return l===null&&q&&((l=a=F)&&(a=Ny(a,t.pendingProps,Wl),a!==null?(t.stateNode=a,Sl=t,F=null,l=!0):l=!1),l||la(t)),null;case 13:return Qd(l,t,a);case 4:return dn(t,t.stateNode.containerInfo),u=t.pendingProps,l===null?t.child=ra(t,null,u,a):hl(l,t,u,a),t.child;case 11:return Ss(l,t,t.type,t.pendingProps,a);case 7:return hl(l,t,t.pendingProps,a),t.child;case 8:return hl(l,t,t.pendingProps.children,a),t.child;case 12:return hl(l,t,t.pendingProps.children,a),t.child;case 10:return u=t.pendingProps,Bt(t,t.type,u.value),hl(l,t,u.children,a),t.child;case 9:return e=t.type._context,u=t.pendingProps.children,ba(t),e=bl(e),u=u(e),t.flags|=1,hl(l,t,u,a),t.child;case 14:return bs(l,t,t.type,t.pendingProps,a);case 15:return Gd(l,t,t.type,t.pendingProps,a);case 19:return Zd(l,t,a);case 31:return Pv(l,t,a);case 22:return Xd(l,t,a,t.pendingProps);case 24:return ba(t),u=bl(fl),l===null?(e=yf(),e===null&&(e=J,n=vf(),e.pooledCache=n,n.refCount++,n!==null&&(e.pooledCacheLanes|=a),e=n),t.memoizedState={parent:u,cache:e},gf(t),Bt(t,fl,e)):((l.lanes&a)!==0&&(Tc(l,t),Vu(t,null,null,a),Lu()),e=l.memoizedState,n=t.memoizedState,e.parent!==u?(e={parent:u,cache:u},t.memoizedState=e,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=e),Bt(t,fl,u)):(u=n.cache,Bt(t,fl,u),u!==e.cache&&zc(t,[fl],a,!0))),hl(l,t,t.pendingProps.children,a),t.child;case 29:throw t.pendingProps}throw Error(b(156,t.tag))}function mt(l){l.flags|=4}function Li(l,t,a,u,e){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(e&335544128)===e)if(l.stateNode.complete)l.flags|=8192;else if(m1())l.flags|=8192;else throw ha=rn,hf}else l.flags&=-16777217}function _s(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!B1(t))if(m1())l.flags|=8192;else throw ha=rn,hf}function Ze(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?vo():536870912,l.lanes|=t,cu|=t)}function Nu(l,t){if(!q)switch(l.tailMode){case"hidden":t=l.tail;for(var a=null;t!==null;)t.alternate!==null&&(a=t),t=t.sibling;a===null?l.tail=null:a.sibling=null;break;case"collapsed":a=l.tail;for(var u=null;a!==null;)a.alternate!==null&&(u=a),a=a.sibling;u===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:u.sibling=null}}function k(l){var t=l.alternate!==null&&l.alternate.child===l.child,a=0,u=0;if(t)for(var e=l.child;e!==null;)a|=e.lanes|e.childLanes,u|=e.subtreeFlags&65011712,u|=e.flags&65011712,e.return=l,e=e.sibling;else for(e=l.child;e!==null;)a|=e.lanes|e.childLanes,u|=e.subtreeFlags,u|=e.flags,e.return=l,e=e.sibling;return l.subtreeFlags|=u,l.childLanes=a,t}function ty(l,t,a){var u=t.pendingProps;switch(mf(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return k(t),null;case 1:return k(t),null;case 3:return a=t.stateNode,u=null,l!==null&&(u=l.memoizedState.cache),t.memoizedState.cache!==u&&(t.flags|=2048),Tt(fl),tu(),a.pendingContext&&(a.context=a.pendingContext,a.pendingContext=null),(l===null||l.child===null)&&(Ra(t)?mt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,xi())),k(t),null;case 26:var e=t.type,n=t.memoizedState;return l===null?(mt(t),n!==null?(k(t),_s(t,n)):(k(t),Li(t,e,null,u,a))):n?n!==l.memoizedState?(mt(t),k(t),_s(t,n)):(k(t),t.flags&=-16777217):(l=l.memoizedProps,l!==u&&mt(t),k(t),Li(t,e,l,u,a)),null;case 27:if(mn(t),a=Vt.current,e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==u&&mt(t);else{if(!u){if(t.stateNode===null)throw Error(b(166));return k(t),null}l=it.current,Ra(t)?ls(t,l):(l=R1(e,u,a),t.stateNode=l,mt(t))}return k(t),null;case 5:if(mn(t),e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==u&&mt(t);else{if(!u){if(t.stateNode===null)throw Error(b(166));return k(t),null}if(n=it.current,Ra(t))ls(t,n);else{var i=Cn(Vt.current);switch(n){case 1:n=i.createElementNS("http://www.w3.org/2000/svg",e);break;case 2:n=i.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;default:switch(e){case"svg":n=i.createElementNS("http://www.w3.org/2000/svg",e);break;case"math":n=i.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;case"script":n=i.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof u.is=="string"?i.createElement("select",{is:u.is}):i.createElement("select"),u.multiple?n.multiple=!0:u.size&&(n.size=u.size);break;default:n=typeof u.is=="string"?i.createElement(e,{is:u.is}):i.createElement(e)}}n[gl]=t,n[Nl]=u;l:for(i=t.child;i!==null;){if(i.tag===5||i.tag===6)n.appendChild(i.stateNode);else if(i.tag!==4&&i.tag!==27&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===t)break l;for(;i.sibling===null;){if(i.return===null||i.return===t)break l;i=i.return}i.sibling.return=i.return,i=i.sibling}t.stateNode=n;l:switch(rl(n,e,u),e){case"button":case"input":case"select":case"textarea":u=!!u.autoFocus;break l;case"img":u=!0;break l;default:u=!1}u&&mt(t)}}return k(t),Li(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,a),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==u&&mt(t);else{if(typeof u!="string"&&t.stateNode===null)throw Error(b(166));if(l=Vt.current,Ra(t)){if(l=t.stateNode,a=t.memoizedProps,u=null,e=Sl,e!==null)switch(e.tag){case 27:case 5:u=e.memoizedProps}l[gl]=t,l=!!(l.nodeValue===a||u!==null&&u.suppressHydrationWarning===!0||D1(l.nodeValue,a)),l||la(t,!0)}else l=Cn(l).createTextNode(u),l[gl]=t,t.stateNode=l}return k(t),null;case 31:if(a=t.memoizedState,l===null||l.memoizedState!==null){if(u=Ra(t),a!==null){if(l===null){if(!u)throw Error(b(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(b(557));l[gl]=t}else Sa(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;k(t),l=!1}else a=xi(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=a),l=!0;if(!l)return t.flags&256?(Rl(t),t):(Rl(t),null);if((t.flags&128)!==0)throw Error(b(558))}return k(t),null;case 13:if(u=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(e=Ra(t),u!==null&&u.dehydrated!==null){if(l===null){if(!e)throw Error(b(318));if(e=t.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(b(317));e[gl]=t}else Sa(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;k(t),e=!1}else e=xi(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=e),e=!0;if(!e)return t.flags&256?(Rl(t),t):(Rl(t),null)}return Rl(t),(t.flags&128)!==0?(t.lanes=a,t):(a=u!==null,l=l!==null&&l.memoizedState!==null,a&&(u=t.child,e=null,u.alternate!==null&&u.alternate.memoizedState!==null&&u.alternate.memoizedState.cachePool!==null&&(e=u.alternate.memoizedState.cachePool.pool),n=null,u.memoizedState!==null&&u.memoizedState.cachePool!==null&&(n=u.memoizedState.cachePool.pool),n!==e&&(u.flags|=2048)),a!==l&&a&&(t.child.flags|=8192),Ze(t,t.updateQueue),k(t),null);case 4:return tu(),l===null&&Xf(t.stateNode.containerInfo),k(t),null;case 10:return Tt(t.type),k(t),null;case 19:if(yl(el),u=t.memoizedState,u===null)return k(t),null;if(e=(t.flags&128)!==0,n=u.rendering,n===null)if(e)Nu(u,!1);else{if(ul!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=pn(l),n!==null){for(t.flags|=128,Nu(u,!1),l=n.updateQueue,t.updateQueue=l,Ze(t,l),t.subtreeFlags=0,l=a,a=t.child;a!==null;)Lo(a,l),a=a.sibling;return w(el,el.current&1|2),q&&gt(t,u.treeForkCount),t.child}l=l.sibling}u.tail!==null&&Bl()>On&&(t.flags|=128,e=!0,Nu(u,!1),t.lanes=4194304)}else{if(!e)if(l=pn(n),l!==null){if(t.flags|=128,e=!0,l=l.updateQueue,t.updateQueue=l,Ze(t,l),Nu(u,!0),u.tail===null&&u.tailMode==="hidden"&&!n.alternate&&!q)return k(t),null}else 2*Bl()-u.renderingStartTime>On&&a!==536870912&&(t.flags|=128,e=!0,Nu(u,!1),t.lanes=4194304);u.isBackwards?(n.sibling=t.child,t.child=n):(l=u.last,l!==null?l.sibling=n:t.child=n,u.last=n)}return u.tail!==null?(l=u.tail,u.rendering=l,u.tail=l.sibling,u.renderingStartTime=Bl(),l.sibling=null,a=el.current,w(el,e?a&1|2:a&1),q&&gt(t,u.treeForkCount),l):(k(t),null);case 22:case 23:return Rl(t),Sf(),u=t.memoizedState!==null,l!==null?l.memoizedState!==null!==u&&(t.flags|=8192):u&&(t.flags|=8192),u?(a&536870912)!==0&&(t.flags&128)===0&&(k(t),t.subtreeFlags&6&&(t.flags|=8192)):k(t),a=t.updateQueue,a!==null&&Ze(t,a.retryQueue),a=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),u=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(u=t.memoizedState.cachePool.pool),u!==a&&(t.flags|=2048),l!==null&&yl(ya),null;case 24:return a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Tt(fl),k(t),null;case 25:return null;case 30:return null}throw Error(b(156,t.tag))}function ay(l,t){switch(mf(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Tt(fl),tu(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return mn(t),null;case 31:if(t.memoizedState!==null){if(Rl(t),t.alternate===null)throw Error(b(340));Sa()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(Rl(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(b(340));Sa()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return yl(el),null;case 4:return tu(),null;case 10:return Tt(t.type),null;case 22:case 23:return Rl(t),Sf(),l!==null&&yl(ya),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Tt(fl),null;case 25:return null;default:return null}}function Ld(l,t){switch(mf(t),t.tag){case 3:Tt(fl),tu();break;case 26:case 27:case 5:mn(t);break;case 4:tu();break;case 31:t.memoizedState!==null&&Rl(t);break;case 13:Rl(t);break;case 19:yl(el);break;case 10:Tt(t.type);break;case 22:case 23:Rl(t),Sf(),l!==null&&yl(ya);break;case 24:Tt(fl)}}function re(l,t){try{var a=t.updateQueue,u=a!==null?a.lastEffect:null;if(u!==null){var e=u.next;a=e;do{if((a.tag&l)===l){u=void 0;var n=a.create,i=a.inst;u=n(),i.destroy=u}a=a.next}while(a!==e)}}catch(c){j(t,t.return,c)}}function ta(l,t,a){try{var u=t.updateQueue,e=u!==null?u.lastEffect:null;if(e!==null){var n=e.next;u=n;do{if((u.tag&l)===l){var i=u.inst,c=i.destroy;if(c!==void 0){i.destroy=void 0,e=t;var f=a,d=c;try{d()}catch(y){j(e,f,y)}}}u=u.next}while(u!==n)}}catch(y){j(t,t.return,y)}}function Vd(l){var t=l.updateQueue;if(t!==null){var a=l.stateNode;try{Po(t,a)}catch(u){j(l,l.return,u)}}}function Kd(l,t,a){a.props=pa(l.type,l.memoizedProps),a.state=l.memoizedState;try{a.componentWillUnmount()}catch(u){j(l,t,u)}}function Ju(l,t){try{var a=l.ref;if(a!==null){switch(l.tag){case 26:case 27:case 5:var u=l.stateNode;break;case 30:u=l.stateNode;break;default:u=l.stateNode}typeof a=="function"?l.refCleanup=a(u):a.current=u}}catch(e){j(l,t,e)}}function nt(l,t){var a=l.ref,u=l.refCleanup;if(a!==null)if(typeof u=="function")try{u()}catch(e){j(l,t,e)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof a=="function")try{a(null)}catch(e){j(l,t,e)}else a.current=null}function Jd(l){var t=l.type,a=l.memoizedProps,u=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":a.autoFocus&&u.focus();break l;case"img":a.src?u.src=a.src:a.srcSet&&(u.srcset=a.srcSet)}}catch(e){j(l,l.return,e)}}function Vi(l,t,a){try{var u=l.stateNode;Ty(u,l.type,a,t),u[Nl]=t}catch(e){j(l,l.return,e)}}function wd(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&ea(l.type)||l.tag===4}function Ki(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||wd(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&ea(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function Cc(l,t,a){var u=l.tag;if(u===5||u===6)l=l.stateNode,t?(a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a).insertBefore(l,t):(t=a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a,t.appendChild(l),a=a._reactRootContainer,a!=null||t.onclick!==null||(t.onclick=rt));else if(u!==4&&(u===27&&ea(l.type)&&(a=l.stateNode,t=null),l=l.child,l!==null))for(Cc(l,t,a),l=l.sibling;l!==null;)Cc(l,t,a),l=l.sibling}function Mn(l,t,a){var u=l.tag;if(u===5||u===6)l=l.stateNode,t?a.insertBefore(l,t):a.appendChild(l);else if(u!==4&&(u===27&&ea(l.type)&&(a=l.stateNode),l=l.child,l!==null))for(Mn(l,t,a),l=l.sibling;l!==null;)Mn(l,t,a),l=l.sibling}function Wd(l){var t=l.stateNode,a=l.memoizedProps;try{for(var u=l.type,e=t.attributes;e.length;)t.removeAttributeNode(e[0]);rl(t,u,a),t[gl]=l,t[Nl]=a}catch(n){j(l,l.return,n)}}var St=!1,cl=!1,Ji=!1,Ms=typeof WeakSet=="function"?WeakSet:Set,ml=null;function uy(l,t){if(l=l.containerInfo,Qc=Yn,l=Bo(l),cf(l)){if("selectionStart"in l)var a={start:l.selectionStart,end:l.selectionEnd};else l:{a=(a=l.ownerDocument)&&a.defaultView||window;var u=a.getSelection&&a.getSelection();if(u&&u.rangeCount!==0){a=u.anchorNode;var e=u.anchorOffset,n=u.focusNode;u=u.focusOffset;try{a.nodeType,n.nodeType}catch(M){a=null;break l}var i=0,c=-1,f=-1,d=0,y=0,S=l,v=null;t:for(;;){for(var h;S!==a||e!==0&&S.nodeType!==3||(c=i+e),S!==n||u!==0&&S.nodeType!==3||(f=i+u),S.nodeType===3&&(i+=S.nodeValue.length),(h=S.firstChild)!==null;)v=S,S=h;for(;;){if(S===l)break t;if(v===a&&++d===e&&(c=i),v===n&&++y===u&&(f=i),(h=S.nextSibling)!==null)break;S=v,v=S.parentNode}S=h}a=c===-1||f===-1?null:{start:c,end:f}}else a=null}a=a||{start:0,end:0}}else a=null;for(Zc={focusedElem:l,selectionRange:a},Yn=!1,ml=t;ml!==null;)if(t=ml,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,ml=l;else for(;ml!==null;){switch(t=ml,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(a=0;a<l.length;a++)e=l[a],e.ref.impl=e.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,a=t,e=n.memoizedProps,n=n.memoizedState,u=a.stateNode;try{var p=pa(a.type,e);l=u.getSnapshotBeforeUpdate(p,n),u.__reactInternalSnapshotBeforeUpdate=l}catch(M){j(a,a.return,M)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,a=l.nodeType,a===9)Lc(l);else if(a===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":Lc(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(b(163))}if(l=t.sibling,l!==null){l.return=t.return,ml=l;break}ml=t.return}}function $d(l,t,a){var u=a.flags;switch(a.tag){case 0:case 11:case 15:yt(l,a),u&4&&re(5,a);break;case 1:if(yt(l,a),u&4)if(l=a.stateNode,t===null)try{l.componentDidMount()}catch(i){j(a,a.return,i)}else{var e=pa(a.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(e,t,l.__reactInternalSnapshotBeforeUpdate)}catch(i){j(a,a.return,i)}}u&64&&Vd(a),u&512&&Ju(a,a.return);break;case 3:if(yt(l,a),u&64&&(l=a.updateQueue,l!==null)){if(t=null,a.child!==null)switch(a.child.tag){case 27:case 5:t=a.child.stateNode;break;case 1:t=a.child.stateNode}try{Po(l,t)}catch(i){j(a,a.return,i)}}break;case 27:t===null&&u&4&&Wd(a);case 26:case 5:yt(l,a),t===null&&u&4&&Jd(a),u&512&&Ju(a,a.return);break;case 12:yt(l,a);break;case 31:yt(l,a),u&4&&Id(l,a);break;case 13:yt(l,a),u&4&&Pd(l,a),u&64&&(l=a.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(a=my.bind(null,a),Uy(l,a))));break;case 22:if(u=a.memoizedState!==null||St,!u){t=t!==null&&t.memoizedState!==null||cl,e=St;var n=cl;St=u,(cl=t)&&!n?ht(l,a,(a.subtreeFlags&8772)!==0):yt(l,a),St=e,cl=n}break;case 30:break;default:yt(l,a)}}function kd(l){var t=l.alternate;t!==null&&(l.alternate=null,kd(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&lf(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var tl=null,Ml=!1;function vt(l,t,a){for(a=a.child;a!==null;)Fd(l,t,a),a=a.sibling}function Fd(l,t,a){if(ql&&typeof ql.onCommitFiberUnmount=="function")try{ql.onCommitFiberUnmount(me,a)}catch(n){}switch(a.tag){case 26:cl||nt(a,t),vt(l,t,a),a.memoizedState?a.memoizedState.count--:a.stateNode&&(a=a.stateNode,a.parentNode.removeChild(a));break;case 27:cl||nt(a,t);var u=tl,e=Ml;ea(a.type)&&(tl=a.stateNode,Ml=!1),vt(l,t,a),ku(a.stateNode),tl=u,Ml=e;break;case 5:cl||nt(a,t);case 6:if(u=tl,e=Ml,tl=null,vt(l,t,a),tl=u,Ml=e,tl!==null)if(Ml)try{(tl.nodeType===9?tl.body:tl.nodeName==="HTML"?tl.ownerDocument.body:tl).removeChild(a.stateNode)}catch(n){j(a,t,n)}else try{tl.removeChild(a.stateNode)}catch(n){j(a,t,n)}break;case 18:tl!==null&&(Ml?(l=tl,Zs(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,a.stateNode),du(l)):Zs(tl,a.stateNode));break;case 4:u=tl,e=Ml,tl=a.stateNode.containerInfo,Ml=!0,vt(l,t,a),tl=u,Ml=e;break;case 0:case 11:case 14:case 15:ta(2,a,t),cl||ta(4,a,t),vt(l,t,a);break;case 1:cl||(nt(a,t),u=a.stateNode,typeof u.componentWillUnmount=="function"&&Kd(a,t,u)),vt(l,t,a);break;case 21:vt(l,t,a);break;case 22:cl=(u=cl)||a.memoizedState!==null,vt(l,t,a),cl=u;break;default:vt(l,t,a)}}function Id(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{du(l)}catch(a){j(t,t.return,a)}}}function Pd(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{du(l)}catch(a){j(t,t.return,a)}}function ey(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new Ms),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new Ms),t;default:throw Error(b(435,l.tag))}}function je(l,t){var a=ey(l);t.forEach(function(u){if(!a.has(u)){a.add(u);var e=vy.bind(null,l,u);u.then(e,e)}})}function Al(l,t){var a=t.deletions;if(a!==null)for(var u=0;u<a.length;u++){var e=a[u],n=l,i=t,c=i;l:for(;c!==null;){switch(c.tag){case 27:if(ea(c.type)){tl=c.stateNode,Ml=!1;break l}break;case 5:tl=c.stateNode,Ml=!1;break l;case 3:case 4:tl=c.stateNode.containerInfo,Ml=!0;break l}c=c.return}if(tl===null)throw Error(b(160));Fd(n,i,e),tl=null,Ml=!1,n=e.alternate,n!==null&&(n.return=null),e.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)l1(t,l),t=t.sibling}var Pl=null;function l1(l,t){var a=l.alternate,u=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:Al(t,l),_l(l),u&4&&(ta(3,l,l.return),re(3,l),ta(5,l,l.return));break;case 1:Al(t,l),_l(l),u&512&&(cl||a===null||nt(a,a.return)),u&64&&St&&(l=l.updateQueue,l!==null&&(u=l.callbacks,u!==null&&(a=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=a===null?u:a.concat(u))));break;case 26:var e=Pl;if(Al(t,l),_l(l),u&512&&(cl||a===null||nt(a,a.return)),u&4){var n=a!==null?a.memoizedState:null;if(u=l.memoizedState,a===null)if(u===null)if(l.stateNode===null){l:{u=l.type,a=l.memoizedProps,e=e.ownerDocument||e;t:switch(u){case"title":n=e.getElementsByTagName("title")[0],(!n||n[he]||n[gl]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=e.createElement(u),e.head.insertBefore(n,e.querySelector("head > title"))),rl(n,u,a),n[gl]=l,vl(n),u=n;break l;case"link":var i=Ws("link","href",e).get(u+(a.href||""));if(i){for(var c=0;c<i.length;c++)if(n=i[c],n.getAttribute("href")===(a.href==null||a.href===""?null:a.href)&&n.getAttribute("rel")===(a.rel==null?null:a.rel)&&n.getAttribute("title")===(a.title==null?null:a.title)&&n.getAttribute("crossorigin")===(a.crossOrigin==null?null:a.crossOrigin)){i.splice(c,1);break t}}n=e.createElement(u),rl(n,u,a),e.head.appendChild(n);break;case"meta":if(i=Ws("meta","content",e).get(u+(a.content||""))){for(c=0;c<i.length;c++)if(n=i[c],n.getAttribute("content")===(a.content==null?null:""+a.content)&&n.getAttribute("name")===(a.name==null?null:a.name)&&n.getAttribute("property")===(a.property==null?null:a.property)&&n.getAttribute("http-equiv")===(a.httpEquiv==null?null:a.httpEquiv)&&n.getAttribute("charset")===(a.charSet==null?null:a.charSet)){i.splice(c,1);break t}}n=e.createElement(u),rl(n,u,a),e.head.appendChild(n);break;default:throw Error(b(468,u))}n[gl]=l,vl(n),u=n}l.stateNode=u}else $s(e,l.type,l.stateNode);else l.stateNode=ws(e,u,l.memoizedProps);else n!==u?(n===null?a.stateNode!==null&&(a=a.stateNode,a.parentNode.removeChild(a)):n.count--,u===null?$s(e,l.type,l.stateNode):ws(e,u,l.memoizedProps)):u===null&&l.stateNode!==null&&Vi(l,l.memoizedProps,a.memoizedProps)}break;case 27:Al(t,l),_l(l),u&512&&(cl||a===null||nt(a,a.return)),a!==null&&u&4&&Vi(l,l.memoizedProps,a.memoizedProps);break;case 5:if(Al(t,l),_l(l),u&512&&(cl||a===null||nt(a,a.return)),l.flags&32){e=l.stateNode;try{uu(e,"")}catch(p){j(l,l.return,p)}}u&4&&l.stateNode!=null&&(e=l.memoizedProps,Vi(l,e,a!==null?a.memoizedProps:e)),u&1024&&(Ji=!0);break;case 6:if(Al(t,l),_l(l),u&4){if(l.stateNode===null)throw Error(b(162));u=l.memoizedProps,a=l.stateNode;try{a.nodeValue=u}catch(p){j(l,l.return,p)}}break;case 3:if(cn=null,e=Pl,Pl=xn(t.containerInfo),Al(t,l),Pl=e,_l(l),u&4&&a!==null&&a.memoizedState.isDehydrated)try{du(t.containerInfo)}catch(p){j(l,l.return,p)}Ji&&(Ji=!1,t1(l));break;case 4:u=Pl,Pl=xn(l.stateNode.containerInfo),Al(t,l),_l(l),Pl=u;break;case 12:Al(t,l),_l(l);break;case 31:Al(t,l),_l(l),u&4&&(u=l.updateQueue,u!==null&&(l.updateQueue=null,je(l,u)));break;case 13:Al(t,l),_l(l),l.child.flags&8192&&l.memoizedState!==null!=(a!==null&&a.memoizedState!==null)&&(kn=Bl()),u&4&&(u=l.updateQueue,u!==null&&(l.updateQueue=null,je(l,u)));break;case 22:e=l.memoizedState!==null;var f=a!==null&&a.memoizedState!==null,d=St,y=cl;if(St=d||e,cl=y||f,Al(t,l),cl=y,St=d,_l(l),u&8192)l:for(t=l.stateNode,t._visibility=e?t._visibility&-2:t._visibility|1,e&&(a===null||f||St||cl||da(l)),a=null,t=l;;){if(t.tag===5||t.tag===26){if(a===null){f=a=t;try{if(n=f.stateNode,e)i=n.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none";else{c=f.stateNode;var S=f.memoizedProps.style,v=S!=null&&S.hasOwnProperty("display")?S.display:null;c.style.display=v==null||typeof v=="boolean"?"":(""+v).trim()}}catch(p){j(f,f.return,p)}}}else if(t.tag===6){if(a===null){f=t;try{f.stateNode.nodeValue=e?"":f.memoizedProps}catch(p){j(f,f.return,p)}}}else if(t.tag===18){if(a===null){f=t;try{var h=f.stateNode;e?js(h,!0):js(f.stateNode,!1)}catch(p){j(f,f.return,p)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;a===t&&(a=null),t=t.return}a===t&&(a=null),t.sibling.return=t.return,t=t.sibling}u&4&&(u=l.updateQueue,u!==null&&(a=u.retryQueue,a!==null&&(u.retryQueue=null,je(l,a))));break;case 19:Al(t,l),_l(l),u&4&&(u=l.updateQueue,u!==null&&(l.updateQueue=null,je(l,u)));break;case 30:break;case 21:break;default:Al(t,l),_l(l)}}function _l(l){var t=l.flags;if(t&2){try{for(var a,u=l.return;u!==null;){if(wd(u)){a=u;break}u=u.return}if(a==null)throw Error(b(160));switch(a.tag){case 27:var e=a.stateNode,n=Ki(l);Mn(l,n,e);break;case 5:var i=a.stateNode;a.flags&32&&(uu(i,""),a.flags&=-33);var c=Ki(l);Mn(l,c,i);break;case 3:case 4:var f=a.stateNode.containerInfo,d=Ki(l);Cc(l,d,f);break;default:throw Error(b(161))}}catch(y){j(l,l.return,y)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function t1(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;t1(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function yt(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)$d(l,t.alternate,t),t=t.sibling}function da(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:ta(4,t,t.return),da(t);break;case 1:nt(t,t.return);var a=t.stateNode;typeof a.componentWillUnmount=="function"&&Kd(t,t.return,a),da(t);break;case 27:ku(t.stateNode);case 26:case 5:nt(t,t.return),da(t);break;case 22:t.memoizedState===null&&da(t);break;case 30:da(t);break;default:da(t)}l=l.sibling}}function ht(l,t,a){for(a=a&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var u=t.alternate,e=l,n=t,i=n.flags;switch(n.tag){case 0:case 11:case 15:ht(e,n,a),re(4,n);break;case 1:if(ht(e,n,a),u=n,e=u.stateNode,typeof e.componentDidMount=="function")try{e.componentDidMount()}catch(d){j(u,u.return,d)}if(u=n,e=u.updateQueue,e!==null){var c=u.stateNode;try{var f=e.shared.hiddenCallbacks;if(f!==null)for(e.shared.hiddenCallbacks=null,e=0;e<f.length;e++)Io(f[e],c)}catch(d){j(u,u.return,d)}}a&&i&64&&Vd(n),Ju(n,n.return);break;case 27:Wd(n);case 26:case 5:ht(e,n,a),a&&u===null&&i&4&&Jd(n),Ju(n,n.return);break;case 12:ht(e,n,a);break;case 31:ht(e,n,a),a&&i&4&&Id(e,n);break;case 13:ht(e,n,a),a&&i&4&&Pd(e,n);break;case 22:n.memoizedState===null&&ht(e,n,a),Ju(n,n.return);break;case 30:break;default:ht(e,n,a)}t=t.sibling}}function Cf(l,t){var a=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==a&&(l!=null&&l.refCount++,a!=null&&Se(a))}function xf(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Se(l))}function Il(l,t,a,u){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)a1(l,t,a,u),t=t.sibling}function a1(l,t,a,u){var e=t.flags;switch(t.tag){case 0:case 11:case 15:Il(l,t,a,u),e&2048&&re(9,t);break;case 1:Il(l,t,a,u);break;case 3:Il(l,t,a,u),e&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Se(l)));break;case 12:if(e&2048){Il(l,t,a,u),l=t.stateNode;try{var n=t.memoizedProps,i=n.id,c=n.onPostCommit;typeof c=="function"&&c(i,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(f){j(t,t.return,f)}}else Il(l,t,a,u);break;case 31:Il(l,t,a,u);break;case 13:Il(l,t,a,u);break;case 23:break;case 22:n=t.stateNode,i=t.alternate,t.memoizedState!==null?n._visibility&2?Il(l,t,a,u):wu(l,t):n._visibility&2?Il(l,t,a,u):(n._visibility|=2,xa(l,t,a,u,(t.subtreeFlags&10256)!==0||!1)),e&2048&&Cf(i,t);break;case 24:Il(l,t,a,u),e&2048&&xf(t.alternate,t);break;default:Il(l,t,a,u)}}function xa(l,t,a,u,e){for(e=e&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,i=t,c=a,f=u,d=i.flags;switch(i.tag){case 0:case 11:case 15:xa(n,i,c,f,e),re(8,i);break;case 23:break;case 22:var y=i.stateNode;i.memoizedState!==null?y._visibility&2?xa(n,i,c,f,e):wu(n,i):(y._visibility|=2,xa(n,i,c,f,e)),e&&d&2048&&Cf(i.alternate,i);break;case 24:xa(n,i,c,f,e),e&&d&2048&&xf(i.alternate,i);break;default:xa(n,i,c,f,e)}t=t.sibling}}function wu(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var a=l,u=t,e=u.flags;switch(u.tag){case 22:wu(a,u),e&2048&&Cf(u.alternate,u);break;case 24:wu(a,u),e&2048&&xf(u.alternate,u);break;default:wu(a,u)}t=t.sibling}}var Yu=8192;function Ca(l,t,a){if(l.subtreeFlags&Yu)for(l=l.child;l!==null;)u1(l,t,a),l=l.sibling}function u1(l,t,a){switch(l.tag){case 26:Ca(l,t,a),l.flags&Yu&&l.memoizedState!==null&&jy(a,Pl,l.memoizedState,l.memoizedProps);break;case 5:Ca(l,t,a);break;case 3:case 4:var u=Pl;Pl=xn(l.stateNode.containerInfo),Ca(l,t,a),Pl=u;break;case 22:l.memoizedState===null&&(u=l.alternate,u!==null&&u.memoizedState!==null?(u=Yu,Yu=16777216,Ca(l,t,a),Yu=u):Ca(l,t,a));break;default:Ca(l,t,a)}}function e1(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function Uu(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var u=t[a];ml=u,i1(u,l)}e1(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)n1(l),l=l.sibling}function n1(l){switch(l.tag){case 0:case 11:case 15:Uu(l),l.flags&2048&&ta(9,l,l.return);break;case 3:Uu(l);break;case 12:Uu(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,en(l)):Uu(l);break;default:Uu(l)}}function en(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var u=t[a];ml=u,i1(u,l)}e1(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:ta(8,t,t.return),en(t);break;case 22:a=t.stateNode,a._visibility&2&&(a._visibility&=-3,en(t));break;default:en(t)}l=l.sibling}}function i1(l,t){for(;ml!==null;){var a=ml;switch(a.tag){case 0:case 11:case 15:ta(8,a,t);break;case 23:case 22:if(a.memoizedState!==null&&a.memoizedState.cachePool!==null){var u=a.memoizedState.cachePool.pool;u!=null&&u.refCount++}break;case 24:Se(a.memoizedState.cache)}if(u=a.child,u!==null)u.return=a,ml=u;else l:for(a=l;ml!==null;){u=ml;var e=u.sibling,n=u.return;if(kd(u),u===a){ml=null;break l}if(e!==null){e.return=n,ml=e;break l}ml=n}}}var ny={getCacheForType:function(l){var t=bl(fl),a=t.data.get(l);return a===void 0&&(a=l(),t.data.set(l,a)),a},cacheSignal:function(){return bl(fl).controller.signal}},iy=typeof WeakMap=="function"?WeakMap:Map,X=0,J=null,C=null,x=0,Z=0,Hl=null,Zt=!1,gu=!1,Bf=!1,Dt=0,ul=0,aa=0,ga=0,qf=0,xl=0,cu=0,Wu=null,Ol=null,xc=!1,kn=0,c1=0,On=1/0,Dn=null,Wt=null,ol=0,$t=null,fu=null,Et=0,Bc=0,qc=null,f1=null,$u=0,Yc=null;function Gl(){return(X&2)!==0&&x!==0?x&-x:O.T!==null?Gf():So()}function s1(){if(xl===0)if((x&536870912)===0||q){var l=Re;Re<<=1,(Re&3932160)===0&&(Re=262144),xl=l}else xl=536870912;return l=Ql.current,l!==null&&(l.flags|=32),xl}function Dl(l,t,a){(l===J&&(Z===2||Z===9)||l.cancelPendingCommit!==null)&&(su(l,0),jt(l,x,xl,!1)),ye(l,a),((X&2)===0||l!==J)&&(l===J&&((X&2)===0&&(ga|=a),ul===4&&jt(l,x,xl,!1)),ft(l))}function o1(l,t,a){if((X&6)!==0)throw Error(b(327));var u=!a&&(t&127)===0&&(t&l.expiredLanes)===0||ve(l,t),e=u?sy(l,t):wi(l,t,!0),n=u;do{if(e===0){gu&&!u&&jt(l,t,0,!1);break}else{if(a=l.current.alternate,n&&!cy(a)){e=wi(l,t,!1),n=!1;continue}if(e===2){if(n=t,l.errorRecoveryDisabledLanes&n)var i=0;else i=l.pendingLanes&-536870913,i=i!==0?i:i&536870912?536870912:0;if(i!==0){t=i;l:{var c=l;e=Wu;var f=c.current.memoizedState.isDehydrated;if(f&&(su(c,i).flags|=256),i=wi(c,i,!1),i!==2){if(Bf&&!f){c.errorRecoveryDisabledLanes|=n,ga|=n,e=4;break l}n=Ol,Ol=e,n!==null&&(Ol===null?Ol=n:Ol.push.apply(Ol,n))}e=i}if(n=!1,e!==2)continue}}if(e===1){su(l,0),jt(l,t,0,!0);break}l:{switch(u=l,n=e,n){case 0:case 1:throw Error(b(345));case 4:if((t&4194048)!==t)break;case 6:jt(u,t,xl,!Zt);break l;case 2:Ol=null;break;case 3:case 5:break;default:throw Error(b(329))}if((t&62914560)===t&&(e=kn+300-Bl(),10<e)){if(jt(u,t,xl,!Zt),Xn(u,0,!0)!==0)break l;Et=t,u.timeoutHandle=U1(Os.bind(null,u,a,Ol,Dn,xc,t,xl,ga,cu,Zt,n,"Throttled",-0,0),e);break l}Os(u,a,Ol,Dn,xc,t,xl,ga,cu,Zt,n,null,-0,0)}}break}while(1);ft(l)}function Os(l,t,a,u,e,n,i,c,f,d,y,S,v,h){if(l.timeoutHandle=-1,S=t.subtreeFlags,S&8192||(S&16785408)===16785408){S={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:rt},u1(t,n,S);var p=(n&62914560)===n?kn-Bl():(n&4194048)===n?c1-Bl():0;if(p=Ly(S,p),p!==null){Et=n,l.cancelPendingCommit=p(Ns.bind(null,l,t,n,a,u,e,i,c,f,y,S,null,v,h)),jt(l,n,i,!d);return}}Ns(l,t,n,a,u,e,i,c,f)}function cy(l){for(var t=l;;){var a=t.tag;if((a===0||a===11||a===15)&&t.flags&16384&&(a=t.updateQueue,a!==null&&(a=a.stores,a!==null)))for(var u=0;u<a.length;u++){var e=a[u],n=e.getSnapshot;e=e.value;try{if(!Xl(n(),e))return!1}catch(i){return!1}}if(a=t.child,t.subtreeFlags&16384&&a!==null)a.return=t,t=a;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function jt(l,t,a,u){t&=~qf,t&=~ga,l.suspendedLanes|=t,l.pingedLanes&=~t,u&&(l.warmLanes|=t),u=l.expirationTimes;for(var e=t;0<e;){var n=31-Yl(e),i=1<<n;u[n]=-1,e&=~i}a!==0&&yo(l,a,t)}function Fn(){return(X&6)===0?(ze(0,!1),!1):!0}function Yf(){if(C!==null){if(Z===0)var l=C.return;else l=C,zt=Ma=null,Tf(l),Ia=null,ue=0,l=C;for(;l!==null;)Ld(l.alternate,l),l=l.return;C=null}}function su(l,t){var a=l.timeoutHandle;a!==-1&&(l.timeoutHandle=-1,_y(a)),a=l.cancelPendingCommit,a!==null&&(l.cancelPendingCommit=null,a()),Et=0,Yf(),J=l,C=a=pt(l.current,null),x=t,Z=0,Hl=null,Zt=!1,gu=ve(l,t),Bf=!1,cu=xl=qf=ga=aa=ul=0,Ol=Wu=null,xc=!1,(t&8)!==0&&(t|=t&32);var u=l.entangledLanes;if(u!==0)for(l=l.entanglements,u&=t;0<u;){var e=31-Yl(u),n=1<<e;t|=l[e],u&=~n}return Dt=t,Ln(),a}function d1(l,t){U=null,O.H=ne,t===hu||t===Kn?(t=ns(),Z=3):t===hf?(t=ns(),Z=4):Z=t===Hf?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,Hl=t,C===null&&(ul=1,An(l,wl(t,l.current)))}function m1(){var l=Ql.current;return l===null?!0:(x&4194048)===x?$l===null:(x&62914560)===x||(x&536870912)!==0?l===$l:!1}function v1(){var l=O.H;return O.H=ne,l===null?ne:l}function y1(){var l=O.A;return O.A=ny,l}function Nn(){ul=4,Zt||(x&4194048)!==x&&Ql.current!==null||(gu=!0),(aa&134217727)===0&&(ga&134217727)===0||J===null||jt(J,x,xl,!1)}function wi(l,t,a){var u=X;X|=2;var e=v1(),n=y1();(J!==l||x!==t)&&(Dn=null,su(l,t)),t=!1;var i=ul;l:do try{if(Z!==0&&C!==null){var c=C,f=Hl;switch(Z){case 8:Yf(),i=6;break l;case 3:case 2:case 9:case 6:Ql.current===null&&(t=!0);var d=Z;if(Z=0,Hl=null,wa(l,c,f,d),a&&gu){i=0;break l}break;default:d=Z,Z=0,Hl=null,wa(l,c,f,d)}}fy(),i=ul;break}catch(y){d1(l,y)}while(1);return t&&l.shellSuspendCounter++,zt=Ma=null,X=u,O.H=e,O.A=n,C===null&&(J=null,x=0,Ln()),i}function fy(){for(;C!==null;)h1(C)}function sy(l,t){var a=X;X|=2;var u=v1(),e=y1();J!==l||x!==t?(Dn=null,On=Bl()+500,su(l,t)):gu=ve(l,t);l:do try{if(Z!==0&&C!==null){t=C;var n=Hl;t:switch(Z){case 1:Z=0,Hl=null,wa(l,t,n,1);break;case 2:case 9:if(es(n)){Z=0,Hl=null,Ds(t);break}t=function(){Z!==2&&Z!==9||J!==l||(Z=7),ft(l)},n.then(t,t);break l;case 3:Z=7;break l;case 4:Z=5;break l;case 7:es(n)?(Z=0,Hl=null,Ds(t)):(Z=0,Hl=null,wa(l,t,n,7));break;case 5:var i=null;switch(C.tag){case 26:i=C.memoizedState;case 5:case 27:var c=C;if(i?B1(i):c.stateNode.complete){Z=0,Hl=null;var f=c.sibling;if(f!==null)C=f;else{var d=c.return;d!==null?(C=d,In(d)):C=null}break t}}Z=0,Hl=null,wa(l,t,n,5);break;case 6:Z=0,Hl=null,wa(l,t,n,6);break;case 8:Yf(),ul=6;break l;default:throw Error(b(462))}}oy();break}catch(y){d1(l,y)}while(1);return zt=Ma=null,O.H=u,O.A=e,X=a,C!==null?0:(J=null,x=0,Ln(),ul)}function oy(){for(;C!==null&&!Cm();)h1(C)}function h1(l){var t=jd(l.alternate,l,Dt);l.memoizedProps=l.pendingProps,t===null?In(l):C=t}function Ds(l){var t=l,a=t.alternate;switch(t.tag){case 15:case 0:t=ps(a,t,t.pendingProps,t.type,void 0,x);break;case 11:t=ps(a,t,t.pendingProps,t.type.render,t.ref,x);break;case 5:Tf(t);default:Ld(a,t),t=C=Lo(t,Dt),t=jd(a,t,Dt)}l.memoizedProps=l.pendingProps,t===null?In(l):C=t}function wa(l,t,a,u){zt=Ma=null,Tf(t),Ia=null,ue=0;var e=t.return;try{if(Iv(l,e,t,a,x)){ul=1,An(l,wl(a,l.current)),C=null;return}}catch(n){if(e!==null)throw C=e,n;ul=1,An(l,wl(a,l.current)),C=null;return}t.flags&32768?(q||u===1?l=!0:gu||(x&536870912)!==0?l=!1:(Zt=l=!0,(u===2||u===9||u===3||u===6)&&(u=Ql.current,u!==null&&u.tag===13&&(u.flags|=16384))),g1(t,l)):In(t)}function In(l){var t=l;do{if((t.flags&32768)!==0){g1(t,Zt);return}l=t.return;var a=ty(t.alternate,t,Dt);if(a!==null){C=a;return}if(t=t.sibling,t!==null){C=t;return}C=t=l}while(t!==null);ul===0&&(ul=5)}function g1(l,t){do{var a=ay(l.alternate,l);if(a!==null){a.flags&=32767,C=a;return}if(a=l.return,a!==null&&(a.flags|=32768,a.subtreeFlags=0,a.deletions=null),!t&&(l=l.sibling,l!==null)){C=l;return}C=l=a}while(l!==null);ul=6,C=null}function Ns(l,t,a,u,e,n,i,c,f){l.cancelPendingCommit=null;do Pn();while(ol!==0);if((X&6)!==0)throw Error(b(327));if(t!==null){if(t===l.current)throw Error(b(177));if(n=t.lanes|t.childLanes,n|=ff,Lm(l,a,n,i,c,f),l===J&&(C=J=null,x=0),fu=t,$t=l,Et=a,Bc=n,qc=e,f1=u,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,yy(vn,function(){return p1(),null})):(l.callbackNode=null,l.callbackPriority=0),u=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||u){u=O.T,O.T=null,e=Q.p,Q.p=2,i=X,X|=4;try{uy(l,t,a)}finally{X=i,Q.p=e,O.T=u}}ol=1,S1(),b1(),r1()}}function S1(){if(ol===1){ol=0;var l=$t,t=fu,a=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||a){a=O.T,O.T=null;var u=Q.p;Q.p=2;var e=X;X|=4;try{l1(t,l);var n=Zc,i=Bo(l.containerInfo),c=n.focusedElem,f=n.selectionRange;if(i!==c&&c&&c.ownerDocument&&xo(c.ownerDocument.documentElement,c)){if(f!==null&&cf(c)){var d=f.start,y=f.end;if(y===void 0&&(y=d),"selectionStart"in c)c.selectionStart=d,c.selectionEnd=Math.min(y,c.value.length);else{var S=c.ownerDocument||document,v=S&&S.defaultView||window;if(v.getSelection){var h=v.getSelection(),p=c.textContent.length,M=Math.min(f.start,p),G=f.end===void 0?M:Math.min(f.end,p);!h.extend&&M>G&&(i=G,G=M,M=i);var o=F0(c,M),s=F0(c,G);if(o&&s&&(h.rangeCount!==1||h.anchorNode!==o.node||h.anchorOffset!==o.offset||h.focusNode!==s.node||h.focusOffset!==s.offset)){var m=S.createRange();m.setStart(o.node,o.offset),h.removeAllRanges(),M>G?(h.addRange(m),h.extend(s.node,s.offset)):(m.setEnd(s.node,s.offset),h.addRange(m))}}}}for(S=[],h=c;h=h.parentNode;)h.nodeType===1&&S.push({element:h,left:h.scrollLeft,top:h.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<S.length;c++){var g=S[c];g.element.scrollLeft=g.left,g.element.scrollTop=g.top}}Yn=!!Qc,Zc=Qc=null}finally{X=e,Q.p=u,O.T=a}}l.current=t,ol=2}}function b1(){if(ol===2){ol=0;var l=$t,t=fu,a=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||a){a=O.T,O.T=null;var u=Q.p;Q.p=2;var e=X;X|=4;try{$d(l,t.alternate,t)}finally{X=e,Q.p=u,O.T=a}}ol=3}}function r1(){if(ol===4||ol===3){ol=0,xm();var l=$t,t=fu,a=Et,u=f1;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?ol=5:(ol=0,fu=$t=null,z1(l,l.pendingLanes));var e=l.pendingLanes;if(e===0&&(Wt=null),Pc(a),t=t.stateNode,ql&&typeof ql.onCommitFiberRoot=="function")try{ql.onCommitFiberRoot(me,t,void 0,(t.current.flags&128)===128)}catch(f){}if(u!==null){t=O.T,e=Q.p,Q.p=2,O.T=null;try{for(var n=l.onRecoverableError,i=0;i<u.length;i++){var c=u[i];n(c.value,{componentStack:c.stack})}}finally{O.T=t,Q.p=e}}(Et&3)!==0&&Pn(),ft(l),e=l.pendingLanes,(a&261930)!==0&&(e&42)!==0?l===Yc?$u++:($u=0,Yc=l):$u=0,ze(0,!1)}}function z1(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,Se(t)))}function Pn(){return S1(),b1(),r1(),p1()}function p1(){if(ol!==5)return!1;var l=$t,t=Bc;Bc=0;var a=Pc(Et),u=O.T,e=Q.p;try{Q.p=32>a?32:a,O.T=null,a=qc,qc=null;var n=$t,i=Et;if(ol=0,fu=$t=null,Et=0,(X&6)!==0)throw Error(b(331));var c=X;if(X|=4,n1(n.current),a1(n,n.current,i,a),X=c,ze(0,!1),ql&&typeof ql.onPostCommitFiberRoot=="function")try{ql.onPostCommitFiberRoot(me,n)}catch(f){}return!0}finally{Q.p=e,O.T=u,z1(l,t)}}function Us(l,t,a){t=wl(a,t),t=Uc(l.stateNode,t,2),l=wt(l,t,2),l!==null&&(ye(l,2),ft(l))}function j(l,t,a){if(l.tag===3)Us(l,l,a);else for(;t!==null;){if(t.tag===3){Us(t,l,a);break}else if(t.tag===1){var u=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof u.componentDidCatch=="function"&&(Wt===null||!Wt.has(u))){l=wl(a,l),a=qd(2),u=wt(t,a,2),u!==null&&(Yd(a,u,t,l),ye(u,2),ft(u));break}}t=t.return}}function Wi(l,t,a){var u=l.pingCache;if(u===null){u=l.pingCache=new iy;var e=new Set;u.set(t,e)}else e=u.get(t),e===void 0&&(e=new Set,u.set(t,e));e.has(a)||(Bf=!0,e.add(a),l=dy.bind(null,l,t,a),t.then(l,l))}function dy(l,t,a){var u=l.pingCache;u!==null&&u.delete(t),l.pingedLanes|=l.suspendedLanes&a,l.warmLanes&=~a,J===l&&(x&a)===a&&(ul===4||ul===3&&(x&62914560)===x&&300>Bl()-kn?(X&2)===0&&su(l,0):qf|=a,cu===x&&(cu=0)),ft(l)}function T1(l,t){t===0&&(t=vo()),l=_a(l,t),l!==null&&(ye(l,t),ft(l))}function my(l){var t=l.memoizedState,a=0;t!==null&&(a=t.retryLane),T1(l,a)}function vy(l,t){var a=0;switch(l.tag){case 31:case 13:var u=l.stateNode,e=l.memoizedState;e!==null&&(a=e.retryLane);break;case 19:u=l.stateNode;break;case 22:u=l.stateNode._retryCache;break;default:throw Error(b(314))}u!==null&&u.delete(t),T1(l,a)}function yy(l,t){return Fc(l,t)}var Un=null,Ba=null,Gc=!1,Hn=!1,$i=!1,Lt=0;function ft(l){l!==Ba&&l.next===null&&(Ba===null?Un=Ba=l:Ba=Ba.next=l),Hn=!0,Gc||(Gc=!0,gy())}function ze(l,t){if(!$i&&Hn){$i=!0;do for(var a=!1,u=Un;u!==null;){if(!t)if(l!==0){var e=u.pendingLanes;if(e===0)var n=0;else{var i=u.suspendedLanes,c=u.pingedLanes;n=(1<<31-Yl(42|l)+1)-1,n&=e&~(i&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(a=!0,Hs(u,n))}else n=x,n=Xn(u,u===J?n:0,u.cancelPendingCommit!==null||u.timeoutHandle!==-1),(n&3)===0||ve(u,n)||(a=!0,Hs(u,n));u=u.next}while(a);$i=!1}}function hy(){E1()}function E1(){Hn=Gc=!1;var l=0;Lt!==0&&Ay()&&(l=Lt);for(var t=Bl(),a=null,u=Un;u!==null;){var e=u.next,n=A1(u,t);n===0?(u.next=null,a===null?Un=e:a.next=e,e===null&&(Ba=a)):(a=u,(l!==0||(n&3)!==0)&&(Hn=!0)),u=e}ol!==0&&ol!==5||ze(l,!1),Lt!==0&&(Lt=0)}function A1(l,t){for(var a=l.suspendedLanes,u=l.pingedLanes,e=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var i=31-Yl(n),c=1<<i,f=e[i];f===-1?((c&a)===0||(c&u)!==0)&&(e[i]=jm(c,t)):f<=t&&(l.expiredLanes|=c),n&=~c}if(t=J,a=x,a=Xn(l,l===t?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),u=l.callbackNode,a===0||l===t&&(Z===2||Z===9)||l.cancelPendingCommit!==null)return u!==null&&u!==null&&Ai(u),l.callbackNode=null,l.callbackPriority=0;if((a&3)===0||ve(l,a)){if(t=a&-a,t===l.callbackPriority)return t;switch(u!==null&&Ai(u),Pc(a)){case 2:case 8:a=oo;break;case 32:a=vn;break;case 268435456:a=mo;break;default:a=vn}return u=_1.bind(null,l),a=Fc(a,u),l.callbackPriority=t,l.callbackNode=a,t}return u!==null&&u!==null&&Ai(u),l.callbackPriority=2,l.callbackNode=null,2}function _1(l,t){if(ol!==0&&ol!==5)return l.callbackNode=null,l.callbackPriority=0,null;var a=l.callbackNode;if(Pn()&&l.callbackNode!==a)return null;var u=x;return u=Xn(l,l===J?u:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),u===0?null:(o1(l,u,t),A1(l,Bl()),l.callbackNode!=null&&l.callbackNode===a?_1.bind(null,l):null)}function Hs(l,t){if(Pn())return null;o1(l,t,!0)}function gy(){My(function(){(X&6)!==0?Fc(so,hy):E1()})}function Gf(){if(Lt===0){var l=eu;l===0&&(l=He,He<<=1,(He&261888)===0&&(He=256)),Lt=l}return Lt}function Rs(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:$e(""+l)}function Cs(l,t){var a=t.ownerDocument.createElement("input");return a.name=t.name,a.value=t.value,l.id&&a.setAttribute("form",l.id),t.parentNode.insertBefore(a,t),l=new FormData(l),a.parentNode.removeChild(a),l}function Sy(l,t,a,u,e){if(t==="submit"&&a&&a.stateNode===e){var n=Rs((e[Nl]||null).action),i=u.submitter;i&&(t=(t=i[Nl]||null)?Rs(t.formAction):i.getAttribute("formAction"),t!==null&&(n=t,i=null));var c=new Qn("action","action",null,u,e);l.push({event:c,listeners:[{instance:null,listener:function(){if(u.defaultPrevented){if(Lt!==0){var f=i?Cs(e,i):new FormData(e);Dc(a,{pending:!0,data:f,method:e.method,action:n},null,f)}}else typeof n=="function"&&(c.preventDefault(),f=i?Cs(e,i):new FormData(e),Dc(a,{pending:!0,data:f,method:e.method,action:n},n,f))},currentTarget:e}]})}}for(Le=0;Le<gc.length;Le++)Ve=gc[Le],xs=Ve.toLowerCase(),Bs=Ve[0].toUpperCase()+Ve.slice(1),lt(xs,"on"+Bs);var Ve,xs,Bs,Le;lt(Yo,"onAnimationEnd");lt(Go,"onAnimationIteration");lt(Xo,"onAnimationStart");lt("dblclick","onDoubleClick");lt("focusin","onFocus");lt("focusout","onBlur");lt(Bv,"onTransitionRun");lt(qv,"onTransitionStart");lt(Yv,"onTransitionCancel");lt(Qo,"onTransitionEnd");au("onMouseEnter",["mouseout","mouseover"]);au("onMouseLeave",["mouseout","mouseover"]);au("onPointerEnter",["pointerout","pointerover"]);au("onPointerLeave",["pointerout","pointerover"]);Ta("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Ta("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Ta("onBeforeInput",["compositionend","keypress","textInput","paste"]);Ta("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Ta("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Ta("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var ie="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),by=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(ie));function M1(l,t){t=(t&4)!==0;for(var a=0;a<l.length;a++){var u=l[a],e=u.event;u=u.listeners;l:{var n=void 0;if(t)for(var i=u.length-1;0<=i;i--){var c=u[i],f=c.instance,d=c.currentTarget;if(c=c.listener,f!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=d;try{n(e)}catch(y){hn(y)}e.currentTarget=null,n=f}else for(i=0;i<u.length;i++){if(c=u[i],f=c.instance,d=c.currentTarget,c=c.listener,f!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=d;try{n(e)}catch(y){hn(y)}e.currentTarget=null,n=f}}}}function R(l,t){var a=t[fc];a===void 0&&(a=t[fc]=new Set);var u=l+"__bubble";a.has(u)||(O1(t,l,2,!1),a.add(u))}function ki(l,t,a){var u=0;t&&(u|=4),O1(a,l,u,t)}var Ke="_reactListening"+Math.random().toString(36).slice(2);function Xf(l){if(!l[Ke]){l[Ke]=!0,bo.forEach(function(a){a!=="selectionchange"&&(by.has(a)||ki(a,!1,l),ki(a,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[Ke]||(t[Ke]=!0,ki("selectionchange",!1,t))}}function O1(l,t,a,u){switch(Q1(t)){case 2:var e=Jy;break;case 8:e=wy;break;default:e=Lf}a=e.bind(null,t,a,l),e=void 0,!vc||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(e=!0),u?e!==void 0?l.addEventListener(t,a,{capture:!0,passive:e}):l.addEventListener(t,a,!0):e!==void 0?l.addEventListener(t,a,{passive:e}):l.addEventListener(t,a,!1)}function Fi(l,t,a,u,e){var n=u;if((t&1)===0&&(t&2)===0&&u!==null)l:for(;;){if(u===null)return;var i=u.tag;if(i===3||i===4){var c=u.stateNode.containerInfo;if(c===e)break;if(i===4)for(i=u.return;i!==null;){var f=i.tag;if((f===3||f===4)&&i.stateNode.containerInfo===e)return;i=i.return}for(;c!==null;){if(i=Ga(c),i===null)return;if(f=i.tag,f===5||f===6||f===26||f===27){u=n=i;continue l}c=c.parentNode}}u=u.return}Mo(function(){var d=n,y=af(a),S=[];l:{var v=Zo.get(l);if(v!==void 0){var h=Qn,p=l;switch(l){case"keypress":if(Fe(a)===0)break l;case"keydown":case"keyup":h=vv;break;case"focusin":p="focus",h=Ni;break;case"focusout":p="blur",h=Ni;break;case"beforeblur":case"afterblur":h=Ni;break;case"click":if(a.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":h=j0;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":h=tv;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":h=gv;break;case Yo:case Go:case Xo:h=ev;break;case Qo:h=bv;break;case"scroll":case"scrollend":h=Pm;break;case"wheel":h=zv;break;case"copy":case"cut":case"paste":h=iv;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":h=V0;break;case"toggle":case"beforetoggle":h=Tv}var M=(t&4)!==0,G=!M&&(l==="scroll"||l==="scrollend"),o=M?v!==null?v+"Capture":null:v;M=[];for(var s=d,m;s!==null;){var g=s;if(m=g.stateNode,g=g.tag,g!==5&&g!==26&&g!==27||m===null||o===null||(g=Iu(s,o),g!=null&&M.push(ce(s,g,m))),G)break;s=s.return}0<M.length&&(v=new h(v,p,null,a,y),S.push({event:v,listeners:M}))}}if((t&7)===0){l:{if(v=l==="mouseover"||l==="pointerover",h=l==="mouseout"||l==="pointerout",v&&a!==mc&&(p=a.relatedTarget||a.fromElement)&&(Ga(p)||p[mu]))break l;if((h||v)&&(v=y.window===y?y:(v=y.ownerDocument)?v.defaultView||v.parentWindow:window,h?(p=a.relatedTarget||a.toElement,h=d,p=p?Ga(p):null,p!==null&&(G=de(p),M=p.tag,p!==G||M!==5&&M!==27&&M!==6)&&(p=null)):(h=null,p=d),h!==p)){if(M=j0,g="onMouseLeave",o="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(M=V0,g="onPointerLeave",o="onPointerEnter",s="pointer"),G=h==null?v:Bu(h),m=p==null?v:Bu(p),v=new M(g,s+"leave",h,a,y),v.target=G,v.relatedTarget=m,g=null,Ga(y)===d&&(M=new M(o,s+"enter",p,a,y),M.target=m,M.relatedTarget=G,g=M),G=g,h&&p)t:{for(M=ry,o=h,s=p,m=0,g=o;g;g=M(g))m++;g=0;for(var _=s;_;_=M(_))g++;for(;0<m-g;)o=M(o),m--;for(;0<g-m;)s=M(s),g--;for(;m--;){if(o===s||s!==null&&o===s.alternate){M=o;break t}o=M(o),s=M(s)}M=null}else M=null;h!==null&&qs(S,v,h,M,!1),p!==null&&G!==null&&qs(S,G,p,M,!0)}}l:{if(v=d?Bu(d):window,h=v.nodeName&&v.nodeName.toLowerCase(),h==="select"||h==="input"&&v.type==="file")var B=W0;else if(w0(v))if(Ro)B=Rv;else{B=Uv;var E=Nv}else h=v.nodeName,!h||h.toLowerCase()!=="input"||v.type!=="checkbox"&&v.type!=="radio"?d&&tf(d.elementType)&&(B=W0):B=Hv;if(B&&(B=B(l,d))){Ho(S,B,a,y);break l}E&&E(l,v,d),l==="focusout"&&d&&v.type==="number"&&d.memoizedProps.value!=null&&dc(v,"number",v.value)}switch(E=d?Bu(d):window,l){case"focusin":(w0(E)||E.contentEditable==="true")&&(Za=E,yc=d,Qu=null);break;case"focusout":Qu=yc=Za=null;break;case"mousedown":hc=!0;break;case"contextmenu":case"mouseup":case"dragend":hc=!1,I0(S,a,y);break;case"selectionchange":if(xv)break;case"keydown":case"keyup":I0(S,a,y)}var D;if(nf)l:{switch(l){case"compositionstart":var H="onCompositionStart";break l;case"compositionend":H="onCompositionEnd";break l;case"compositionupdate":H="onCompositionUpdate";break l}H=void 0}else Qa?No(l,a)&&(H="onCompositionEnd"):l==="keydown"&&a.keyCode===229&&(H="onCompositionStart");H&&(Do&&a.locale!=="ko"&&(Qa||H!=="onCompositionStart"?H==="onCompositionEnd"&&Qa&&(D=Oo()):(Qt=y,uf="value"in Qt?Qt.value:Qt.textContent,Qa=!0)),E=Rn(d,H),0<E.length&&(H=new L0(H,l,null,a,y),S.push({event:H,listeners:E}),D?H.data=D:(D=Uo(a),D!==null&&(H.data=D)))),(D=Av?_v(l,a):Mv(l,a))&&(H=Rn(d,"onBeforeInput"),0<H.length&&(E=new L0("onBeforeInput","beforeinput",null,a,y),S.push({event:E,listeners:H}),E.data=D)),Sy(S,l,d,a,y)}M1(S,t)})}function ce(l,t,a){return{instance:l,listener:t,currentTarget:a}}function Rn(l,t){for(var a=t+"Capture",u=[];l!==null;){var e=l,n=e.stateNode;if(e=e.tag,e!==5&&e!==26&&e!==27||n===null||(e=Iu(l,a),e!=null&&u.unshift(ce(l,e,n)),e=Iu(l,t),e!=null&&u.push(ce(l,e,n))),l.tag===3)return u;l=l.return}return[]}function ry(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function qs(l,t,a,u,e){for(var n=t._reactName,i=[];a!==null&&a!==u;){var c=a,f=c.alternate,d=c.stateNode;if(c=c.tag,f!==null&&f===u)break;c!==5&&c!==26&&c!==27||d===null||(f=d,e?(d=Iu(a,n),d!=null&&i.unshift(ce(a,d,f))):e||(d=Iu(a,n),d!=null&&i.push(ce(a,d,f)))),a=a.return}i.length!==0&&l.push({event:t,listeners:i})}var zy=/\r\n?/g,py=/\u0000|\uFFFD/g;function Ys(l){return(typeof l=="string"?l:""+l).replace(zy,`
-`).replace(py,"")}function D1(l,t){return t=Ys(t),Ys(l)===t}function V(l,t,a,u,e,n){switch(a){case"children":typeof u=="string"?t==="body"||t==="textarea"&&u===""||uu(l,u):(typeof u=="number"||typeof u=="bigint")&&t!=="body"&&uu(l,""+u);break;case"className":xe(l,"class",u);break;case"tabIndex":xe(l,"tabindex",u);break;case"dir":case"role":case"viewBox":case"width":case"height":xe(l,a,u);break;case"style":_o(l,u,n);break;case"data":if(t!=="object"){xe(l,"data",u);break}case"src":case"href":if(u===""&&(t!=="a"||a!=="href")){l.removeAttribute(a);break}if(u==null||typeof u=="function"||typeof u=="symbol"||typeof u=="boolean"){l.removeAttribute(a);break}u=$e(""+u),l.setAttribute(a,u);break;case"action":case"formAction":if(typeof u=="function"){l.setAttribute(a,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(a==="formAction"?(t!=="input"&&V(l,t,"name",e.name,e,null),V(l,t,"formEncType",e.formEncType,e,null),V(l,t,"formMethod",e.formMethod,e,null),V(l,t,"formTarget",e.formTarget,e,null)):(V(l,t,"encType",e.encType,e,null),V(l,t,"method",e.method,e,null),V(l,t,"target",e.target,e,null)));if(u==null||typeof u=="symbol"||typeof u=="boolean"){l.removeAttribute(a);break}u=$e(""+u),l.setAttribute(a,u);break;case"onClick":u!=null&&(l.onclick=rt);break;case"onScroll":u!=null&&R("scroll",l);break;case"onScrollEnd":u!=null&&R("scrollend",l);break;case"dangerouslySetInnerHTML":if(u!=null){if(typeof u!="object"||!("__html"in u))throw Error(b(61));if(a=u.__html,a!=null){if(e.children!=null)throw Error(b(60));l.innerHTML=a}}break;case"multiple":l.multiple=u&&typeof u!="function"&&typeof u!="symbol";break;case"muted":l.muted=u&&typeof u!="function"&&typeof u!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(u==null||typeof u=="function"||typeof u=="boolean"||typeof u=="symbol"){l.removeAttribute("xlink:href");break}a=$e(""+u),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",a);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":u!=null&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,""+u):l.removeAttribute(a);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":u&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,""):l.removeAttribute(a);break;case"capture":case"download":u===!0?l.setAttribute(a,""):u!==!1&&u!=null&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,u):l.removeAttribute(a);break;case"cols":case"rows":case"size":case"span":u!=null&&typeof u!="function"&&typeof u!="symbol"&&!isNaN(u)&&1<=u?l.setAttribute(a,u):l.removeAttribute(a);break;case"rowSpan":case"start":u==null||typeof u=="function"||typeof u=="symbol"||isNaN(u)?l.removeAttribute(a):l.setAttribute(a,u);break;case"popover":R("beforetoggle",l),R("toggle",l),We(l,"popover",u);break;case"xlinkActuate":dt(l,"http://www.w3.org/1999/xlink","xlink:actuate",u);break;case"xlinkArcrole":dt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",u);break;case"xlinkRole":dt(l,"http://www.w3.org/1999/xlink","xlink:role",u);break;case"xlinkShow":dt(l,"http://www.w3.org/1999/xlink","xlink:show",u);break;case"xlinkTitle":dt(l,"http://www.w3.org/1999/xlink","xlink:title",u);break;case"xlinkType":dt(l,"http://www.w3.org/1999/xlink","xlink:type",u);break;case"xmlBase":dt(l,"http://www.w3.org/XML/1998/namespace","xml:base",u);break;case"xmlLang":dt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",u);break;case"xmlSpace":dt(l,"http://www.w3.org/XML/1998/namespace","xml:space",u);break;case"is":We(l,"is",u);break;case"innerText":case"textContent":break;default:(!(2<a.length)||a[0]!=="o"&&a[0]!=="O"||a[1]!=="n"&&a[1]!=="N")&&(a=Fm.get(a)||a,We(l,a,u))}}function Xc(l,t,a,u,e,n){switch(a){case"style":_o(l,u,n);break;case"dangerouslySetInnerHTML":if(u!=null){if(typeof u!="object"||!("__html"in u))throw Error(b(61));if(a=u.__html,a!=null){if(e.children!=null)throw Error(b(60));l.innerHTML=a}}break;case"children":typeof u=="string"?uu(l,u):(typeof u=="number"||typeof u=="bigint")&&uu(l,""+u);break;case"onScroll":u!=null&&R("scroll",l);break;case"onScrollEnd":u!=null&&R("scrollend",l);break;case"onClick":u!=null&&(l.onclick=rt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!ro.hasOwnProperty(a))l:{if(a[0]==="o"&&a[1]==="n"&&(e=a.endsWith("Capture"),t=a.slice(2,e?a.length-7:void 0),n=l[Nl]||null,n=n!=null?n[a]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof u=="function")){typeof n!="function"&&n!==null&&(a in l?l[a]=null:l.hasAttribute(a)&&l.removeAttribute(a)),l.addEventListener(t,u,e);break l}a in l?l[a]=u:u===!0?l.setAttribute(a,""):We(l,a,u)}}}function rl(l,t,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":R("error",l),R("load",l);var u=!1,e=!1,n;for(n in a)if(a.hasOwnProperty(n)){var i=a[n];if(i!=null)switch(n){case"src":u=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(b(137,t));default:V(l,t,n,i,a,null)}}e&&V(l,t,"srcSet",a.srcSet,a,null),u&&V(l,t,"src",a.src,a,null);return;case"input":R("invalid",l);var c=n=i=e=null,f=null,d=null;for(u in a)if(a.hasOwnProperty(u)){var y=a[u];if(y!=null)switch(u){case"name":e=y;break;case"type":i=y;break;case"checked":f=y;break;case"defaultChecked":d=y;break;case"value":n=y;break;case"defaultValue":c=y;break;case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(b(137,t));break;default:V(l,t,u,y,a,null)}}To(l,n,c,f,d,i,e,!1);return;case"select":R("invalid",l),u=i=n=null;for(e in a)if(a.hasOwnProperty(e)&&(c=a[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":i=c;break;case"multiple":u=c;default:V(l,t,e,c,a,null)}t=n,a=i,l.multiple=!!u,t!=null?$a(l,!!u,t,!1):a!=null&&$a(l,!!u,a,!0);return;case"textarea":R("invalid",l),n=e=u=null;for(i in a)if(a.hasOwnProperty(i)&&(c=a[i],c!=null))switch(i){case"value":u=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(b(91));break;default:V(l,t,i,c,a,null)}Ao(l,u,e,n);return;case"option":for(f in a)if(a.hasOwnProperty(f)&&(u=a[f],u!=null))switch(f){case"selected":l.selected=u&&typeof u!="function"&&typeof u!="symbol";break;default:V(l,t,f,u,a,null)}return;case"dialog":R("beforetoggle",l),R("toggle",l),R("cancel",l),R("close",l);break;case"iframe":case"object":R("load",l);break;case"video":case"audio":for(u=0;u<ie.length;u++)R(ie[u],l);break;case"image":R("error",l),R("load",l);break;case"details":R("toggle",l);break;case"embed":case"source":case"link":R("error",l),R("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(d in a)if(a.hasOwnProperty(d)&&(u=a[d],u!=null))switch(d){case"children":case"dangerouslySetInnerHTML":throw Error(b(137,t));default:V(l,t,d,u,a,null)}return;default:if(tf(t)){for(y in a)a.hasOwnProperty(y)&&(u=a[y],u!==void 0&&Xc(l,t,y,u,a,void 0));return}}for(c in a)a.hasOwnProperty(c)&&(u=a[c],u!=null&&V(l,t,c,u,a,null))}function Ty(l,t,a,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,i=null,c=null,f=null,d=null,y=null;for(h in a){var S=a[h];if(a.hasOwnProperty(h)&&S!=null)switch(h){case"checked":break;case"value":break;case"defaultValue":f=S;default:u.hasOwnProperty(h)||V(l,t,h,null,u,S)}}for(var v in u){var h=u[v];if(S=a[v],u.hasOwnProperty(v)&&(h!=null||S!=null))switch(v){case"type":n=h;break;case"name":e=h;break;case"checked":d=h;break;case"defaultChecked":y=h;break;case"value":i=h;break;case"defaultValue":c=h;break;case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(b(137,t));break;default:h!==S&&V(l,t,v,h,u,S)}}oc(l,i,c,f,d,y,n,e);return;case"select":h=i=c=v=null;for(n in a)if(f=a[n],a.hasOwnProperty(n)&&f!=null)switch(n){case"value":break;case"multiple":h=f;default:u.hasOwnProperty(n)||V(l,t,n,null,u,f)}for(e in u)if(n=u[e],f=a[e],u.hasOwnProperty(e)&&(n!=null||f!=null))switch(e){case"value":v=n;break;case"defaultValue":c=n;break;case"multiple":i=n;default:n!==f&&V(l,t,e,n,u,f)}t=c,a=i,u=h,v!=null?$a(l,!!a,v,!1):!!u!=!!a&&(t!=null?$a(l,!!a,t,!0):$a(l,!!a,a?[]:"",!1));return;case"textarea":h=v=null;for(c in a)if(e=a[c],a.hasOwnProperty(c)&&e!=null&&!u.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:V(l,t,c,null,u,e)}for(i in u)if(e=u[i],n=a[i],u.hasOwnProperty(i)&&(e!=null||n!=null))switch(i){case"value":v=e;break;case"defaultValue":h=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(b(91));break;default:e!==n&&V(l,t,i,e,u,n)}Eo(l,v,h);return;case"option":for(var p in a)if(v=a[p],a.hasOwnProperty(p)&&v!=null&&!u.hasOwnProperty(p))switch(p){case"selected":l.selected=!1;break;default:V(l,t,p,null,u,v)}for(f in u)if(v=u[f],h=a[f],u.hasOwnProperty(f)&&v!==h&&(v!=null||h!=null))switch(f){case"selected":l.selected=v&&typeof v!="function"&&typeof v!="symbol";break;default:V(l,t,f,v,u,h)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var M in a)v=a[M],a.hasOwnProperty(M)&&v!=null&&!u.hasOwnProperty(M)&&V(l,t,M,null,u,v);for(d in u)if(v=u[d],h=a[d],u.hasOwnProperty(d)&&v!==h&&(v!=null||h!=null))switch(d){case"children":case"dangerouslySetInnerHTML":if(v!=null)throw Error(b(137,t));break;default:V(l,t,d,v,u,h)}return;default:if(tf(t)){for(var G in a)v=a[G],a.hasOwnProperty(G)&&v!==void 0&&!u.hasOwnProperty(G)&&Xc(l,t,G,void 0,u,v);for(y in u)v=u[y],h=a[y],!u.hasOwnProperty(y)||v===h||v===void 0&&h===void 0||Xc(l,t,y,v,u,h);return}}for(var o in a)v=a[o],a.hasOwnProperty(o)&&v!=null&&!u.hasOwnProperty(o)&&V(l,t,o,null,u,v);for(S in u)v=u[S],h=a[S],!u.hasOwnProperty(S)||v===h||v==null&&h==null||V(l,t,S,v,u,h)}function Gs(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Ey(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,a=performance.getEntriesByType("resource"),u=0;u<a.length;u++){var e=a[u],n=e.transferSize,i=e.initiatorType,c=e.duration;if(n&&c&&Gs(i)){for(i=0,c=e.responseEnd,u+=1;u<a.length;u++){var f=a[u],d=f.startTime;if(d>c)break;var y=f.transferSize,S=f.initiatorType;y&&Gs(S)&&(f=f.responseEnd,i+=y*(f<c?1:(c-d)/(f-d)))}if(--u,t+=8*(n+i)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var Qc=null,Zc=null;function Cn(l){return l.nodeType===9?l:l.ownerDocument}function Xs(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function N1(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function jc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Ii=null;function Ay(){var l=window.event;return l&&l.type==="popstate"?l===Ii?!1:(Ii=l,!0):(Ii=null,!1)}var U1=typeof setTimeout=="function"?setTimeout:void 0,_y=typeof clearTimeout=="function"?clearTimeout:void 0,Qs=typeof Promise=="function"?Promise:void 0,My=typeof queueMicrotask=="function"?queueMicrotask:typeof Qs!="undefined"?function(l){return Qs.resolve(null).then(l).catch(Oy)}:U1;function Oy(l){setTimeout(function(){throw l})}function ea(l){return l==="head"}function Zs(l,t){var a=t,u=0;do{var e=a.nextSibling;if(l.removeChild(a),e&&e.nodeType===8)if(a=e.data,a==="/$"||a==="/&"){if(u===0){l.removeChild(e),du(t);return}u--}else if(a==="$"||a==="$?"||a==="$~"||a==="$!"||a==="&")u++;else if(a==="html")ku(l.ownerDocument.documentElement);else if(a==="head"){a=l.ownerDocument.head,ku(a);for(var n=a.firstChild;n;){var i=n.nextSibling,c=n.nodeName;n[he]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||a.removeChild(n),n=i}}else a==="body"&&ku(l.ownerDocument.body);a=e}while(a);du(t)}function js(l,t){var a=l;l=0;do{var u=a.nextSibling;if(a.nodeType===1?t?(a._stashedDisplay=a.style.display,a.style.display="none"):(a.style.display=a._stashedDisplay||"",a.getAttribute("style")===""&&a.removeAttribute("style")):a.nodeType===3&&(t?(a._stashedText=a.nodeValue,a.nodeValue=""):a.nodeValue=a._stashedText||""),u&&u.nodeType===8)if(a=u.data,a==="/$"){if(l===0)break;l--}else a!=="$"&&a!=="$?"&&a!=="$~"&&a!=="$!"||l++;a=u}while(a)}function Lc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var a=t;switch(t=t.nextSibling,a.nodeName){case"HTML":case"HEAD":case"BODY":Lc(a),lf(a);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(a.rel.toLowerCase()==="stylesheet")continue}l.removeChild(a)}}function Dy(l,t,a,u){for(;l.nodeType===1;){var e=a;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!u&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(u){if(!l[he])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=kl(l.nextSibling),l===null)break}return null}function Ny(l,t,a){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!a||(l=kl(l.nextSibling),l===null))return null;return l}function H1(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=kl(l.nextSibling),l===null))return null;return l}function Vc(l){return l.data==="$?"||l.data==="$~"}function Kc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Uy(l,t){var a=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||a.readyState!=="loading")t();else{var u=function(){t(),a.removeEventListener("DOMContentLoaded",u)};a.addEventListener("DOMContentLoaded",u),l._reactRetry=u}}function kl(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var Jc=null;function Ls(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="/$"||a==="/&"){if(t===0)return kl(l.nextSibling);t--}else a!=="$"&&a!=="$!"&&a!=="$?"&&a!=="$~"&&a!=="&"||t++}l=l.nextSibling}return null}function Vs(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="$"||a==="$!"||a==="$?"||a==="$~"||a==="&"){if(t===0)return l;t--}else a!=="/$"&&a!=="/&"||t++}l=l.previousSibling}return null}function R1(l,t,a){switch(t=Cn(a),l){case"html":if(l=t.documentElement,!l)throw Error(b(452));return l;case"head":if(l=t.head,!l)throw Error(b(453));return l;case"body":if(l=t.body,!l)throw Error(b(454));return l;default:throw Error(b(451))}}function ku(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);lf(l)}var Fl=new Map,Ks=new Set;function xn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var Nt=Q.d;Q.d={f:Hy,r:Ry,D:Cy,C:xy,L:By,m:qy,X:Gy,S:Yy,M:Xy};function Hy(){var l=Nt.f(),t=Fn();return l||t}function Ry(l){var t=vu(l);t!==null&&t.tag===5&&t.type==="form"?_d(t):Nt.r(l)}var Su=typeof document=="undefined"?null:document;function C1(l,t,a){var u=Su;if(u&&typeof t=="string"&&t){var e=Jl(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof a=="string"&&(e+='[crossorigin="'+a+'"]'),Ks.has(e)||(Ks.add(e),l={rel:l,crossOrigin:a,href:t},u.querySelector(e)===null&&(t=u.createElement("link"),rl(t,"link",l),vl(t),u.head.appendChild(t)))}}function Cy(l){Nt.D(l),C1("dns-prefetch",l,null)}function xy(l,t){Nt.C(l,t),C1("preconnect",l,t)}function By(l,t,a){Nt.L(l,t,a);var u=Su;if(u&&l&&t){var e='link[rel="preload"][as="'+Jl(t)+'"]';t==="image"&&a&&a.imageSrcSet?(e+='[imagesrcset="'+Jl(a.imageSrcSet)+'"]',typeof a.imageSizes=="string"&&(e+='[imagesizes="'+Jl(a.imageSizes)+'"]')):e+='[href="'+Jl(l)+'"]';var n=e;switch(t){case"style":n=ou(l);break;case"script":n=bu(l)}Fl.has(n)||(l=I({rel:"preload",href:t==="image"&&a&&a.imageSrcSet?void 0:l,as:t},a),Fl.set(n,l),u.querySelector(e)!==null||t==="style"&&u.querySelector(pe(n))||t==="script"&&u.querySelector(Te(n))||(t=u.createElement("link"),rl(t,"link",l),vl(t),u.head.appendChild(t)))}}function qy(l,t){Nt.m(l,t);var a=Su;if(a&&l){var u=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+Jl(u)+'"][href="'+Jl(l)+'"]',n=e;switch(u){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=bu(l)}if(!Fl.has(n)&&(l=I({rel:"modulepreload",href:l},t),Fl.set(n,l),a.querySelector(e)===null)){switch(u){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(a.querySelector(Te(n)))return}u=a.createElement("link"),rl(u,"link",l),vl(u),a.head.appendChild(u)}}}function Yy(l,t,a){Nt.S(l,t,a);var u=Su;if(u&&l){var e=Wa(u).hoistableStyles,n=ou(l);t=t||"default";var i=e.get(n);if(!i){var c={loading:0,preload:null};if(i=u.querySelector(pe(n)))c.loading=5;else{l=I({rel:"stylesheet",href:l,"data-precedence":t},a),(a=Fl.get(n))&&Qf(l,a);var f=i=u.createElement("link");vl(f),rl(f,"link",l),f._p=new Promise(function(d,y){f.onload=d,f.onerror=y}),f.addEventListener("load",function(){c.loading|=1}),f.addEventListener("error",function(){c.loading|=2}),c.loading|=4,nn(i,t,u)}i={type:"stylesheet",instance:i,count:1,state:c},e.set(n,i)}}}function Gy(l,t){Nt.X(l,t);var a=Su;if(a&&l){var u=Wa(a).hoistableScripts,e=bu(l),n=u.get(e);n||(n=a.querySelector(Te(e)),n||(l=I({src:l,async:!0},t),(t=Fl.get(e))&&Zf(l,t),n=a.createElement("script"),vl(n),rl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},u.set(e,n))}}function Xy(l,t){Nt.M(l,t);var a=Su;if(a&&l){var u=Wa(a).hoistableScripts,e=bu(l),n=u.get(e);n||(n=a.querySelector(Te(e)),n||(l=I({src:l,async:!0,type:"module"},t),(t=Fl.get(e))&&Zf(l,t),n=a.createElement("script"),vl(n),rl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},u.set(e,n))}}function Js(l,t,a,u){var e=(e=Vt.current)?xn(e):null;if(!e)throw Error(b(446));switch(l){case"meta":case"title":return null;case"style":return typeof a.precedence=="string"&&typeof a.href=="string"?(t=ou(a.href),a=Wa(e).hoistableStyles,u=a.get(t),u||(u={type:"style",instance:null,count:0,state:null},a.set(t,u)),u):{type:"void",instance:null,count:0,state:null};case"link":if(a.rel==="stylesheet"&&typeof a.href=="string"&&typeof a.precedence=="string"){l=ou(a.href);var n=Wa(e).hoistableStyles,i=n.get(l);if(i||(e=e.ownerDocument||e,i={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,i),(n=e.querySelector(pe(l)))&&!n._p&&(i.instance=n,i.state.loading=5),Fl.has(l)||(a={rel:"preload",as:"style",href:a.href,crossOrigin:a.crossOrigin,integrity:a.integrity,media:a.media,hrefLang:a.hrefLang,referrerPolicy:a.referrerPolicy},Fl.set(l,a),n||Qy(e,l,a,i.state))),t&&u===null)throw Error(b(528,""));return i}if(t&&u!==null)throw Error(b(529,""));return null;case"script":return t=a.async,a=a.src,typeof a=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=bu(a),a=Wa(e).hoistableScripts,u=a.get(t),u||(u={type:"script",instance:null,count:0,state:null},a.set(t,u)),u):{type:"void",instance:null,count:0,state:null};default:throw Error(b(444,l))}}function ou(l){return'href="'+Jl(l)+'"'}function pe(l){return'link[rel="stylesheet"]['+l+"]"}function x1(l){return I({},l,{"data-precedence":l.precedence,precedence:null})}function Qy(l,t,a,u){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?u.loading=1:(t=l.createElement("link"),u.preload=t,t.addEventListener("load",function(){return u.loading|=1}),t.addEventListener("error",function(){return u.loading|=2}),rl(t,"link",a),vl(t),l.head.appendChild(t))}function bu(l){return'[src="'+Jl(l)+'"]'}function Te(l){return"script[async]"+l}function ws(l,t,a){if(t.count++,t.instance===null)switch(t.type){case"style":var u=l.querySelector('style[data-href~="'+Jl(a.href)+'"]');if(u)return t.instance=u,vl(u),u;var e=I({},a,{"data-href":a.href,"data-precedence":a.precedence,href:null,precedence:null});return u=(l.ownerDocument||l).createElement("style"),vl(u),rl(u,"style",e),nn(u,a.precedence,l),t.instance=u;case"stylesheet":e=ou(a.href);var n=l.querySelector(pe(e));if(n)return t.state.loading|=4,t.instance=n,vl(n),n;u=x1(a),(e=Fl.get(e))&&Qf(u,e),n=(l.ownerDocument||l).createElement("link"),vl(n);var i=n;return i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),rl(n,"link",u),t.state.loading|=4,nn(n,a.precedence,l),t.instance=n;case"script":return n=bu(a.src),(e=l.querySelector(Te(n)))?(t.instance=e,vl(e),e):(u=a,(e=Fl.get(n))&&(u=I({},a),Zf(u,e)),l=l.ownerDocument||l,e=l.createElement("script"),vl(e),rl(e,"link",u),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(b(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(u=t.instance,t.state.loading|=4,nn(u,a.precedence,l));return t.instance}function nn(l,t,a){for(var u=a.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=u.length?u[u.length-1]:null,n=e,i=0;i<u.length;i++){var c=u[i];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=a.nodeType===9?a.head:a,t.insertBefore(l,t.firstChild))}function Qf(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function Zf(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var cn=null;function Ws(l,t,a){if(cn===null){var u=new Map,e=cn=new Map;e.set(a,u)}else e=cn,u=e.get(a),u||(u=new Map,e.set(a,u));if(u.has(l))return u;for(u.set(l,null),a=a.getElementsByTagName(l),e=0;e<a.length;e++){var n=a[e];if(!(n[he]||n[gl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var i=n.getAttribute(t)||"";i=l+i;var c=u.get(i);c?c.push(n):u.set(i,[n])}}return u}function $s(l,t,a){l=l.ownerDocument||l,l.head.insertBefore(a,t==="title"?l.querySelector("head > title"):null)}function Zy(l,t,a){if(a===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function B1(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function jy(l,t,a,u){if(a.type==="stylesheet"&&(typeof u.media!="string"||matchMedia(u.media).matches!==!1)&&(a.state.loading&4)===0){if(a.instance===null){var e=ou(u.href),n=t.querySelector(pe(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Bn.bind(l),t.then(l,l)),a.state.loading|=4,a.instance=n,vl(n);return}n=t.ownerDocument||t,u=x1(u),(e=Fl.get(e))&&Qf(u,e),n=n.createElement("link"),vl(n);var i=n;i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),rl(n,"link",u),a.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(a,t),(t=a.state.preload)&&(a.state.loading&3)===0&&(l.count++,a=Bn.bind(l),t.addEventListener("load",a),t.addEventListener("error",a))}}var Pi=0;function Ly(l,t){return l.stylesheets&&l.count===0&&fn(l,l.stylesheets),0<l.count||0<l.imgCount?function(a){var u=setTimeout(function(){if(l.stylesheets&&fn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Pi===0&&(Pi=62500*Ey());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&fn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Pi?50:800)+t);return l.unsuspend=a,function(){l.unsuspend=null,clearTimeout(u),clearTimeout(e)}}:null}function Bn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)fn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var qn=null;function fn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,qn=new Map,t.forEach(Vy,l),qn=null,Bn.call(l))}function Vy(l,t){if(!(t.state.loading&4)){var a=qn.get(l);if(a)var u=a.get(null);else{a=new Map,qn.set(l,a);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var i=e[n];(i.nodeName==="LINK"||i.getAttribute("media")!=="not all")&&(a.set(i.dataset.precedence,i),u=i)}u&&a.set(null,u)}e=t.instance,i=e.getAttribute("data-precedence"),n=a.get(i)||u,n===u&&a.set(null,e),a.set(i,e),this.count++,u=Bn.bind(this),e.addEventListener("load",u),e.addEventListener("error",u),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var fe={$$typeof:bt,Provider:null,Consumer:null,_currentValue:ma,_currentValue2:ma,_threadCount:0};function Ky(l,t,a,u,e,n,i,c,f){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=_i(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=_i(0),this.hiddenUpdates=_i(null),this.identifierPrefix=u,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function q1(l,t,a,u,e,n,i,c,f,d,y,S){return l=new Ky(l,t,a,i,f,d,y,S,c),t=1,n===!0&&(t|=24),n=Cl(3,null,null,t),l.current=n,n.stateNode=l,t=vf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:u,isDehydrated:a,cache:t},gf(n),l}function Y1(l){return l?(l=Va,l):Va}function G1(l,t,a,u,e,n){e=Y1(e),u.context===null?u.context=e:u.pendingContext=e,u=Jt(t),u.payload={element:a},n=n===void 0?null:n,n!==null&&(u.callback=n),a=wt(l,u,t),a!==null&&(Dl(a,l,t),ju(a,l,t))}function ks(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var a=l.retryLane;l.retryLane=a!==0&&a<t?a:t}}function jf(l,t){ks(l,t),(l=l.alternate)&&ks(l,t)}function X1(l){if(l.tag===13||l.tag===31){var t=_a(l,67108864);t!==null&&Dl(t,l,67108864),jf(l,67108864)}}function Fs(l){if(l.tag===13||l.tag===31){var t=Gl();t=Ic(t);var a=_a(l,t);a!==null&&Dl(a,l,t),jf(l,t)}}var Yn=!0;function Jy(l,t,a,u){var e=O.T;O.T=null;var n=Q.p;try{Q.p=2,Lf(l,t,a,u)}finally{Q.p=n,O.T=e}}function wy(l,t,a,u){var e=O.T;O.T=null;var n=Q.p;try{Q.p=8,Lf(l,t,a,u)}finally{Q.p=n,O.T=e}}function Lf(l,t,a,u){if(Yn){var e=wc(u);if(e===null)Fi(l,t,u,Gn,a),Is(l,u);else if($y(e,l,t,a,u))u.stopPropagation();else if(Is(l,u),t&4&&-1<Wy.indexOf(l)){for(;e!==null;){var n=vu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var i=sa(n.pendingLanes);if(i!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;i;){var f=1<<31-Yl(i);c.entanglements[1]|=f,i&=~f}ft(n),(X&6)===0&&(On=Bl()+500,ze(0,!1))}}break;case 31:case 13:c=_a(n,2),c!==null&&Dl(c,n,2),Fn(),jf(n,2)}if(n=wc(u),n===null&&Fi(l,t,u,Gn,a),n===e)break;e=n}e!==null&&u.stopPropagation()}else Fi(l,t,u,null,a)}}function wc(l){return l=af(l),Vf(l)}var Gn=null;function Vf(l){if(Gn=null,l=Ga(l),l!==null){var t=de(l);if(t===null)l=null;else{var a=t.tag;if(a===13){if(l=eo(t),l!==null)return l;l=null}else if(a===31){if(l=no(t),l!==null)return l;l=null}else if(a===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Gn=l,null}function Q1(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Bm()){case so:return 2;case oo:return 8;case vn:case qm:return 32;case mo:return 268435456;default:return 32}default:return 32}}var Wc=!1,kt=null,Ft=null,It=null,se=new Map,oe=new Map,Gt=[],Wy="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Is(l,t){switch(l){case"focusin":case"focusout":kt=null;break;case"dragenter":case"dragleave":Ft=null;break;case"mouseover":case"mouseout":It=null;break;case"pointerover":case"pointerout":se.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":oe.delete(t.pointerId)}}function Hu(l,t,a,u,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:a,eventSystemFlags:u,nativeEvent:n,targetContainers:[e]},t!==null&&(t=vu(t),t!==null&&X1(t)),l):(l.eventSystemFlags|=u,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function $y(l,t,a,u,e){switch(t){case"focusin":return kt=Hu(kt,l,t,a,u,e),!0;case"dragenter":return Ft=Hu(Ft,l,t,a,u,e),!0;case"mouseover":return It=Hu(It,l,t,a,u,e),!0;case"pointerover":var n=e.pointerId;return se.set(n,Hu(se.get(n)||null,l,t,a,u,e)),!0;case"gotpointercapture":return n=e.pointerId,oe.set(n,Hu(oe.get(n)||null,l,t,a,u,e)),!0}return!1}function Z1(l){var t=Ga(l.target);if(t!==null){var a=de(t);if(a!==null){if(t=a.tag,t===13){if(t=eo(a),t!==null){l.blockedOn=t,B0(l.priority,function(){Fs(a)});return}}else if(t===31){if(t=no(a),t!==null){l.blockedOn=t,B0(l.priority,function(){Fs(a)});return}}else if(t===3&&a.stateNode.current.memoizedState.isDehydrated){l.blockedOn=a.tag===3?a.stateNode.containerInfo:null;return}}}l.blockedOn=null}function sn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var a=wc(l.nativeEvent);if(a===null){a=l.nativeEvent;var u=new a.constructor(a.type,a);mc=u,a.target.dispatchEvent(u),mc=null}else return t=vu(a),t!==null&&X1(t),l.blockedOn=a,!1;t.shift()}return!0}function Ps(l,t,a){sn(l)&&a.delete(t)}function ky(){Wc=!1,kt!==null&&sn(kt)&&(kt=null),Ft!==null&&sn(Ft)&&(Ft=null),It!==null&&sn(It)&&(It=null),se.forEach(Ps),oe.forEach(Ps)}function Je(l,t){l.blockedOn===t&&(l.blockedOn=null,Wc||(Wc=!0,dl.unstable_scheduleCallback(dl.unstable_NormalPriority,ky)))}var we=null;function lo(l){we!==l&&(we=l,dl.unstable_scheduleCallback(dl.unstable_NormalPriority,function(){we===l&&(we=null);for(var t=0;t<l.length;t+=3){var a=l[t],u=l[t+1],e=l[t+2];if(typeof u!="function"){if(Vf(u||a)===null)continue;break}var n=vu(a);n!==null&&(l.splice(t,3),t-=3,Dc(n,{pending:!0,data:e,method:a.method,action:u},u,e))}}))}function du(l){function t(f){return Je(f,l)}kt!==null&&Je(kt,l),Ft!==null&&Je(Ft,l),It!==null&&Je(It,l),se.forEach(t),oe.forEach(t);for(var a=0;a<Gt.length;a++){var u=Gt[a];u.blockedOn===l&&(u.blockedOn=null)}for(;0<Gt.length&&(a=Gt[0],a.blockedOn===null);)Z1(a),a.blockedOn===null&&Gt.shift();if(a=(l.ownerDocument||l).$$reactFormReplay,a!=null)for(u=0;u<a.length;u+=3){var e=a[u],n=a[u+1],i=e[Nl]||null;if(typeof n=="function")i||lo(a);else if(i){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,i=n[Nl]||null)c=i.formAction;else if(Vf(e)!==null)continue}else c=i.action;typeof c=="function"?a[u+1]=c:(a.splice(u,3),u-=3),lo(a)}}}function j1(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(i){return e=i})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),u||setTimeout(a,20)}function a(){if(!u&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var u=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(a,100),function(){u=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function Kf(l){this._internalRoot=l}li.prototype.render=Kf.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(b(409));var a=t.current,u=Gl();G1(a,u,l,t,null,null)};li.prototype.unmount=Kf.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;G1(l.current,2,null,l,null,null),Fn(),t[mu]=null}};function li(l){this._internalRoot=l}li.prototype.unstable_scheduleHydration=function(l){if(l){var t=So();l={blockedOn:null,target:l,priority:t};for(var a=0;a<Gt.length&&t!==0&&t<Gt[a].priority;a++);Gt.splice(a,0,l),a===0&&Z1(l)}};var to=ao.version;if(to!=="19.2.3")throw Error(b(527,to,"19.2.3"));Q.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(b(188)):(l=Object.keys(l).join(","),Error(b(268,l)));return l=Dm(t),l=l!==null?io(l):null,l=l===null?null:l.stateNode,l};var Fy={bundleType:0,version:"19.2.3",rendererPackageName:"react-dom",currentDispatcherRef:O,reconcilerVersion:"19.2.3"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__!="undefined"&&(Ru=__REACT_DEVTOOLS_GLOBAL_HOOK__,!Ru.isDisabled&&Ru.supportsFiber))try{me=Ru.inject(Fy),ql=Ru}catch(l){}var Ru;ti.createRoot=function(l,t){if(!uo(l))throw Error(b(299));var a=!1,u="",e=Cd,n=xd,i=Bd;return t!=null&&(t.unstable_strictMode===!0&&(a=!0),t.identifierPrefix!==void 0&&(u=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(i=t.onRecoverableError)),t=q1(l,1,!1,null,null,a,u,null,e,n,i,j1),l[mu]=t.current,Xf(l),new Kf(t)};ti.hydrateRoot=function(l,t,a){if(!uo(l))throw Error(b(299));var u=!1,e="",n=Cd,i=xd,c=Bd,f=null;return a!=null&&(a.unstable_strictMode===!0&&(u=!0),a.identifierPrefix!==void 0&&(e=a.identifierPrefix),a.onUncaughtError!==void 0&&(n=a.onUncaughtError),a.onCaughtError!==void 0&&(i=a.onCaughtError),a.onRecoverableError!==void 0&&(c=a.onRecoverableError),a.formState!==void 0&&(f=a.formState)),t=q1(l,1,!0,t,a!=null?a:null,u,e,f,n,i,c,j1),t.context=Y1(null),a=t.current,u=Gl(),u=Ic(u),e=Jt(u),e.callback=null,wt(a,e,u),a=u,t.current.lanes=a,ye(t,a),ft(t),l[mu]=t.current,Xf(l),new li(t)};ti.version="19.2.3"});var J1=Ut((ch,K1)=>{"use strict";function V1(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__=="undefined"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(V1)}catch(l){console.error(l)}}V1(),K1.exports=L1()});var w1=ni(pu());var r=ni(pu());var Tm=()=>{var $f,kf;let[l,t]=r.useState([]),[a,u]=r.useState(!0),[e,n]=r.useState(!1),[i,c]=r.useState("Jeddah"),[f,d]=r.useState([]),[y,S]=r.useState(null),[v,h]=r.useState(!1),[p,M]=r.useState(!1),G=r.useRef(null),o=r.useRef(null),s=r.useRef([]),m=r.useRef(new Map),g=[{name:"Jeddah",coordinates:{lat:21.4858,lon:39.1925}},{name:"Dammam",coordinates:{lat:26.3927,lon:50.1059}},{name:"Yanbu",coordinates:{lat:24.0896,lon:38.0618}},{name:"Jizan",coordinates:{lat:16.8892,lon:42.5511}},{name:"Jubail",coordinates:{lat:27.0174,lon:49.659}},{name:"Rabigh",coordinates:{lat:22.7981,lon:39.0367}}];r.useEffect(()=>{B(),_();let z=setTimeout(()=>{ui()},500);return()=>{clearTimeout(z),frappe.realtime.off("ais_stream"),o.current&&(m.current.clear(),s.current=[],o.current.remove())}},[]),r.useEffect(()=>{tt()},[i,l]),r.useEffect(()=>{o.current&&l.length>0&&k1()},[l]);let _=async()=>{try{console.log("Loading existing vessel data from database...");let z=await frappe.call({method:"vessel_tracker.vessel_tracker.api.live_vessels.get_live_vessels"});if(z.message&&z.message.vessels){let A=z.message.vessels.map(T=>({mmsi:T.ais_mmsi,vessel_name:T.vessel_name,latitude:T.ais_last_position_lat,longitude:T.ais_last_position_lon,speed:T.ais_speed||0,course:T.ais_course||0,status:T.ais_status||"Unknown",timestamp:T.ais_last_update,vessel_type:T.vessel_type}));console.log(`Loaded ${A.length} vessels from database`),t(T=>[...T,...A])}}catch(z){console.error("Error loading existing vessels:",z)}},B=()=>{console.log("\u{1F50C} Connecting to Frappe Realtime..."),u(!0);try{frappe.realtime.on("ais_stream",z=>{try{if(console.log("Received AIS data:",z),z.MessageType==="PositionReport"){let A=z.Message.PositionReport;E(A,"position")}else if(z.MessageType==="ShipStaticData"){let A=z.Message.ShipStaticData;E(A,"static")}}catch(A){console.error("AIS data parse error:",A)}}),console.log("\u2705 Connected to Frappe Realtime AIS Stream"),n(!0),u(!1)}catch(z){console.error("Realtime connection error:",z),n(!1),u(!1)}},E=(z,A)=>{var P;let T=(P=z.UserID)==null?void 0:P.toString();if(console.log("Processing vessel data:",{type:A,mmsi:T,latitude:z.Latitude,longitude:z.Longitude,hasPosition:!!(z.Latitude&&z.Longitude)}),!T){console.log("\u26A0\uFE0F No MMSI found in vessel data");return}t(ru=>{var zu,Ee,Ff;let na=ru.findIndex(st=>st.mmsi===T),ia={};if(A==="position"){if(!z.Latitude||!z.Longitude)return console.log(`\u26A0\uFE0F Vessel ${T} missing coordinates:`,{lat:z.Latitude,lon:z.Longitude}),ru;(z.Latitude<12||z.Latitude>35||z.Longitude<32||z.Longitude>55)&&console.log(`\u26A0\uFE0F Vessel ${T} coordinates outside expected area:`,{lat:z.Latitude,lon:z.Longitude}),ia={mmsi:T,latitude:z.Latitude,longitude:z.Longitude,speed:z.Sog||0,course:z.Cog||0,status:D(z.NavigationalStatus||15),timestamp:new Date().toISOString(),heading:z.TrueHeading||0}}else A==="static"&&(ia={mmsi:T,vessel_name:((zu=z.VesselName)==null?void 0:zu.trim())||"",call_sign:((Ee=z.CallSign)==null?void 0:Ee.trim())||"",imo_number:z.ImoNumber,destination:((Ff=z.Destination)==null?void 0:Ff.trim())||"",vessel_type:H(z.Type||0)});if(na>=0){let st=[...ru];return st[na]=Ae(Ae({},st[na]),ia),console.log(`\u{1F504} Updated existing vessel ${T}:`,st[na]),st}else{let st=Ae({},ia);return console.log(`\u{1F195} Added new vessel ${T}:`,st),[...ru,st]}}),console.log(`\u{1F4CD} Updated vessel ${T} (${A})`)},D=z=>({0:"Under way using engine",1:"At anchor",2:"Not under command",3:"Restricted manoeuvrability",4:"Constrained by her draught",5:"Moored",6:"Aground",7:"Engaged in Fishing",8:"Under way sailing",15:"Default"})[z]||"Unknown",H=z=>30<=z&&z<=32?"Fishing":60<=z&&z<=69?"Passenger":70<=z&&z<=79?"Cargo":80<=z&&z<=89?"Tanker":"Other",Y=(z,A,T,P)=>{let na=(T-z)*Math.PI/180,ia=(P-A)*Math.PI/180,zu=Math.sin(na/2)*Math.sin(na/2)+Math.cos(z*Math.PI/180)*Math.cos(T*Math.PI/180)*Math.sin(ia/2)*Math.sin(ia/2),Ee=2*Math.atan2(Math.sqrt(zu),Math.sqrt(1-zu));return 6371*Ee},tt=()=>{let z=g.find(T=>T.name===i);if(!z||l.length===0){d([]);return}let A=l.filter(T=>{if(!T.latitude||!T.longitude)return!1;let P=Y(z.coordinates.lat,z.coordinates.lon,T.latitude,T.longitude);return P<=100?(T.distance_to_port=Math.round(P*10)/10,!0):!1}).sort((T,P)=>(T.distance_to_port||0)-(P.distance_to_port||0));d(A.slice(0,20))},ui=async()=>{if(!G.current){console.log("Map ref not available");return}try{console.log("Initializing map..."),typeof L=="undefined"&&(console.log("Loading Leaflet library..."),await $1()),o.current&&o.current.remove();let z=[24.7136,46.6753];o.current=L.map(G.current,{center:z,zoom:6,attributionControl:!0,zoomControl:!0}),console.log("Map instance created");let A=L.tileLayer("https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png",{attribution:"\xA9 OpenStreetMap contributors",maxZoom:18,errorTileUrl:"data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMjU2IiBoZWlnaHQ9IjI1NiIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48cmVjdCB3aWR0aD0iMjU2IiBoZWlnaHQ9IjI1NiIgZmlsbD0iI2VlZWVlZSIvPjx0ZXh0IHg9IjUwJSIgeT0iNTAlIiBkb21pbmFudC1iYXNlbGluZT0iY2VudHJhbCIgdGV4dC1hbmNob3I9Im1pZGRsZSIgZm9udC1zaXplPSIxOCIgZm9udC1mYW1pbHk9Im1vbm9zcGFjZSIgZmlsbD0iIzk5OTk5OSI+Tm8gVGlsZTwvdGV4dD48L3N2Zz4K"});A.on("loading",()=>console.log("Tiles loading...")),A.on("load",()=>console.log("Tiles loaded")),A.on("tileerror",T=>console.error("Tile error:",T)),A.addTo(o.current),console.log("Adding port markers..."),g.forEach(T=>{L.marker([T.coordinates.lat,T.coordinates.lon],{icon:L.divIcon({className:"port-marker",html:'<div style="background: #dc2626; width: 12px; height: 12px; border-radius: 50%; border: 2px solid white;"></div>',iconSize:[16,16],iconAnchor:[8,8]})}).addTo(o.current).bindPopup(`<b>${T.name} Port</b>`)}),console.log("Map initialization complete"),h(!0)}catch(z){console.error("Error initializing map:",z),h(!1)}},$1=()=>new Promise((z,A)=>{if(console.log("Loading Leaflet resources..."),!document.querySelector('link[href*="leaflet.css"]')){let T=document.createElement("link");T.rel="stylesheet",T.href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css",T.integrity="sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=",T.crossOrigin="",document.head.appendChild(T),console.log("Leaflet CSS loaded")}if(document.querySelector('script[src*="leaflet.js"]'))typeof L!="undefined"?(console.log("Leaflet already available"),z()):(console.log("Waiting for existing Leaflet to load..."),setTimeout(()=>{typeof L!="undefined"?z():A(new Error("Leaflet failed to load"))},1e3));else{let T=document.createElement("script");T.src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js",T.integrity="sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=",T.crossOrigin="",T.onload=()=>{console.log("Leaflet JS loaded successfully"),setTimeout(z,100)},T.onerror=P=>{console.error("Failed to load Leaflet JS:",P),A(P)},document.head.appendChild(T)}}),k1=()=>{if(!o.current)return;let z=new Set(l.filter(A=>A.latitude&&A.longitude).map(A=>A.mmsi));m.current.forEach((A,T)=>{if(!z.has(T)){o.current.removeLayer(A),m.current.delete(T);let P=s.current.indexOf(A);P>-1&&s.current.splice(P,1)}}),l.forEach(A=>{if(A.latitude&&A.longitude){let T=m.current.get(A.mmsi);if(T)T.setLatLng([A.latitude,A.longitude]),T.setIcon(L.divIcon({className:"vessel-marker",html:Jf(A),iconSize:[20,20],iconAnchor:[10,10]})),T.getPopup().setContent(wf(A));else{let P=L.marker([A.latitude,A.longitude],{icon:L.divIcon({className:"vessel-marker",html:Jf(A),iconSize:[20,20],iconAnchor:[10,10]})}).addTo(o.current);P.bindPopup(wf(A),{closeButton:!0,autoClose:!1,closeOnEscapeKey:!0,closeOnClick:!1}),P.on("click",()=>{S(A)}),m.current.set(A.mmsi,P),s.current.push(P)}}}),console.log(`\u{1F5FA}\uFE0F Map updated: ${l.length} vessels, ${m.current.size} markers`)},Jf=z=>{let A={"Under way using engine":"#3b82f6","At anchor":"#10b981",Moored:"#8b5cf6","Not under command":"#ef4444",Default:"#6b7280"};return`
+`).replace(py,"")}function D1(l,t){return t=Ys(t),Ys(l)===t}function V(l,t,a,u,e,n){switch(a){case"children":typeof u=="string"?t==="body"||t==="textarea"&&u===""||uu(l,u):(typeof u=="number"||typeof u=="bigint")&&t!=="body"&&uu(l,""+u);break;case"className":xe(l,"class",u);break;case"tabIndex":xe(l,"tabindex",u);break;case"dir":case"role":case"viewBox":case"width":case"height":xe(l,a,u);break;case"style":_o(l,u,n);break;case"data":if(t!=="object"){xe(l,"data",u);break}case"src":case"href":if(u===""&&(t!=="a"||a!=="href")){l.removeAttribute(a);break}if(u==null||typeof u=="function"||typeof u=="symbol"||typeof u=="boolean"){l.removeAttribute(a);break}u=$e(""+u),l.setAttribute(a,u);break;case"action":case"formAction":if(typeof u=="function"){l.setAttribute(a,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(a==="formAction"?(t!=="input"&&V(l,t,"name",e.name,e,null),V(l,t,"formEncType",e.formEncType,e,null),V(l,t,"formMethod",e.formMethod,e,null),V(l,t,"formTarget",e.formTarget,e,null)):(V(l,t,"encType",e.encType,e,null),V(l,t,"method",e.method,e,null),V(l,t,"target",e.target,e,null)));if(u==null||typeof u=="symbol"||typeof u=="boolean"){l.removeAttribute(a);break}u=$e(""+u),l.setAttribute(a,u);break;case"onClick":u!=null&&(l.onclick=rt);break;case"onScroll":u!=null&&R("scroll",l);break;case"onScrollEnd":u!=null&&R("scrollend",l);break;case"dangerouslySetInnerHTML":if(u!=null){if(typeof u!="object"||!("__html"in u))throw Error(b(61));if(a=u.__html,a!=null){if(e.children!=null)throw Error(b(60));l.innerHTML=a}}break;case"multiple":l.multiple=u&&typeof u!="function"&&typeof u!="symbol";break;case"muted":l.muted=u&&typeof u!="function"&&typeof u!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(u==null||typeof u=="function"||typeof u=="boolean"||typeof u=="symbol"){l.removeAttribute("xlink:href");break}a=$e(""+u),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",a);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":u!=null&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,""+u):l.removeAttribute(a);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":u&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,""):l.removeAttribute(a);break;case"capture":case"download":u===!0?l.setAttribute(a,""):u!==!1&&u!=null&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,u):l.removeAttribute(a);break;case"cols":case"rows":case"size":case"span":u!=null&&typeof u!="function"&&typeof u!="symbol"&&!isNaN(u)&&1<=u?l.setAttribute(a,u):l.removeAttribute(a);break;case"rowSpan":case"start":u==null||typeof u=="function"||typeof u=="symbol"||isNaN(u)?l.removeAttribute(a):l.setAttribute(a,u);break;case"popover":R("beforetoggle",l),R("toggle",l),We(l,"popover",u);break;case"xlinkActuate":dt(l,"http://www.w3.org/1999/xlink","xlink:actuate",u);break;case"xlinkArcrole":dt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",u);break;case"xlinkRole":dt(l,"http://www.w3.org/1999/xlink","xlink:role",u);break;case"xlinkShow":dt(l,"http://www.w3.org/1999/xlink","xlink:show",u);break;case"xlinkTitle":dt(l,"http://www.w3.org/1999/xlink","xlink:title",u);break;case"xlinkType":dt(l,"http://www.w3.org/1999/xlink","xlink:type",u);break;case"xmlBase":dt(l,"http://www.w3.org/XML/1998/namespace","xml:base",u);break;case"xmlLang":dt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",u);break;case"xmlSpace":dt(l,"http://www.w3.org/XML/1998/namespace","xml:space",u);break;case"is":We(l,"is",u);break;case"innerText":case"textContent":break;default:(!(2<a.length)||a[0]!=="o"&&a[0]!=="O"||a[1]!=="n"&&a[1]!=="N")&&(a=Fm.get(a)||a,We(l,a,u))}}function Xc(l,t,a,u,e,n){switch(a){case"style":_o(l,u,n);break;case"dangerouslySetInnerHTML":if(u!=null){if(typeof u!="object"||!("__html"in u))throw Error(b(61));if(a=u.__html,a!=null){if(e.children!=null)throw Error(b(60));l.innerHTML=a}}break;case"children":typeof u=="string"?uu(l,u):(typeof u=="number"||typeof u=="bigint")&&uu(l,""+u);break;case"onScroll":u!=null&&R("scroll",l);break;case"onScrollEnd":u!=null&&R("scrollend",l);break;case"onClick":u!=null&&(l.onclick=rt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!ro.hasOwnProperty(a))l:{if(a[0]==="o"&&a[1]==="n"&&(e=a.endsWith("Capture"),t=a.slice(2,e?a.length-7:void 0),n=l[Nl]||null,n=n!=null?n[a]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof u=="function")){typeof n!="function"&&n!==null&&(a in l?l[a]=null:l.hasAttribute(a)&&l.removeAttribute(a)),l.addEventListener(t,u,e);break l}a in l?l[a]=u:u===!0?l.setAttribute(a,""):We(l,a,u)}}}function rl(l,t,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":R("error",l),R("load",l);var u=!1,e=!1,n;for(n in a)if(a.hasOwnProperty(n)){var i=a[n];if(i!=null)switch(n){case"src":u=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(b(137,t));default:V(l,t,n,i,a,null)}}e&&V(l,t,"srcSet",a.srcSet,a,null),u&&V(l,t,"src",a.src,a,null);return;case"input":R("invalid",l);var c=n=i=e=null,f=null,d=null;for(u in a)if(a.hasOwnProperty(u)){var y=a[u];if(y!=null)switch(u){case"name":e=y;break;case"type":i=y;break;case"checked":f=y;break;case"defaultChecked":d=y;break;case"value":n=y;break;case"defaultValue":c=y;break;case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(b(137,t));break;default:V(l,t,u,y,a,null)}}To(l,n,c,f,d,i,e,!1);return;case"select":R("invalid",l),u=i=n=null;for(e in a)if(a.hasOwnProperty(e)&&(c=a[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":i=c;break;case"multiple":u=c;default:V(l,t,e,c,a,null)}t=n,a=i,l.multiple=!!u,t!=null?$a(l,!!u,t,!1):a!=null&&$a(l,!!u,a,!0);return;case"textarea":R("invalid",l),n=e=u=null;for(i in a)if(a.hasOwnProperty(i)&&(c=a[i],c!=null))switch(i){case"value":u=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(b(91));break;default:V(l,t,i,c,a,null)}Ao(l,u,e,n);return;case"option":for(f in a)if(a.hasOwnProperty(f)&&(u=a[f],u!=null))switch(f){case"selected":l.selected=u&&typeof u!="function"&&typeof u!="symbol";break;default:V(l,t,f,u,a,null)}return;case"dialog":R("beforetoggle",l),R("toggle",l),R("cancel",l),R("close",l);break;case"iframe":case"object":R("load",l);break;case"video":case"audio":for(u=0;u<ie.length;u++)R(ie[u],l);break;case"image":R("error",l),R("load",l);break;case"details":R("toggle",l);break;case"embed":case"source":case"link":R("error",l),R("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(d in a)if(a.hasOwnProperty(d)&&(u=a[d],u!=null))switch(d){case"children":case"dangerouslySetInnerHTML":throw Error(b(137,t));default:V(l,t,d,u,a,null)}return;default:if(tf(t)){for(y in a)a.hasOwnProperty(y)&&(u=a[y],u!==void 0&&Xc(l,t,y,u,a,void 0));return}}for(c in a)a.hasOwnProperty(c)&&(u=a[c],u!=null&&V(l,t,c,u,a,null))}function Ty(l,t,a,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,i=null,c=null,f=null,d=null,y=null;for(h in a){var S=a[h];if(a.hasOwnProperty(h)&&S!=null)switch(h){case"checked":break;case"value":break;case"defaultValue":f=S;default:u.hasOwnProperty(h)||V(l,t,h,null,u,S)}}for(var v in u){var h=u[v];if(S=a[v],u.hasOwnProperty(v)&&(h!=null||S!=null))switch(v){case"type":n=h;break;case"name":e=h;break;case"checked":d=h;break;case"defaultChecked":y=h;break;case"value":i=h;break;case"defaultValue":c=h;break;case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(b(137,t));break;default:h!==S&&V(l,t,v,h,u,S)}}oc(l,i,c,f,d,y,n,e);return;case"select":h=i=c=v=null;for(n in a)if(f=a[n],a.hasOwnProperty(n)&&f!=null)switch(n){case"value":break;case"multiple":h=f;default:u.hasOwnProperty(n)||V(l,t,n,null,u,f)}for(e in u)if(n=u[e],f=a[e],u.hasOwnProperty(e)&&(n!=null||f!=null))switch(e){case"value":v=n;break;case"defaultValue":c=n;break;case"multiple":i=n;default:n!==f&&V(l,t,e,n,u,f)}t=c,a=i,u=h,v!=null?$a(l,!!a,v,!1):!!u!=!!a&&(t!=null?$a(l,!!a,t,!0):$a(l,!!a,a?[]:"",!1));return;case"textarea":h=v=null;for(c in a)if(e=a[c],a.hasOwnProperty(c)&&e!=null&&!u.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:V(l,t,c,null,u,e)}for(i in u)if(e=u[i],n=a[i],u.hasOwnProperty(i)&&(e!=null||n!=null))switch(i){case"value":v=e;break;case"defaultValue":h=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(b(91));break;default:e!==n&&V(l,t,i,e,u,n)}Eo(l,v,h);return;case"option":for(var p in a)if(v=a[p],a.hasOwnProperty(p)&&v!=null&&!u.hasOwnProperty(p))switch(p){case"selected":l.selected=!1;break;default:V(l,t,p,null,u,v)}for(f in u)if(v=u[f],h=a[f],u.hasOwnProperty(f)&&v!==h&&(v!=null||h!=null))switch(f){case"selected":l.selected=v&&typeof v!="function"&&typeof v!="symbol";break;default:V(l,t,f,v,u,h)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var M in a)v=a[M],a.hasOwnProperty(M)&&v!=null&&!u.hasOwnProperty(M)&&V(l,t,M,null,u,v);for(d in u)if(v=u[d],h=a[d],u.hasOwnProperty(d)&&v!==h&&(v!=null||h!=null))switch(d){case"children":case"dangerouslySetInnerHTML":if(v!=null)throw Error(b(137,t));break;default:V(l,t,d,v,u,h)}return;default:if(tf(t)){for(var G in a)v=a[G],a.hasOwnProperty(G)&&v!==void 0&&!u.hasOwnProperty(G)&&Xc(l,t,G,void 0,u,v);for(y in u)v=u[y],h=a[y],!u.hasOwnProperty(y)||v===h||v===void 0&&h===void 0||Xc(l,t,y,v,u,h);return}}for(var o in a)v=a[o],a.hasOwnProperty(o)&&v!=null&&!u.hasOwnProperty(o)&&V(l,t,o,null,u,v);for(S in u)v=u[S],h=a[S],!u.hasOwnProperty(S)||v===h||v==null&&h==null||V(l,t,S,v,u,h)}function Gs(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Ey(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,a=performance.getEntriesByType("resource"),u=0;u<a.length;u++){var e=a[u],n=e.transferSize,i=e.initiatorType,c=e.duration;if(n&&c&&Gs(i)){for(i=0,c=e.responseEnd,u+=1;u<a.length;u++){var f=a[u],d=f.startTime;if(d>c)break;var y=f.transferSize,S=f.initiatorType;y&&Gs(S)&&(f=f.responseEnd,i+=y*(f<c?1:(c-d)/(f-d)))}if(--u,t+=8*(n+i)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var Qc=null,Zc=null;function Cn(l){return l.nodeType===9?l:l.ownerDocument}function Xs(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function N1(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function jc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Ii=null;function Ay(){var l=window.event;return l&&l.type==="popstate"?l===Ii?!1:(Ii=l,!0):(Ii=null,!1)}var U1=typeof setTimeout=="function"?setTimeout:void 0,_y=typeof clearTimeout=="function"?clearTimeout:void 0,Qs=typeof Promise=="function"?Promise:void 0,My=typeof queueMicrotask=="function"?queueMicrotask:typeof Qs!="undefined"?function(l){return Qs.resolve(null).then(l).catch(Oy)}:U1;function Oy(l){setTimeout(function(){throw l})}function ea(l){return l==="head"}function Zs(l,t){var a=t,u=0;do{var e=a.nextSibling;if(l.removeChild(a),e&&e.nodeType===8)if(a=e.data,a==="/$"||a==="/&"){if(u===0){l.removeChild(e),du(t);return}u--}else if(a==="$"||a==="$?"||a==="$~"||a==="$!"||a==="&")u++;else if(a==="html")ku(l.ownerDocument.documentElement);else if(a==="head"){a=l.ownerDocument.head,ku(a);for(var n=a.firstChild;n;){var i=n.nextSibling,c=n.nodeName;n[he]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||a.removeChild(n),n=i}}else a==="body"&&ku(l.ownerDocument.body);a=e}while(a);du(t)}function js(l,t){var a=l;l=0;do{var u=a.nextSibling;if(a.nodeType===1?t?(a._stashedDisplay=a.style.display,a.style.display="none"):(a.style.display=a._stashedDisplay||"",a.getAttribute("style")===""&&a.removeAttribute("style")):a.nodeType===3&&(t?(a._stashedText=a.nodeValue,a.nodeValue=""):a.nodeValue=a._stashedText||""),u&&u.nodeType===8)if(a=u.data,a==="/$"){if(l===0)break;l--}else a!=="$"&&a!=="$?"&&a!=="$~"&&a!=="$!"||l++;a=u}while(a)}function Lc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var a=t;switch(t=t.nextSibling,a.nodeName){case"HTML":case"HEAD":case"BODY":Lc(a),lf(a);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(a.rel.toLowerCase()==="stylesheet")continue}l.removeChild(a)}}function Dy(l,t,a,u){for(;l.nodeType===1;){var e=a;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!u&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(u){if(!l[he])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=kl(l.nextSibling),l===null)break}return null}function Ny(l,t,a){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!a||(l=kl(l.nextSibling),l===null))return null;return l}function H1(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=kl(l.nextSibling),l===null))return null;return l}function Vc(l){return l.data==="$?"||l.data==="$~"}function Kc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Uy(l,t){var a=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||a.readyState!=="loading")t();else{var u=function(){t(),a.removeEventListener("DOMContentLoaded",u)};a.addEventListener("DOMContentLoaded",u),l._reactRetry=u}}function kl(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var Jc=null;function Ls(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="/$"||a==="/&"){if(t===0)return kl(l.nextSibling);t--}else a!=="$"&&a!=="$!"&&a!=="$?"&&a!=="$~"&&a!=="&"||t++}l=l.nextSibling}return null}function Vs(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="$"||a==="$!"||a==="$?"||a==="$~"||a==="&"){if(t===0)return l;t--}else a!=="/$"&&a!=="/&"||t++}l=l.previousSibling}return null}function R1(l,t,a){switch(t=Cn(a),l){case"html":if(l=t.documentElement,!l)throw Error(b(452));return l;case"head":if(l=t.head,!l)throw Error(b(453));return l;case"body":if(l=t.body,!l)throw Error(b(454));return l;default:throw Error(b(451))}}function ku(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);lf(l)}var Fl=new Map,Ks=new Set;function xn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var Nt=Q.d;Q.d={f:Hy,r:Ry,D:Cy,C:xy,L:By,m:qy,X:Gy,S:Yy,M:Xy};function Hy(){var l=Nt.f(),t=Fn();return l||t}function Ry(l){var t=vu(l);t!==null&&t.tag===5&&t.type==="form"?_d(t):Nt.r(l)}var Su=typeof document=="undefined"?null:document;function C1(l,t,a){var u=Su;if(u&&typeof t=="string"&&t){var e=Jl(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof a=="string"&&(e+='[crossorigin="'+a+'"]'),Ks.has(e)||(Ks.add(e),l={rel:l,crossOrigin:a,href:t},u.querySelector(e)===null&&(t=u.createElement("link"),rl(t,"link",l),vl(t),u.head.appendChild(t)))}}function Cy(l){Nt.D(l),C1("dns-prefetch",l,null)}function xy(l,t){Nt.C(l,t),C1("preconnect",l,t)}function By(l,t,a){Nt.L(l,t,a);var u=Su;if(u&&l&&t){var e='link[rel="preload"][as="'+Jl(t)+'"]';t==="image"&&a&&a.imageSrcSet?(e+='[imagesrcset="'+Jl(a.imageSrcSet)+'"]',typeof a.imageSizes=="string"&&(e+='[imagesizes="'+Jl(a.imageSizes)+'"]')):e+='[href="'+Jl(l)+'"]';var n=e;switch(t){case"style":n=ou(l);break;case"script":n=bu(l)}Fl.has(n)||(l=I({rel:"preload",href:t==="image"&&a&&a.imageSrcSet?void 0:l,as:t},a),Fl.set(n,l),u.querySelector(e)!==null||t==="style"&&u.querySelector(pe(n))||t==="script"&&u.querySelector(Te(n))||(t=u.createElement("link"),rl(t,"link",l),vl(t),u.head.appendChild(t)))}}function qy(l,t){Nt.m(l,t);var a=Su;if(a&&l){var u=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+Jl(u)+'"][href="'+Jl(l)+'"]',n=e;switch(u){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=bu(l)}if(!Fl.has(n)&&(l=I({rel:"modulepreload",href:l},t),Fl.set(n,l),a.querySelector(e)===null)){switch(u){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(a.querySelector(Te(n)))return}u=a.createElement("link"),rl(u,"link",l),vl(u),a.head.appendChild(u)}}}function Yy(l,t,a){Nt.S(l,t,a);var u=Su;if(u&&l){var e=Wa(u).hoistableStyles,n=ou(l);t=t||"default";var i=e.get(n);if(!i){var c={loading:0,preload:null};if(i=u.querySelector(pe(n)))c.loading=5;else{l=I({rel:"stylesheet",href:l,"data-precedence":t},a),(a=Fl.get(n))&&Qf(l,a);var f=i=u.createElement("link");vl(f),rl(f,"link",l),f._p=new Promise(function(d,y){f.onload=d,f.onerror=y}),f.addEventListener("load",function(){c.loading|=1}),f.addEventListener("error",function(){c.loading|=2}),c.loading|=4,nn(i,t,u)}i={type:"stylesheet",instance:i,count:1,state:c},e.set(n,i)}}}function Gy(l,t){Nt.X(l,t);var a=Su;if(a&&l){var u=Wa(a).hoistableScripts,e=bu(l),n=u.get(e);n||(n=a.querySelector(Te(e)),n||(l=I({src:l,async:!0},t),(t=Fl.get(e))&&Zf(l,t),n=a.createElement("script"),vl(n),rl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},u.set(e,n))}}function Xy(l,t){Nt.M(l,t);var a=Su;if(a&&l){var u=Wa(a).hoistableScripts,e=bu(l),n=u.get(e);n||(n=a.querySelector(Te(e)),n||(l=I({src:l,async:!0,type:"module"},t),(t=Fl.get(e))&&Zf(l,t),n=a.createElement("script"),vl(n),rl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},u.set(e,n))}}function Js(l,t,a,u){var e=(e=Vt.current)?xn(e):null;if(!e)throw Error(b(446));switch(l){case"meta":case"title":return null;case"style":return typeof a.precedence=="string"&&typeof a.href=="string"?(t=ou(a.href),a=Wa(e).hoistableStyles,u=a.get(t),u||(u={type:"style",instance:null,count:0,state:null},a.set(t,u)),u):{type:"void",instance:null,count:0,state:null};case"link":if(a.rel==="stylesheet"&&typeof a.href=="string"&&typeof a.precedence=="string"){l=ou(a.href);var n=Wa(e).hoistableStyles,i=n.get(l);if(i||(e=e.ownerDocument||e,i={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,i),(n=e.querySelector(pe(l)))&&!n._p&&(i.instance=n,i.state.loading=5),Fl.has(l)||(a={rel:"preload",as:"style",href:a.href,crossOrigin:a.crossOrigin,integrity:a.integrity,media:a.media,hrefLang:a.hrefLang,referrerPolicy:a.referrerPolicy},Fl.set(l,a),n||Qy(e,l,a,i.state))),t&&u===null)throw Error(b(528,""));return i}if(t&&u!==null)throw Error(b(529,""));return null;case"script":return t=a.async,a=a.src,typeof a=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=bu(a),a=Wa(e).hoistableScripts,u=a.get(t),u||(u={type:"script",instance:null,count:0,state:null},a.set(t,u)),u):{type:"void",instance:null,count:0,state:null};default:throw Error(b(444,l))}}function ou(l){return'href="'+Jl(l)+'"'}function pe(l){return'link[rel="stylesheet"]['+l+"]"}function x1(l){return I({},l,{"data-precedence":l.precedence,precedence:null})}function Qy(l,t,a,u){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?u.loading=1:(t=l.createElement("link"),u.preload=t,t.addEventListener("load",function(){return u.loading|=1}),t.addEventListener("error",function(){return u.loading|=2}),rl(t,"link",a),vl(t),l.head.appendChild(t))}function bu(l){return'[src="'+Jl(l)+'"]'}function Te(l){return"script[async]"+l}function ws(l,t,a){if(t.count++,t.instance===null)switch(t.type){case"style":var u=l.querySelector('style[data-href~="'+Jl(a.href)+'"]');if(u)return t.instance=u,vl(u),u;var e=I({},a,{"data-href":a.href,"data-precedence":a.precedence,href:null,precedence:null});return u=(l.ownerDocument||l).createElement("style"),vl(u),rl(u,"style",e),nn(u,a.precedence,l),t.instance=u;case"stylesheet":e=ou(a.href);var n=l.querySelector(pe(e));if(n)return t.state.loading|=4,t.instance=n,vl(n),n;u=x1(a),(e=Fl.get(e))&&Qf(u,e),n=(l.ownerDocument||l).createElement("link"),vl(n);var i=n;return i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),rl(n,"link",u),t.state.loading|=4,nn(n,a.precedence,l),t.instance=n;case"script":return n=bu(a.src),(e=l.querySelector(Te(n)))?(t.instance=e,vl(e),e):(u=a,(e=Fl.get(n))&&(u=I({},a),Zf(u,e)),l=l.ownerDocument||l,e=l.createElement("script"),vl(e),rl(e,"link",u),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(b(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(u=t.instance,t.state.loading|=4,nn(u,a.precedence,l));return t.instance}function nn(l,t,a){for(var u=a.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=u.length?u[u.length-1]:null,n=e,i=0;i<u.length;i++){var c=u[i];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=a.nodeType===9?a.head:a,t.insertBefore(l,t.firstChild))}function Qf(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function Zf(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var cn=null;function Ws(l,t,a){if(cn===null){var u=new Map,e=cn=new Map;e.set(a,u)}else e=cn,u=e.get(a),u||(u=new Map,e.set(a,u));if(u.has(l))return u;for(u.set(l,null),a=a.getElementsByTagName(l),e=0;e<a.length;e++){var n=a[e];if(!(n[he]||n[gl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var i=n.getAttribute(t)||"";i=l+i;var c=u.get(i);c?c.push(n):u.set(i,[n])}}return u}function $s(l,t,a){l=l.ownerDocument||l,l.head.insertBefore(a,t==="title"?l.querySelector("head > title"):null)}function Zy(l,t,a){if(a===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function B1(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function jy(l,t,a,u){if(a.type==="stylesheet"&&(typeof u.media!="string"||matchMedia(u.media).matches!==!1)&&(a.state.loading&4)===0){if(a.instance===null){var e=ou(u.href),n=t.querySelector(pe(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Bn.bind(l),t.then(l,l)),a.state.loading|=4,a.instance=n,vl(n);return}n=t.ownerDocument||t,u=x1(u),(e=Fl.get(e))&&Qf(u,e),n=n.createElement("link"),vl(n);var i=n;i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),rl(n,"link",u),a.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(a,t),(t=a.state.preload)&&(a.state.loading&3)===0&&(l.count++,a=Bn.bind(l),t.addEventListener("load",a),t.addEventListener("error",a))}}var Pi=0;function Ly(l,t){return l.stylesheets&&l.count===0&&fn(l,l.stylesheets),0<l.count||0<l.imgCount?function(a){var u=setTimeout(function(){if(l.stylesheets&&fn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Pi===0&&(Pi=62500*Ey());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&fn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Pi?50:800)+t);return l.unsuspend=a,function(){l.unsuspend=null,clearTimeout(u),clearTimeout(e)}}:null}function Bn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)fn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var qn=null;function fn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,qn=new Map,t.forEach(Vy,l),qn=null,Bn.call(l))}function Vy(l,t){if(!(t.state.loading&4)){var a=qn.get(l);if(a)var u=a.get(null);else{a=new Map,qn.set(l,a);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var i=e[n];(i.nodeName==="LINK"||i.getAttribute("media")!=="not all")&&(a.set(i.dataset.precedence,i),u=i)}u&&a.set(null,u)}e=t.instance,i=e.getAttribute("data-precedence"),n=a.get(i)||u,n===u&&a.set(null,e),a.set(i,e),this.count++,u=Bn.bind(this),e.addEventListener("load",u),e.addEventListener("error",u),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var fe={$$typeof:bt,Provider:null,Consumer:null,_currentValue:ma,_currentValue2:ma,_threadCount:0};function Ky(l,t,a,u,e,n,i,c,f){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=_i(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=_i(0),this.hiddenUpdates=_i(null),this.identifierPrefix=u,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function q1(l,t,a,u,e,n,i,c,f,d,y,S){return l=new Ky(l,t,a,i,f,d,y,S,c),t=1,n===!0&&(t|=24),n=Cl(3,null,null,t),l.current=n,n.stateNode=l,t=vf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:u,isDehydrated:a,cache:t},gf(n),l}function Y1(l){return l?(l=Va,l):Va}function G1(l,t,a,u,e,n){e=Y1(e),u.context===null?u.context=e:u.pendingContext=e,u=Jt(t),u.payload={element:a},n=n===void 0?null:n,n!==null&&(u.callback=n),a=wt(l,u,t),a!==null&&(Dl(a,l,t),ju(a,l,t))}function ks(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var a=l.retryLane;l.retryLane=a!==0&&a<t?a:t}}function jf(l,t){ks(l,t),(l=l.alternate)&&ks(l,t)}function X1(l){if(l.tag===13||l.tag===31){var t=_a(l,67108864);t!==null&&Dl(t,l,67108864),jf(l,67108864)}}function Fs(l){if(l.tag===13||l.tag===31){var t=Gl();t=Ic(t);var a=_a(l,t);a!==null&&Dl(a,l,t),jf(l,t)}}var Yn=!0;function Jy(l,t,a,u){var e=O.T;O.T=null;var n=Q.p;try{Q.p=2,Lf(l,t,a,u)}finally{Q.p=n,O.T=e}}function wy(l,t,a,u){var e=O.T;O.T=null;var n=Q.p;try{Q.p=8,Lf(l,t,a,u)}finally{Q.p=n,O.T=e}}function Lf(l,t,a,u){if(Yn){var e=wc(u);if(e===null)Fi(l,t,u,Gn,a),Is(l,u);else if($y(e,l,t,a,u))u.stopPropagation();else if(Is(l,u),t&4&&-1<Wy.indexOf(l)){for(;e!==null;){var n=vu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var i=sa(n.pendingLanes);if(i!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;i;){var f=1<<31-Yl(i);c.entanglements[1]|=f,i&=~f}ft(n),(X&6)===0&&(On=Bl()+500,ze(0,!1))}}break;case 31:case 13:c=_a(n,2),c!==null&&Dl(c,n,2),Fn(),jf(n,2)}if(n=wc(u),n===null&&Fi(l,t,u,Gn,a),n===e)break;e=n}e!==null&&u.stopPropagation()}else Fi(l,t,u,null,a)}}function wc(l){return l=af(l),Vf(l)}var Gn=null;function Vf(l){if(Gn=null,l=Ga(l),l!==null){var t=de(l);if(t===null)l=null;else{var a=t.tag;if(a===13){if(l=eo(t),l!==null)return l;l=null}else if(a===31){if(l=no(t),l!==null)return l;l=null}else if(a===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Gn=l,null}function Q1(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Bm()){case so:return 2;case oo:return 8;case vn:case qm:return 32;case mo:return 268435456;default:return 32}default:return 32}}var Wc=!1,kt=null,Ft=null,It=null,se=new Map,oe=new Map,Gt=[],Wy="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Is(l,t){switch(l){case"focusin":case"focusout":kt=null;break;case"dragenter":case"dragleave":Ft=null;break;case"mouseover":case"mouseout":It=null;break;case"pointerover":case"pointerout":se.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":oe.delete(t.pointerId)}}function Hu(l,t,a,u,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:a,eventSystemFlags:u,nativeEvent:n,targetContainers:[e]},t!==null&&(t=vu(t),t!==null&&X1(t)),l):(l.eventSystemFlags|=u,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function $y(l,t,a,u,e){switch(t){case"focusin":return kt=Hu(kt,l,t,a,u,e),!0;case"dragenter":return Ft=Hu(Ft,l,t,a,u,e),!0;case"mouseover":return It=Hu(It,l,t,a,u,e),!0;case"pointerover":var n=e.pointerId;return se.set(n,Hu(se.get(n)||null,l,t,a,u,e)),!0;case"gotpointercapture":return n=e.pointerId,oe.set(n,Hu(oe.get(n)||null,l,t,a,u,e)),!0}return!1}function Z1(l){var t=Ga(l.target);if(t!==null){var a=de(t);if(a!==null){if(t=a.tag,t===13){if(t=eo(a),t!==null){l.blockedOn=t,B0(l.priority,function(){Fs(a)});return}}else if(t===31){if(t=no(a),t!==null){l.blockedOn=t,B0(l.priority,function(){Fs(a)});return}}else if(t===3&&a.stateNode.current.memoizedState.isDehydrated){l.blockedOn=a.tag===3?a.stateNode.containerInfo:null;return}}}l.blockedOn=null}function sn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var a=wc(l.nativeEvent);if(a===null){a=l.nativeEvent;var u=new a.constructor(a.type,a);mc=u,a.target.dispatchEvent(u),mc=null}else return t=vu(a),t!==null&&X1(t),l.blockedOn=a,!1;t.shift()}return!0}function Ps(l,t,a){sn(l)&&a.delete(t)}function ky(){Wc=!1,kt!==null&&sn(kt)&&(kt=null),Ft!==null&&sn(Ft)&&(Ft=null),It!==null&&sn(It)&&(It=null),se.forEach(Ps),oe.forEach(Ps)}function Je(l,t){l.blockedOn===t&&(l.blockedOn=null,Wc||(Wc=!0,dl.unstable_scheduleCallback(dl.unstable_NormalPriority,ky)))}var we=null;function lo(l){we!==l&&(we=l,dl.unstable_scheduleCallback(dl.unstable_NormalPriority,function(){we===l&&(we=null);for(var t=0;t<l.length;t+=3){var a=l[t],u=l[t+1],e=l[t+2];if(typeof u!="function"){if(Vf(u||a)===null)continue;break}var n=vu(a);n!==null&&(l.splice(t,3),t-=3,Dc(n,{pending:!0,data:e,method:a.method,action:u},u,e))}}))}function du(l){function t(f){return Je(f,l)}kt!==null&&Je(kt,l),Ft!==null&&Je(Ft,l),It!==null&&Je(It,l),se.forEach(t),oe.forEach(t);for(var a=0;a<Gt.length;a++){var u=Gt[a];u.blockedOn===l&&(u.blockedOn=null)}for(;0<Gt.length&&(a=Gt[0],a.blockedOn===null);)Z1(a),a.blockedOn===null&&Gt.shift();if(a=(l.ownerDocument||l).$$reactFormReplay,a!=null)for(u=0;u<a.length;u+=3){var e=a[u],n=a[u+1],i=e[Nl]||null;if(typeof n=="function")i||lo(a);else if(i){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,i=n[Nl]||null)c=i.formAction;else if(Vf(e)!==null)continue}else c=i.action;typeof c=="function"?a[u+1]=c:(a.splice(u,3),u-=3),lo(a)}}}function j1(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(i){return e=i})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),u||setTimeout(a,20)}function a(){if(!u&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var u=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(a,100),function(){u=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function Kf(l){this._internalRoot=l}li.prototype.render=Kf.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(b(409));var a=t.current,u=Gl();G1(a,u,l,t,null,null)};li.prototype.unmount=Kf.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;G1(l.current,2,null,l,null,null),Fn(),t[mu]=null}};function li(l){this._internalRoot=l}li.prototype.unstable_scheduleHydration=function(l){if(l){var t=So();l={blockedOn:null,target:l,priority:t};for(var a=0;a<Gt.length&&t!==0&&t<Gt[a].priority;a++);Gt.splice(a,0,l),a===0&&Z1(l)}};var to=ao.version;if(to!=="19.2.3")throw Error(b(527,to,"19.2.3"));Q.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(b(188)):(l=Object.keys(l).join(","),Error(b(268,l)));return l=Dm(t),l=l!==null?io(l):null,l=l===null?null:l.stateNode,l};var Fy={bundleType:0,version:"19.2.3",rendererPackageName:"react-dom",currentDispatcherRef:O,reconcilerVersion:"19.2.3"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__!="undefined"&&(Ru=__REACT_DEVTOOLS_GLOBAL_HOOK__,!Ru.isDisabled&&Ru.supportsFiber))try{me=Ru.inject(Fy),ql=Ru}catch(l){}var Ru;ti.createRoot=function(l,t){if(!uo(l))throw Error(b(299));var a=!1,u="",e=Cd,n=xd,i=Bd;return t!=null&&(t.unstable_strictMode===!0&&(a=!0),t.identifierPrefix!==void 0&&(u=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(i=t.onRecoverableError)),t=q1(l,1,!1,null,null,a,u,null,e,n,i,j1),l[mu]=t.current,Xf(l),new Kf(t)};ti.hydrateRoot=function(l,t,a){if(!uo(l))throw Error(b(299));var u=!1,e="",n=Cd,i=xd,c=Bd,f=null;return a!=null&&(a.unstable_strictMode===!0&&(u=!0),a.identifierPrefix!==void 0&&(e=a.identifierPrefix),a.onUncaughtError!==void 0&&(n=a.onUncaughtError),a.onCaughtError!==void 0&&(i=a.onCaughtError),a.onRecoverableError!==void 0&&(c=a.onRecoverableError),a.formState!==void 0&&(f=a.formState)),t=q1(l,1,!0,t,a!=null?a:null,u,e,f,n,i,c,j1),t.context=Y1(null),a=t.current,u=Gl(),u=Ic(u),e=Jt(u),e.callback=null,wt(a,e,u),a=u,t.current.lanes=a,ye(t,a),ft(t),l[mu]=t.current,Xf(l),new li(t)};ti.version="19.2.3"});var J1=Ut((ch,K1)=>{"use strict";function V1(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__=="undefined"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(V1)}catch(l){console.error(l)}}V1(),K1.exports=L1()});var w1=ni(pu());var r=ni(pu());var Tm=()=>{var $f,kf;let[l,t]=r.useState([]),[a,u]=r.useState(!0),[e,n]=r.useState(!1),[i,c]=r.useState("Jeddah"),[f,d]=r.useState([]),[y,S]=r.useState(null),[v,h]=r.useState(!1),[p,M]=r.useState(!1),G=r.useRef(null),o=r.useRef(null),s=r.useRef([]),m=r.useRef(new Map),g=[{name:"Jeddah",coordinates:{lat:21.4858,lon:39.1925}},{name:"Dammam",coordinates:{lat:26.3927,lon:50.1059}},{name:"Yanbu",coordinates:{lat:24.0896,lon:38.0618}},{name:"Jizan",coordinates:{lat:16.8892,lon:42.5511}},{name:"Jubail",coordinates:{lat:27.0174,lon:49.659}},{name:"Rabigh",coordinates:{lat:22.7981,lon:39.0367}}];r.useEffect(()=>{B(),_();let z=setTimeout(()=>{ui()},500);return()=>{clearTimeout(z),frappe.realtime.off("ais_stream_batch"),o.current&&(m.current.clear(),s.current=[],o.current.remove())}},[]),r.useEffect(()=>{tt()},[i,l]),r.useEffect(()=>{o.current&&l.length>0&&k1()},[l]);let _=async()=>{try{console.log("Loading existing vessel data from database...");let z=await frappe.call({method:"vessel_tracker.vessel_tracker.api.live_vessels.get_live_vessels"});if(z.message&&z.message.vessels){let A=z.message.vessels.map(T=>({mmsi:T.ais_mmsi,vessel_name:T.vessel_name,latitude:T.ais_last_position_lat,longitude:T.ais_last_position_lon,speed:T.ais_speed||0,course:T.ais_course||0,status:T.ais_status||"Unknown",timestamp:T.ais_last_update,vessel_type:T.vessel_type}));console.log(`Loaded ${A.length} vessels from database`),t(T=>[...T,...A])}}catch(z){console.error("Error loading existing vessels:",z)}},B=()=>{console.log("\u{1F50C} Connecting to Frappe Realtime..."),u(!0);try{frappe.realtime.on("ais_stream_batch",z=>{console.log("Received AIS batch:",z.length),z.forEach(A=>{try{if(A.MessageType==="PositionReport"){let T=A.Message.PositionReport;E(T,"position")}else if(A.MessageType==="ShipStaticData"){let T=A.Message.ShipStaticData;E(T,"static")}}catch(T){console.error("AIS data parse error:",T)}})}),console.log("\u2705 Connected to Frappe Realtime AIS Stream"),n(!0),u(!1)}catch(z){console.error("Realtime connection error:",z),n(!1),u(!1)}},E=(z,A)=>{var P;let T=(P=z.UserID)==null?void 0:P.toString();if(console.log("Processing vessel data:",{type:A,mmsi:T,latitude:z.Latitude,longitude:z.Longitude,hasPosition:!!(z.Latitude&&z.Longitude)}),!T){console.log("\u26A0\uFE0F No MMSI found in vessel data");return}t(ru=>{var zu,Ee,Ff;let na=ru.findIndex(st=>st.mmsi===T),ia={};if(A==="position"){if(!z.Latitude||!z.Longitude)return console.log(`\u26A0\uFE0F Vessel ${T} missing coordinates:`,{lat:z.Latitude,lon:z.Longitude}),ru;(z.Latitude<12||z.Latitude>35||z.Longitude<32||z.Longitude>55)&&console.log(`\u26A0\uFE0F Vessel ${T} coordinates outside expected area:`,{lat:z.Latitude,lon:z.Longitude}),ia={mmsi:T,latitude:z.Latitude,longitude:z.Longitude,speed:z.Sog||0,course:z.Cog||0,status:D(z.NavigationalStatus||15),timestamp:new Date().toISOString(),heading:z.TrueHeading||0}}else A==="static"&&(ia={mmsi:T,vessel_name:((zu=z.VesselName)==null?void 0:zu.trim())||"",call_sign:((Ee=z.CallSign)==null?void 0:Ee.trim())||"",imo_number:z.ImoNumber,destination:((Ff=z.Destination)==null?void 0:Ff.trim())||"",vessel_type:H(z.Type||0)});if(na>=0){let st=[...ru];return st[na]=Ae(Ae({},st[na]),ia),console.log(`\u{1F504} Updated existing vessel ${T}:`,st[na]),st}else{let st=Ae({},ia);return console.log(`\u{1F195} Added new vessel ${T}:`,st),[...ru,st]}}),console.log(`\u{1F4CD} Updated vessel ${T} (${A})`)},D=z=>({0:"Under way using engine",1:"At anchor",2:"Not under command",3:"Restricted manoeuvrability",4:"Constrained by her draught",5:"Moored",6:"Aground",7:"Engaged in Fishing",8:"Under way sailing",15:"Default"})[z]||"Unknown",H=z=>30<=z&&z<=32?"Fishing":60<=z&&z<=69?"Passenger":70<=z&&z<=79?"Cargo":80<=z&&z<=89?"Tanker":"Other",Y=(z,A,T,P)=>{let na=(T-z)*Math.PI/180,ia=(P-A)*Math.PI/180,zu=Math.sin(na/2)*Math.sin(na/2)+Math.cos(z*Math.PI/180)*Math.cos(T*Math.PI/180)*Math.sin(ia/2)*Math.sin(ia/2),Ee=2*Math.atan2(Math.sqrt(zu),Math.sqrt(1-zu));return 6371*Ee},tt=()=>{let z=g.find(T=>T.name===i);if(!z||l.length===0){d([]);return}let A=l.filter(T=>{if(!T.latitude||!T.longitude)return!1;let P=Y(z.coordinates.lat,z.coordinates.lon,T.latitude,T.longitude);return P<=100?(T.distance_to_port=Math.round(P*10)/10,!0):!1}).sort((T,P)=>(T.distance_to_port||0)-(P.distance_to_port||0));d(A.slice(0,20))},ui=async()=>{if(!G.current){console.log("Map ref not available");return}try{console.log("Initializing map..."),typeof L=="undefined"&&(console.log("Loading Leaflet library..."),await $1()),o.current&&o.current.remove();let z=[24.7136,46.6753];o.current=L.map(G.current,{center:z,zoom:6,attributionControl:!0,zoomControl:!0}),console.log("Map instance created");let A=L.tileLayer("https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png",{attribution:"\xA9 OpenStreetMap contributors",maxZoom:18,errorTileUrl:"data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMjU2IiBoZWlnaHQ9IjI1NiIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48cmVjdCB3aWR0aD0iMjU2IiBoZWlnaHQ9IjI1NiIgZmlsbD0iI2VlZWVlZSIvPjx0ZXh0IHg9IjUwJSIgeT0iNTAlIiBkb21pbmFudC1iYXNlbGluZT0iY2VudHJhbCIgdGV4dC1hbmNob3I9Im1pZGRsZSIgZm9udC1zaXplPSIxOCIgZm9udC1mYW1pbHk9Im1vbm9zcGFjZSIgZmlsbD0iIzk5OTk5OSI+Tm8gVGlsZTwvdGV4dD48L3N2Zz4K"});A.on("loading",()=>console.log("Tiles loading...")),A.on("load",()=>console.log("Tiles loaded")),A.on("tileerror",T=>console.error("Tile error:",T)),A.addTo(o.current),console.log("Adding port markers..."),g.forEach(T=>{L.marker([T.coordinates.lat,T.coordinates.lon],{icon:L.divIcon({className:"port-marker",html:'<div style="background: #dc2626; width: 12px; height: 12px; border-radius: 50%; border: 2px solid white;"></div>',iconSize:[16,16],iconAnchor:[8,8]})}).addTo(o.current).bindPopup(`<b>${T.name} Port</b>`)}),console.log("Map initialization complete"),h(!0)}catch(z){console.error("Error initializing map:",z),h(!1)}},$1=()=>new Promise((z,A)=>{if(console.log("Loading Leaflet resources..."),!document.querySelector('link[href*="leaflet.css"]')){let T=document.createElement("link");T.rel="stylesheet",T.href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css",T.integrity="sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=",T.crossOrigin="",document.head.appendChild(T),console.log("Leaflet CSS loaded")}if(document.querySelector('script[src*="leaflet.js"]'))typeof L!="undefined"?(console.log("Leaflet already available"),z()):(console.log("Waiting for existing Leaflet to load..."),setTimeout(()=>{typeof L!="undefined"?z():A(new Error("Leaflet failed to load"))},1e3));else{let T=document.createElement("script");T.src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js",T.integrity="sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=",T.crossOrigin="",T.onload=()=>{console.log("Leaflet JS loaded successfully"),setTimeout(z,100)},T.onerror=P=>{console.error("Failed to load Leaflet JS:",P),A(P)},document.head.appendChild(T)}}),k1=()=>{if(!o.current)return;let z=new Set(l.filter(A=>A.latitude&&A.longitude).map(A=>A.mmsi));m.current.forEach((A,T)=>{if(!z.has(T)){o.current.removeLayer(A),m.current.delete(T);let P=s.current.indexOf(A);P>-1&&s.current.splice(P,1)}}),l.forEach(A=>{if(A.latitude&&A.longitude){let T=m.current.get(A.mmsi);if(T)T.setLatLng([A.latitude,A.longitude]),T.setIcon(L.divIcon({className:"vessel-marker",html:Jf(A),iconSize:[20,20],iconAnchor:[10,10]})),T.getPopup().setContent(wf(A));else{let P=L.marker([A.latitude,A.longitude],{icon:L.divIcon({className:"vessel-marker",html:Jf(A),iconSize:[20,20],iconAnchor:[10,10]})}).addTo(o.current);P.bindPopup(wf(A),{closeButton:!0,autoClose:!1,closeOnEscapeKey:!0,closeOnClick:!1}),P.on("click",()=>{S(A)}),m.current.set(A.mmsi,P),s.current.push(P)}}}),console.log(`\u{1F5FA}\uFE0F Map updated: ${l.length} vessels, ${m.current.size} markers`)},Jf=z=>{let A={"Under way using engine":"#3b82f6","At anchor":"#10b981",Moored:"#8b5cf6","Not under command":"#ef4444",Default:"#6b7280"};return`
       <div style="
         background: ${A[z.status]||A.Default}; 
         width: 16px; 
@@ -44,7 +44,7 @@ Error generating stack: `+u.message+`
           Click vessel for detailed view
         </div>
       </div>
-    `,F1=()=>{let z=g.find(A=>A.name===i);z&&o.current&&o.current.setView([z.coordinates.lat,z.coordinates.lon],8)},I1=()=>{frappe.realtime.off("ais_stream"),t([]),d([]),B()},P1=()=>{M(!p),setTimeout(()=>{o.current&&o.current.invalidateSize()},300)},Wf=({vessel:z,showDistance:A=!1})=>{var T,P;return r.createElement("div",{className:"p-4 border rounded-lg hover:bg-gray-50 cursor-pointer",onClick:()=>S(z)},r.createElement("h4",{className:"font-semibold text-gray-900"},"\u{1F6A2} ",z.vessel_name||`MMSI: ${z.mmsi}`),r.createElement("p",{className:"text-sm text-gray-600"},"\u{1F4CD} ",(T=z.latitude)==null?void 0:T.toFixed(4),", ",(P=z.longitude)==null?void 0:P.toFixed(4)),r.createElement("p",{className:"text-sm text-gray-600"},"\u26A1 ",z.speed||0," knots | \u{1F9ED} ",z.course||0,"\xB0"),r.createElement("p",{className:"text-sm text-blue-600"},z.status||"Unknown"),A&&z.distance_to_port&&r.createElement("p",{className:"text-sm text-green-600"},"\u{1F4CF} ",z.distance_to_port," km from ",i))};return a?r.createElement("div",{className:"m-4 flex items-center justify-center h-64"},r.createElement("div",{className:"text-center"},r.createElement("div",{className:"animate-spin rounded-full h-8 w-8 border-b-2 border-blue-500 mx-auto mb-2"}),r.createElement("p",null,"Connecting to Frappe Realtime..."))):r.createElement("div",{className:"m-4 space-y-6"},r.createElement("div",{className:"bg-white rounded-lg shadow p-4"},r.createElement("div",{className:"flex justify-between items-center"},r.createElement("h1",{className:"text-2xl font-bold text-gray-900"},"\u{1F1F8}\u{1F1E6} Live Vessel Tracking - Saudi Arabia"),r.createElement("div",{className:"flex items-center space-x-4"},r.createElement("div",{className:`flex items-center ${e?"text-green-600":"text-red-600"}`},r.createElement("div",{className:`w-3 h-3 rounded-full mr-2 ${e?"bg-green-500":"bg-red-500"}`}),e?"\u2705 Connected to Realtime":"\u274C Disconnected"),r.createElement("span",{className:"text-sm text-gray-600"},l.length," vessels tracked"),r.createElement("button",{onClick:()=>_(),className:"px-4 py-2 bg-green-500 text-white rounded hover:bg-green-600"},"\u{1F4DA} Load DB"),r.createElement("button",{onClick:I1,className:"px-4 py-2 bg-blue-500 text-white rounded hover:bg-blue-600"},"\u{1F504} Reconnect")))),r.createElement("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-6"},r.createElement("div",{className:"bg-white rounded-lg shadow p-4"},r.createElement("div",{className:"mb-4"},r.createElement("label",{className:"block text-sm font-medium text-gray-700 mb-2"},"\u{1F3C3} Select Saudi Port"),r.createElement("select",{value:i,onChange:z=>c(z.target.value),className:"w-full p-3 border rounded-lg"},g.map(z=>r.createElement("option",{key:z.name,value:z.name},z.name)))),r.createElement("div",null,r.createElement("h3",{className:"text-lg font-semibold mb-3"},"\u{1F6A2} Vessels Near ",i," (",f.length,")"),r.createElement("div",{className:"space-y-3 max-h-96 overflow-y-auto"},f.length>0?f.map((z,A)=>r.createElement(Wf,{key:z.mmsi||A,vessel:z,showDistance:!0})):r.createElement("div",{className:"text-center py-8 text-gray-500"},r.createElement("p",null,"\u{1F50D} No vessels found near ",i),r.createElement("p",{className:"text-sm mt-2"},l.length>0?"Try selecting another port":"Waiting for vessel data..."))))),r.createElement("div",{className:`bg-white rounded-lg shadow p-4 ${p?"fixed inset-4 z-50":"lg:col-span-2"}`},r.createElement("div",{className:"flex justify-between items-center mb-3"},r.createElement("h3",{className:"text-lg font-semibold"},"\u{1F5FA}\uFE0F Live Vessel Map"),r.createElement("div",{className:"flex space-x-2"},r.createElement("button",{onClick:F1,className:"px-3 py-1 text-sm bg-blue-500 text-white rounded hover:bg-blue-600"},"Focus on ",i),r.createElement("button",{onClick:()=>{o.current&&o.current.setView([24.7136,46.6753],6)},className:"px-3 py-1 text-sm bg-gray-500 text-white rounded hover:bg-gray-600"},"Reset View"),r.createElement("button",{onClick:P1,className:"px-3 py-1 text-sm bg-purple-500 text-white rounded hover:bg-purple-600"},p?"\u{1F4F1} Exit Fullscreen":"\u{1F5A5}\uFE0F Fullscreen"))),r.createElement("div",{ref:G,className:"w-full rounded-lg border bg-gray-100",style:{height:p?"calc(100vh - 200px)":"400px",minHeight:p?"calc(100vh - 200px)":"400px",position:"relative",zIndex:1}},!v&&r.createElement("div",{className:"absolute inset-0 flex items-center justify-center bg-gray-100 rounded-lg"},r.createElement("div",{className:"text-center"},r.createElement("div",{className:"animate-spin rounded-full h-8 w-8 border-b-2 border-blue-500 mx-auto mb-2"}),r.createElement("p",{className:"text-gray-600"},"Loading map...")))),r.createElement("div",{className:"mt-4 p-3 bg-gray-50 rounded"},r.createElement("h4",{className:"text-sm font-medium mb-2"},"Legend"),r.createElement("div",{className:"grid grid-cols-2 gap-2 text-xs"},r.createElement("div",{className:"flex items-center"},r.createElement("div",{className:"w-3 h-3 bg-red-600 rounded-full mr-2"}),r.createElement("span",null,"Ports")),r.createElement("div",{className:"flex items-center"},r.createElement("div",{className:"w-3 h-3 bg-blue-500 rounded-full mr-2"}),r.createElement("span",null,"Under way")),r.createElement("div",{className:"flex items-center"},r.createElement("div",{className:"w-3 h-3 bg-green-500 rounded-full mr-2"}),r.createElement("span",null,"At anchor")),r.createElement("div",{className:"flex items-center"},r.createElement("div",{className:"w-3 h-3 bg-purple-500 rounded-full mr-2"}),r.createElement("span",null,"Moored")))))),r.createElement("div",{className:"bg-white rounded-lg shadow p-4"},r.createElement("h3",{className:"text-lg font-semibold mb-3"},"\u{1F30A} All Tracked Vessels (",l.length,")"),r.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-3 max-h-64 overflow-y-auto"},l.length>0?l.map((z,A)=>r.createElement(Wf,{key:z.mmsi||A,vessel:z})):r.createElement("div",{className:"col-span-full text-center py-8 text-gray-500"},r.createElement("div",{className:"space-y-3"},r.createElement("p",{className:"text-lg"},"\u{1F6F0}\uFE0F Waiting for live vessel data..."),r.createElement("p",{className:"text-sm"},e?"Connected to Frappe Realtime AIS stream. Vessels will appear as they broadcast their positions.":"Connection lost. Click Reconnect to try again."))))),y&&r.createElement("div",{className:"fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50"},r.createElement("div",{className:"bg-white rounded-lg p-6 max-w-md w-full m-4"},r.createElement("div",{className:"flex justify-between items-start mb-4"},r.createElement("h3",{className:"text-lg font-bold"},"\u{1F6A2} ",y.vessel_name||`MMSI: ${y.mmsi}`),r.createElement("button",{onClick:()=>S(null),className:"text-gray-500 hover:text-gray-700 text-xl"},"\xD7")),r.createElement("div",{className:"space-y-3 text-sm"},r.createElement("div",null,r.createElement("strong",null,"MMSI:")," ",y.mmsi),r.createElement("div",null,r.createElement("strong",null,"Position:")," ",($f=y.latitude)==null?void 0:$f.toFixed(6),", ",(kf=y.longitude)==null?void 0:kf.toFixed(6)),r.createElement("div",null,r.createElement("strong",null,"Speed:")," ",y.speed," knots"),r.createElement("div",null,r.createElement("strong",null,"Course:")," ",y.course,"\xB0"),r.createElement("div",null,r.createElement("strong",null,"Status:")," ",y.status),y.vessel_name&&r.createElement("div",null,r.createElement("strong",null,"Name:")," ",y.vessel_name),y.destination&&r.createElement("div",null,r.createElement("strong",null,"Destination:")," ",y.destination),y.vessel_type&&r.createElement("div",null,r.createElement("strong",null,"Type:")," ",y.vessel_type),r.createElement("div",null,r.createElement("strong",null,"Last Update:")," ",new Date(y.timestamp).toLocaleString())))))};function v0(){return r.createElement(Tm,null)}var W1=ni(J1()),ai=class{constructor({page:t,wrapper:a}){this.$wrapper=$(a),this.page=t,this.init()}init(){this.setup_app()}setup_app(){let t=(0,W1.createRoot)(this.$wrapper.get(0));t.render(w1.createElement(v0,null)),this.$vessel_tracker_dashb=t}};frappe.provide("frappe.ui");frappe.ui.VesselTrackerDashb=ai;var sh=ai;})();
+    `,F1=()=>{let z=g.find(A=>A.name===i);z&&o.current&&o.current.setView([z.coordinates.lat,z.coordinates.lon],8)},I1=()=>{frappe.realtime.off("ais_stream_batch"),t([]),d([]),B()},P1=()=>{M(!p),setTimeout(()=>{o.current&&o.current.invalidateSize()},300)},Wf=({vessel:z,showDistance:A=!1})=>{var T,P;return r.createElement("div",{className:"p-4 border rounded-lg hover:bg-gray-50 cursor-pointer",onClick:()=>S(z)},r.createElement("h4",{className:"font-semibold text-gray-900"},"\u{1F6A2} ",z.vessel_name||`MMSI: ${z.mmsi}`),r.createElement("p",{className:"text-sm text-gray-600"},"\u{1F4CD} ",(T=z.latitude)==null?void 0:T.toFixed(4),", ",(P=z.longitude)==null?void 0:P.toFixed(4)),r.createElement("p",{className:"text-sm text-gray-600"},"\u26A1 ",z.speed||0," knots | \u{1F9ED} ",z.course||0,"\xB0"),r.createElement("p",{className:"text-sm text-blue-600"},z.status||"Unknown"),A&&z.distance_to_port&&r.createElement("p",{className:"text-sm text-green-600"},"\u{1F4CF} ",z.distance_to_port," km from ",i))};return a?r.createElement("div",{className:"m-4 flex items-center justify-center h-64"},r.createElement("div",{className:"text-center"},r.createElement("div",{className:"animate-spin rounded-full h-8 w-8 border-b-2 border-blue-500 mx-auto mb-2"}),r.createElement("p",null,"Connecting to Frappe Realtime..."))):r.createElement("div",{className:"m-4 space-y-6"},r.createElement("div",{className:"bg-white rounded-lg shadow p-4"},r.createElement("div",{className:"flex justify-between items-center"},r.createElement("h1",{className:"text-2xl font-bold text-gray-900"},"\u{1F1F8}\u{1F1E6} Live Vessel Tracking - Saudi Arabia"),r.createElement("div",{className:"flex items-center space-x-4"},r.createElement("div",{className:`flex items-center ${e?"text-green-600":"text-red-600"}`},r.createElement("div",{className:`w-3 h-3 rounded-full mr-2 ${e?"bg-green-500":"bg-red-500"}`}),e?"\u2705 Connected to Realtime":"\u274C Disconnected"),r.createElement("span",{className:"text-sm text-gray-600"},l.length," vessels tracked"),r.createElement("button",{onClick:()=>_(),className:"px-4 py-2 bg-green-500 text-white rounded hover:bg-green-600"},"\u{1F4DA} Load DB"),r.createElement("button",{onClick:I1,className:"px-4 py-2 bg-blue-500 text-white rounded hover:bg-blue-600"},"\u{1F504} Reconnect")))),r.createElement("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-6"},r.createElement("div",{className:"bg-white rounded-lg shadow p-4"},r.createElement("div",{className:"mb-4"},r.createElement("label",{className:"block text-sm font-medium text-gray-700 mb-2"},"\u{1F3C3} Select Saudi Port"),r.createElement("select",{value:i,onChange:z=>c(z.target.value),className:"w-full p-3 border rounded-lg"},g.map(z=>r.createElement("option",{key:z.name,value:z.name},z.name)))),r.createElement("div",null,r.createElement("h3",{className:"text-lg font-semibold mb-3"},"\u{1F6A2} Vessels Near ",i," (",f.length,")"),r.createElement("div",{className:"space-y-3 max-h-96 overflow-y-auto"},f.length>0?f.map((z,A)=>r.createElement(Wf,{key:z.mmsi||A,vessel:z,showDistance:!0})):r.createElement("div",{className:"text-center py-8 text-gray-500"},r.createElement("p",null,"\u{1F50D} No vessels found near ",i),r.createElement("p",{className:"text-sm mt-2"},l.length>0?"Try selecting another port":"Waiting for vessel data..."))))),r.createElement("div",{className:`bg-white rounded-lg shadow p-4 ${p?"fixed inset-4 z-50":"lg:col-span-2"}`},r.createElement("div",{className:"flex justify-between items-center mb-3"},r.createElement("h3",{className:"text-lg font-semibold"},"\u{1F5FA}\uFE0F Live Vessel Map"),r.createElement("div",{className:"flex space-x-2"},r.createElement("button",{onClick:F1,className:"px-3 py-1 text-sm bg-blue-500 text-white rounded hover:bg-blue-600"},"Focus on ",i),r.createElement("button",{onClick:()=>{o.current&&o.current.setView([24.7136,46.6753],6)},className:"px-3 py-1 text-sm bg-gray-500 text-white rounded hover:bg-gray-600"},"Reset View"),r.createElement("button",{onClick:P1,className:"px-3 py-1 text-sm bg-purple-500 text-white rounded hover:bg-purple-600"},p?"\u{1F4F1} Exit Fullscreen":"\u{1F5A5}\uFE0F Fullscreen"))),r.createElement("div",{ref:G,className:"w-full rounded-lg border bg-gray-100",style:{height:p?"calc(100vh - 200px)":"400px",minHeight:p?"calc(100vh - 200px)":"400px",position:"relative",zIndex:1}},!v&&r.createElement("div",{className:"absolute inset-0 flex items-center justify-center bg-gray-100 rounded-lg"},r.createElement("div",{className:"text-center"},r.createElement("div",{className:"animate-spin rounded-full h-8 w-8 border-b-2 border-blue-500 mx-auto mb-2"}),r.createElement("p",{className:"text-gray-600"},"Loading map...")))),r.createElement("div",{className:"mt-4 p-3 bg-gray-50 rounded"},r.createElement("h4",{className:"text-sm font-medium mb-2"},"Legend"),r.createElement("div",{className:"grid grid-cols-2 gap-2 text-xs"},r.createElement("div",{className:"flex items-center"},r.createElement("div",{className:"w-3 h-3 bg-red-600 rounded-full mr-2"}),r.createElement("span",null,"Ports")),r.createElement("div",{className:"flex items-center"},r.createElement("div",{className:"w-3 h-3 bg-blue-500 rounded-full mr-2"}),r.createElement("span",null,"Under way")),r.createElement("div",{className:"flex items-center"},r.createElement("div",{className:"w-3 h-3 bg-green-500 rounded-full mr-2"}),r.createElement("span",null,"At anchor")),r.createElement("div",{className:"flex items-center"},r.createElement("div",{className:"w-3 h-3 bg-purple-500 rounded-full mr-2"}),r.createElement("span",null,"Moored")))))),r.createElement("div",{className:"bg-white rounded-lg shadow p-4"},r.createElement("h3",{className:"text-lg font-semibold mb-3"},"\u{1F30A} All Tracked Vessels (",l.length,")"),r.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-3 max-h-64 overflow-y-auto"},l.length>0?l.map((z,A)=>r.createElement(Wf,{key:z.mmsi||A,vessel:z})):r.createElement("div",{className:"col-span-full text-center py-8 text-gray-500"},r.createElement("div",{className:"space-y-3"},r.createElement("p",{className:"text-lg"},"\u{1F6F0}\uFE0F Waiting for live vessel data..."),r.createElement("p",{className:"text-sm"},e?"Connected to Frappe Realtime AIS stream. Vessels will appear as they broadcast their positions.":"Connection lost. Click Reconnect to try again."))))),y&&r.createElement("div",{className:"fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50"},r.createElement("div",{className:"bg-white rounded-lg p-6 max-w-md w-full m-4"},r.createElement("div",{className:"flex justify-between items-start mb-4"},r.createElement("h3",{className:"text-lg font-bold"},"\u{1F6A2} ",y.vessel_name||`MMSI: ${y.mmsi}`),r.createElement("button",{onClick:()=>S(null),className:"text-gray-500 hover:text-gray-700 text-xl"},"\xD7")),r.createElement("div",{className:"space-y-3 text-sm"},r.createElement("div",null,r.createElement("strong",null,"MMSI:")," ",y.mmsi),r.createElement("div",null,r.createElement("strong",null,"Position:")," ",($f=y.latitude)==null?void 0:$f.toFixed(6),", ",(kf=y.longitude)==null?void 0:kf.toFixed(6)),r.createElement("div",null,r.createElement("strong",null,"Speed:")," ",y.speed," knots"),r.createElement("div",null,r.createElement("strong",null,"Course:")," ",y.course,"\xB0"),r.createElement("div",null,r.createElement("strong",null,"Status:")," ",y.status),y.vessel_name&&r.createElement("div",null,r.createElement("strong",null,"Name:")," ",y.vessel_name),y.destination&&r.createElement("div",null,r.createElement("strong",null,"Destination:")," ",y.destination),y.vessel_type&&r.createElement("div",null,r.createElement("strong",null,"Type:")," ",y.vessel_type),r.createElement("div",null,r.createElement("strong",null,"Last Update:")," ",new Date(y.timestamp).toLocaleString())))))};function v0(){return r.createElement(Tm,null)}var W1=ni(J1()),ai=class{constructor({page:t,wrapper:a}){this.$wrapper=$(a),this.page=t,this.init()}init(){this.setup_app()}setup_app(){let t=(0,W1.createRoot)(this.$wrapper.get(0));t.render(w1.createElement(v0,null)),this.$vessel_tracker_dashb=t}};frappe.provide("frappe.ui");frappe.ui.VesselTrackerDashb=ai;var sh=ai;})();
 /**
  * @license React
  * react-dom-client.production.js
@@ -36,7 +36,7 @@ const VesselMap = () => {
     return () => {
       clearTimeout(initMapTimeout);
       // Clean up realtime listeners
-      frappe.realtime.off("ais_stream");
+      frappe.realtime.off("ais_stream_batch");
       // Clean up map and markers
       if (mapInstance.current) {
         vesselMarkersMap.current.clear();
@@ -90,20 +90,22 @@ const VesselMap = () => {
     setLoading(true);
     
     try {
-      // Listen for AIS stream events
-      frappe.realtime.on("ais_stream", (data) => {
-        try {
-          console.log("Received AIS data:", data);
-          if (data.MessageType === "PositionReport") {
-            const report = data.Message.PositionReport;
-            addOrUpdateVessel(report, "position");
-          } else if (data.MessageType === "ShipStaticData") {
-            const staticData = data.Message.ShipStaticData;
-            addOrUpdateVessel(staticData, "static");
+      // Listen for AIS stream events; the worker publishes messages in batches
+      frappe.realtime.on("ais_stream_batch", (messages) => {
+        console.log("Received AIS batch:", messages.length);
+        messages.forEach((data) => {
+          try {
+            if (data.MessageType === "PositionReport") {
+              const report = data.Message.PositionReport;
+              addOrUpdateVessel(report, "position");
+            } else if (data.MessageType === "ShipStaticData") {
+              const staticData = data.Message.ShipStaticData;
+              addOrUpdateVessel(staticData, "static");
+            }
+          } catch (error) {
+            console.error("AIS data parse error:", error);
           }
-        } catch (error) {
-          console.error("AIS data parse error:", error);
-        }
+        });
       });
       
       console.log("✅ Connected to Frappe Realtime AIS Stream");
@@ -493,7 +495,7 @@ const VesselMap = () => {
 
   const reconnect = () => {
     // Clean up existing listeners
-    frappe.realtime.off("ais_stream");
+    frappe.realtime.off("ais_stream_batch");
     
     setVessels([]);
     setNearbyVessels([]);
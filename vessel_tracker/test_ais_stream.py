@@ -0,0 +1,99 @@
+# Copyright (c) 2026, Mansy and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from vessel_tracker.vessel_tracker.workers import ais_stream
+from vessel_tracker.vessel_tracker.workers.ais_stream import AIS_STREAM_BOUNDING_BOX, split_bounding_box
+
+
+class TestSplitBoundingBox(FrappeTestCase):
+    def test_single_tile_is_the_whole_box(self):
+        self.assertEqual(split_bounding_box([[36.0, 15.0], [52.0, 33.0]], 1), [[[36.0, 15.0], [52.0, 33.0]]])
+
+    def test_tiles_cover_the_box_row_by_row(self):
+        tiles = split_bounding_box([[36.0, 15.0], [52.0, 33.0]], 2)
+        self.assertEqual(tiles, [
+            [[36.0, 15.0], [44.0, 24.0]],
+            [[44.0, 15.0], [52.0, 24.0]],
+            [[36.0, 24.0], [44.0, 33.0]],
+            [[44.0, 24.0], [52.0, 33.0]]
+        ])
+
+    def test_tiles_share_edges_without_gaps(self):
+        (west, south), (east, north) = AIS_STREAM_BOUNDING_BOX
+        tiles = split_bounding_box(AIS_STREAM_BOUNDING_BOX, 3)
+        self.assertEqual(len(tiles), 9)
+
+        # Tiles in a row meet exactly, and the outer edges match the box
+        for row in range(3):
+            row_tiles = tiles[row * 3:(row + 1) * 3]
+            self.assertAlmostEqual(row_tiles[0][0][0], west)
+            self.assertAlmostEqual(row_tiles[-1][1][0], east)
+            for left, right in zip(row_tiles, row_tiles[1:]):
+                self.assertEqual(left[1][0], right[0][0])
+        self.assertAlmostEqual(tiles[0][0][1], south)
+        self.assertAlmostEqual(tiles[-1][1][1], north)
+
+
+class FakeLockCache:
+    """Just enough of frappe.cache() for the shard enqueue lock"""
+
+    def __init__(self):
+        self.data = {}
+
+    def make_key(self, key):
+        return f"test|{key}"
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+
+class TestStartAisStreamShards(FrappeTestCase):
+    def setUp(self):
+        self.cache = FakeLockCache()
+        self.running = []
+
+        patches = (
+            patch.object(frappe, "cache", return_value=self.cache),
+            patch.object(frappe, "get_all", side_effect=lambda *args, **kwargs: [
+                frappe._dict(job_name=job_name) for job_name in self.running
+            ]),
+            patch.object(frappe, "enqueue")
+        )
+        for target in patches:
+            target.start()
+            self.addCleanup(target.stop)
+
+    def enqueued(self):
+        return [call.kwargs["job_name"] for call in frappe.enqueue.call_args_list]
+
+    def test_enqueues_every_shard_on_the_stream_queue(self):
+        ais_stream.start_ais_stream_shards()
+
+        self.assertEqual(self.enqueued(), [f"ais_stream_worker_{i}" for i in range(4)])
+        for call, tile in zip(frappe.enqueue.call_args_list, split_bounding_box(AIS_STREAM_BOUNDING_BOX, 2)):
+            self.assertEqual(call.kwargs["queue"], ais_stream.AIS_STREAM_QUEUE)
+            self.assertEqual(call.kwargs["bounding_box"], tile)
+
+    def test_skips_queued_or_running_shards(self):
+        self.running = ["ais_stream_worker_0", "ais_stream_worker_2"]
+
+        ais_stream.start_ais_stream_shards()
+
+        self.assertEqual(self.enqueued(), ["ais_stream_worker_1", "ais_stream_worker_3"])
+
+    def test_concurrent_tick_does_not_enqueue_while_locked(self):
+        ais_stream.start_ais_stream_shards()
+        frappe.enqueue.reset_mock()
+
+        # The second tick runs before the first tick's jobs show up as queued
+        ais_stream.start_ais_stream_shards()
+
+        self.assertEqual(self.enqueued(), [])
@@ -0,0 +1,261 @@
+# Copyright (c) 2026, Mansy and Contributors
+# See license.txt
+
+from unittest.mock import MagicMock, patch
+
+import frappe
+import numpy as np
+from frappe.tests.utils import FrappeTestCase
+
+from vessel_tracker.vessel_tracker.api import live_vessels
+from vessel_tracker.vessel_tracker.api.live_vessels import (
+    get_navigation_status,
+    get_rate_limit_keys,
+    get_rate_limited_vessels,
+    get_vessel_type,
+    mark_vessels_updated,
+    pivot_vessels_data,
+    should_update_vessel,
+    to_tsv_field,
+)
+
+
+class FakeRedis:
+    """Just enough of frappe.cache() for the identity and rate limit keys"""
+
+    def __init__(self):
+        self.data = {}
+
+    def make_key(self, key):
+        return f"test|{key}"
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self):
+        return self
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def execute(self):
+        pass
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class TestToTsvField(FrappeTestCase):
+    def test_none_is_null(self):
+        self.assertEqual(to_tsv_field(None), "\\N")
+
+    def test_values_are_stringified(self):
+        self.assertEqual(to_tsv_field(21.5), "21.5")
+        self.assertEqual(to_tsv_field("Saudi Trader"), "Saudi Trader")
+        self.assertEqual(to_tsv_field(""), "")
+
+    def test_separators_are_escaped(self):
+        self.assertEqual(to_tsv_field("a\tb\nc"), "a\\tb\\nc")
+
+    def test_backslashes_are_escaped_first(self):
+        self.assertEqual(to_tsv_field("C:\\N"), "C:\\\\N")
+        self.assertEqual(to_tsv_field("\\\t"), "\\\\\\t")
+
+
+class TestPivotVesselsData(FrappeTestCase):
+    def test_columns_follow_the_batch(self):
+        batch = pivot_vessels_data([
+            {"mmsi": 403456789, "latitude": 21.5, "longitude": 39.2, "speed": 12.5, "course": 45,
+             "status": "At anchor", "vessel_name": "  Saudi Trader  ", "imo_number": 9123456},
+            {"mmsi": "403456790"}
+        ])
+
+        self.assertEqual(batch["mmsi"], ["403456789", "403456790"])
+        np.testing.assert_array_equal(batch["latitude"], [21.5, np.nan])
+        np.testing.assert_array_equal(batch["speed"], [12.5, np.nan])
+        self.assertEqual(batch["status"], ["At anchor", None])
+        self.assertEqual(batch["vessel_name"], ["Saudi Trader", None])
+        self.assertEqual(batch["imo_number"], ["9123456", None])
+
+    def test_zero_position_is_missing_but_zero_speed_is_not(self):
+        batch = pivot_vessels_data([{"mmsi": 1, "latitude": 0, "longitude": 0.0, "speed": 0, "course": 0}])
+
+        self.assertTrue(np.isnan(batch["latitude"][0]))
+        self.assertTrue(np.isnan(batch["longitude"][0]))
+        self.assertEqual(batch["speed"][0], 0)
+        self.assertEqual(batch["course"][0], 0)
+
+    def test_text_is_trimmed_and_truncated(self):
+        batch = pivot_vessels_data([
+            {"mmsi": 1, "destination": "x" * 300, "vessel_name": "   "},
+        ])
+
+        self.assertEqual(batch["destination"], ["x" * 250])
+        self.assertEqual(batch["vessel_name"], [None])
+
+    def test_only_integer_imo_numbers_are_kept(self):
+        batch = pivot_vessels_data([
+            {"mmsi": 1, "imo_number": "9123456"},
+            {"mmsi": 2, "imo_number": 0},
+            {"mmsi": 3, "imo_number": 9123456}
+        ])
+
+        self.assertEqual(batch["imo_number"], [None, None, "9123456"])
+
+
+class TestAisCodes(FrappeTestCase):
+    def test_navigation_status_bounds(self):
+        self.assertEqual(get_navigation_status(0), "Under way using engine")
+        self.assertEqual(get_navigation_status(8), "Under way sailing")
+        self.assertEqual(get_navigation_status(15), "Default")
+        for code in (-1, 16, None, "1", 1.0, True):
+            self.assertEqual(get_navigation_status(code), "Unknown")
+
+    def test_vessel_type_bounds(self):
+        self.assertEqual(get_vessel_type(30), "Fishing")
+        self.assertEqual(get_vessel_type(32), "Fishing")
+        self.assertEqual(get_vessel_type(33), "Other")
+        self.assertEqual(get_vessel_type(60), "Passenger")
+        self.assertEqual(get_vessel_type(79), "Cargo")
+        self.assertEqual(get_vessel_type(89), "Tanker")
+        for code in (0, 99, 100, -1, None, "70", 70.0, True):
+            self.assertEqual(get_vessel_type(code), "Other")
+
+
+class TestRateLimit(FrappeTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        target = patch.object(frappe, "cache", return_value=self.redis)
+        target.start()
+        self.addCleanup(target.stop)
+
+    def rate_limited(self, *mmsis):
+        mmsis = list(mmsis)
+        return get_rate_limited_vessels(self.redis, mmsis, get_rate_limit_keys(mmsis))
+
+    def test_unknown_vessels_are_not_limited(self):
+        self.assertEqual(self.rate_limited("111", "222"), {})
+
+    def test_recent_updates_are_limited(self):
+        mark_vessels_updated(["111"])
+
+        self.assertEqual(self.rate_limited("111", "222"), {"111": True})
+
+    def test_force_window_outlives_the_rate_limit(self):
+        mark_vessels_updated(["111"])
+        # The 30 second key expires long before the 5 minute one
+        self.redis.delete(self.redis.make_key("vessel_update:111"))
+
+        self.assertEqual(self.rate_limited("111"), {"111": False})
+
+
+class TestShouldUpdateVessel(FrappeTestCase):
+    existing = {"ais_last_position_lat": 21.5, "ais_last_position_lon": 39.2}
+
+    def test_new_vessels_are_always_written(self):
+        position = {"latitude": 21.5, "longitude": 39.2}
+        self.assertTrue(should_update_vessel("111", position, None, {"111": True}))
+
+    def test_rate_limited_vessels_are_skipped_even_when_moving(self):
+        moved = {"latitude": 22.0, "longitude": 40.0}
+        self.assertFalse(should_update_vessel("111", moved, self.existing, {"111": True}))
+
+    def test_moves_over_the_threshold_are_written(self):
+        moved = {"latitude": 21.5 + 0.0011, "longitude": 39.2}
+        self.assertTrue(should_update_vessel("111", moved, self.existing, {"111": False}))
+
+    def test_small_moves_wait_for_the_force_window(self):
+        jitter = {"latitude": 21.5 + 0.0005, "longitude": 39.2 + 0.0005}
+        self.assertFalse(should_update_vessel("111", jitter, self.existing, {"111": False}))
+        self.assertTrue(should_update_vessel("111", jitter, self.existing, {}))
+
+
+class TestUpdateVesselAisBatch(FrappeTestCase):
+    def setUp(self):
+        target = patch.object(live_vessels, "write_vessel_ais_batch")
+        self.write = target.start()
+        self.addCleanup(target.stop)
+
+    def test_string_coordinates_are_coerced(self):
+        live_vessels.update_vessel_ais_batch(
+            '[{"mmsi": "111", "latitude": "21.5", "longitude": "39.2"}]'
+        )
+
+        self.write.assert_called_once_with([{"mmsi": "111", "latitude": 21.5, "longitude": 39.2}])
+
+    def test_unparseable_coordinates_are_dropped_not_fatal(self):
+        live_vessels.update_vessel_ais_batch([
+            {"mmsi": "111", "latitude": "north", "longitude": "39.2"},
+            {"mmsi": "222", "latitude": 21.5, "longitude": 39.2}
+        ])
+
+        self.write.assert_called_once_with([
+            {"mmsi": "111", "latitude": None, "longitude": None},
+            {"mmsi": "222", "latitude": 21.5, "longitude": 39.2}
+        ])
+
+
+class TestWriteVesselAisBatch(FrappeTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.existing_names = set()
+        self.db = MagicMock()
+        self.db.sql.return_value = []
+        self.db.sql_list.side_effect = self.sql_list
+
+        for target in (
+            patch.object(frappe, "cache", return_value=self.redis),
+            patch.object(frappe, "db", self.db),
+            patch.object(live_vessels, "execute_batch_updates"),
+            patch.object(live_vessels, "execute_batch_inserts")
+        ):
+            target.start()
+            self.addCleanup(target.stop)
+
+    def sql_list(self, query, values=()):
+        # The written-rows check selects by name; everything else is an IMO lookup
+        if query.startswith("SELECT name"):
+            return [name for name in values[0] if name in self.existing_names]
+        return []
+
+    def cache_identity(self, mmsi, name):
+        live_vessels.cache_vessel_identities({mmsi: {
+            "name": name, "vessel_name": f"Vessel {mmsi}", "imo_number": f"AIS-{mmsi}",
+            "ais_last_position_lat": 21.0, "ais_last_position_lon": 39.0
+        }})
+
+    def write(self, *mmsis):
+        return live_vessels.write_vessel_ais_batch(
+            [{"mmsi": mmsi, "latitude": 21.5, "longitude": 39.5} for mmsi in mmsis], rate_limit=False
+        )
+
+    def test_updates_refresh_the_identity_cache(self):
+        self.existing_names = {"V1"}
+        self.cache_identity("111", "V1")
+
+        result = self.write("111")
+
+        self.assertEqual(result, {"status": "success", "updated": 1})
+        cached = live_vessels.get_cached_vessel_identities(["111"])["111"]
+        self.assertEqual(cached.name, "V1")
+        self.assertAlmostEqual(cached.ais_last_position_lat, 21.5, places=5)
+
+    def test_updates_matching_no_row_drop_the_cached_identity(self):
+        # The cached vessel was deleted or renamed; its UPDATE matches nothing
+        self.cache_identity("222", "V-GONE")
+
+        result = self.write("222")
+
+        self.assertEqual(result, {"status": "success", "updated": 0})
+        self.assertEqual(live_vessels.get_cached_vessel_identities(["222"]), {})
+
+    def test_only_written_inserts_are_cached(self):
+        self.db.sql_list.side_effect = lambda query, values=(): (
+            values[0][:1] if query.startswith("SELECT name") else []
+        )
+
+        result = self.write("333", "444")
+
+        self.assertEqual(result, {"status": "success", "updated": 1})
+        self.assertEqual(list(live_vessels.get_cached_vessel_identities(["333", "444"])), ["333"])
@@ -5,7 +5,7 @@ Run this to verify the connection works
 
 import asyncio
 import websockets
-import json
+import orjson
 
 async def test_ais_simple():
     """Simple test of AIS connection"""
@@ -25,7 +25,7 @@ async def test_ais_simple():
                 "FilterMessageTypes": ["PositionReport"]
             }
             
-            await websocket.send(json.dumps(subscription))
+            await websocket.send(orjson.dumps(subscription).decode())
             print("📡 Subscription sent")
             print(f"   Bounding Box: {saudi_bounds}")
             
@@ -39,7 +39,7 @@ async def test_ais_simple():
                 async with asyncio.timeout(timeout_seconds):
                     async for message in websocket:
                         message_count += 1
-                        data = json.loads(message)
+                        data = orjson.loads(message)
                         msg_type = data.get("MessageType", "Unknown")
                         
                         if msg_type == "PositionReport":
@@ -0,0 +1,207 @@
+# Copyright (c) 2026, Mansy and Contributors
+# See license.txt
+
+from unittest import skipUnless
+from unittest.mock import MagicMock, patch
+
+import frappe
+import numpy as np
+from frappe.tests.utils import FrappeTestCase
+
+from vessel_tracker.vessel_tracker.api import vessels
+from vessel_tracker.vessel_tracker.api.vessels import (
+    calculate_distance_km,
+    calculate_distance_km_from_trig,
+    get_bounding_box,
+    get_bounding_box_candidates,
+)
+
+
+def brute_force_within(latitude, longitude, radius_km, lats, lons):
+    """Indices of the positions within the radius, by computing every distance"""
+    distances = calculate_distance_km(latitude, longitude, lats.astype(np.float64), lons.astype(np.float64))
+    return set(np.flatnonzero(distances <= radius_km).tolist())
+
+
+class TestBoundingBox(FrappeTestCase):
+    def test_box_spans_the_radius(self):
+        bounds = get_bounding_box(0, 0, 111.19)
+        self.assertAlmostEqual(bounds["lat_min"], -1.0, places=3)
+        self.assertAlmostEqual(bounds["lat_max"], 1.0, places=3)
+        self.assertAlmostEqual(bounds["lon_min"], -1.0, places=3)
+        self.assertAlmostEqual(bounds["lon_max"], 1.0, places=3)
+
+    def test_longitude_span_widens_away_from_the_equator(self):
+        equator = get_bounding_box(0, 0, 100)
+        north = get_bounding_box(60, 0, 100)
+        self.assertGreater(north["lon_max"] - north["lon_min"], equator["lon_max"] - equator["lon_min"])
+
+    def test_circle_over_a_pole_covers_every_longitude(self):
+        bounds = get_bounding_box(89.9, 10, 50)
+        self.assertIsNone(bounds["lon_min"])
+        self.assertIsNone(bounds["lon_max"])
+
+
+class TestBoundingBoxCandidates(FrappeTestCase):
+    def test_candidates_include_every_position_in_the_circle(self):
+        rng = np.random.default_rng(7)
+        lats = rng.uniform(-90, 90, 20000).astype(np.float32)
+        lons = rng.uniform(-180, 180, 20000).astype(np.float32)
+
+        for latitude, longitude, radius_km in [
+            (21.5, 39.2, 50), (60.0, 5.0, 500), (-45.0, 100.0, 2000), (0.0, 0.0, 5000)
+        ]:
+            candidates = set(get_bounding_box_candidates(latitude, longitude, radius_km, lats, lons).tolist())
+            self.assertLessEqual(brute_force_within(latitude, longitude, radius_km, lats, lons), candidates)
+
+    def test_candidates_across_the_antimeridian(self):
+        lats = np.array([0.0, 0.0, 0.0, 0.0], dtype=np.float32)
+        lons = np.array([179.9, -179.9, -170.0, 170.0], dtype=np.float32)
+
+        candidates = get_bounding_box_candidates(0.0, 179.95, 50, lats, lons).tolist()
+        self.assertEqual(candidates, [0, 1])
+
+        candidates = get_bounding_box_candidates(0.0, -179.95, 50, lats, lons).tolist()
+        self.assertEqual(candidates, [0, 1])
+
+    def test_candidates_near_a_pole(self):
+        lats = np.array([89.8, 89.8, 89.8, 80.0], dtype=np.float32)
+        lons = np.array([0.0, 90.0, -179.0, 0.0], dtype=np.float32)
+
+        candidates = get_bounding_box_candidates(89.9, 0.0, 50, lats, lons).tolist()
+        self.assertEqual(candidates, [0, 1, 2])
+        self.assertLessEqual(brute_force_within(89.9, 0.0, 50, lats, lons), set(candidates))
+
+
+class TestCalculateDistance(FrappeTestCase):
+    def test_one_degree_of_latitude(self):
+        self.assertAlmostEqual(calculate_distance_km(0, 0, 1, 0), 111.195, places=2)
+
+    def test_scalar_and_array_paths_agree(self):
+        rng = np.random.default_rng(11)
+        lats = rng.uniform(-90, 90, 500)
+        lons = rng.uniform(-180, 180, 500)
+
+        distances = calculate_distance_km(21.5, 39.2, lats, lons)
+        scalar = [calculate_distance_km(21.5, 39.2, lat, lon) for lat, lon in zip(lats, lons)]
+        np.testing.assert_allclose(distances, scalar, rtol=1e-9, atol=1e-6)
+
+    def test_scalar_path_accepts_strings(self):
+        self.assertAlmostEqual(calculate_distance_km("0", "0", "1", "0"), calculate_distance_km(0, 0, 1, 0))
+
+    def test_jit_and_numpy_paths_agree(self):
+        rng = np.random.default_rng(17)
+        lats = rng.uniform(-90, 90, 5000).astype(np.float32)
+        lons = rng.uniform(-180, 180, 5000).astype(np.float32)
+
+        with patch.object(vessels, "NUMBA_MIN_VESSELS", 0):
+            jit = calculate_distance_km(21.5, 39.2, lats, lons)
+        with patch.object(vessels, "NUMBA_MIN_VESSELS", len(lats)):
+            numpy = calculate_distance_km(21.5, 39.2, lats, lons)
+
+        # Both compute in float64, whatever the storage precision of the positions
+        self.assertEqual(jit.dtype, np.float64)
+        np.testing.assert_allclose(jit, numpy, rtol=1e-9, atol=1e-6)
+
+    def test_trig_form_matches_haversine(self):
+        rng = np.random.default_rng(13)
+        lats = rng.uniform(-90, 90, 500)
+        lons = rng.uniform(-180, 180, 500)
+
+        distances = calculate_distance_km_from_trig(
+            21.5, 39.2, np.cos(np.radians(lats)), np.sin(np.radians(lats)), lons
+        )
+        np.testing.assert_allclose(distances, calculate_distance_km(21.5, 39.2, lats, lons), atol=1e-3)
+
+
+class FakeIndexCache:
+    """Just enough of frappe.cache() for the position cache and the index version"""
+
+    def __init__(self):
+        self.data = {}
+
+    def make_key(self, key):
+        return f"test|{key}"
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key) or 0) + 1
+        return self.data[key]
+
+    def get_value(self, key):
+        return self.data.get(key)
+
+    def set_value(self, key, value, expires_in_sec=None):
+        self.data[key] = value
+
+    def delete_value(self, key):
+        self.data.pop(key, None)
+
+
+class TestUpdateVesselAisData(FrappeTestCase):
+    def setUp(self):
+        self.cache = FakeIndexCache()
+        self.rows = [
+            frappe._dict(name=f"V{i}", ais_last_position_lat=21.0 + i, ais_last_position_lon=39.0)
+            for i in range(3)
+        ]
+        self.db = MagicMock()
+        self.db.get_value.side_effect = lambda doctype, filters, *args, **kwargs: (
+            "V1" if filters == {"imo_number": "9123456"} else None
+        )
+
+        for target in (
+            patch.object(frappe, "cache", return_value=self.cache),
+            patch.object(frappe, "db", self.db),
+            patch.object(frappe.local, "response", frappe._dict()),
+            patch.object(vessels, "get_positioned_vessels", side_effect=lambda: [
+                frappe._dict(row) for row in self.rows
+            ]),
+            patch.object(vessels, "_VESSEL_RTREE", None),
+            patch.object(vessels, "_VESSEL_BY_CELL", None)
+        ):
+            target.start()
+            self.addCleanup(target.stop)
+
+    def move_v1(self):
+        return vessels.update_vessel_ais_data("9123456", "111", 25.0, 45.0)
+
+    @skipUnless(vessels.rtree_index, "rtree is not installed")
+    def test_rtree_is_patched_in_place(self):
+        rtree = vessels.get_vessel_rtree()
+
+        self.assertEqual(self.move_v1()["status"], "success")
+
+        # The patched index has the only change it missed, so it is kept
+        self.assertIs(vessels.get_vessel_rtree(), rtree)
+        found = [rtree.vessels[i].name for i in rtree.index.intersection((44.9, 24.9, 45.1, 25.1))]
+        self.assertEqual(found, ["V1"])
+        self.assertEqual(list(rtree.index.intersection((38.9, 21.9, 39.1, 22.1))), [])
+
+    @skipUnless(vessels.h3, "h3 is not installed")
+    def test_h3_buckets_are_patched_in_place(self):
+        cells = vessels.get_vessel_cells()
+
+        self.move_v1()
+
+        self.assertIs(vessels.get_vessel_cells(), cells)
+        cell = vessels.h3.latlng_to_cell(25.0, 45.0, vessels.H3_RESOLUTION)
+        self.assertEqual(cells.cells[cell], {"V1"})
+
+    @skipUnless(vessels.rtree_index, "rtree is not installed")
+    def test_updates_from_other_workers_rebuild_the_index(self):
+        rtree = vessels.get_vessel_rtree()
+
+        # Another worker wrote a position; this worker's index has not seen it
+        vessels.bump_vessel_index_version()
+
+        self.assertIsNot(vessels.get_vessel_rtree(), rtree)
+
+    def test_unknown_vessel_is_not_found(self):
+        result = vessels.update_vessel_ais_data("0000000", "111", 25.0, 45.0)
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(frappe.local.response.http_status_code, 404)
+        self.db.set_value.assert_not_called()
@@ -1,10 +1,44 @@
 import frappe
 from frappe import _
 import json
+import numpy as np
 import redis
+import struct
+import tempfile
 import time
 from datetime import datetime, timedelta
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from vessel_tracker.vessel_tracker.api.vessels import calculate_distance_km, get_bounding_box
+
+logger = frappe.logger("ais", allow_site=False)
+
+# Saudi Arabia port coordinates
+_SAUDI_PORTS = {
+    "Jeddah": {"lat": 21.4858, "lon": 39.1925},
+    "Dammam": {"lat": 26.3927, "lon": 50.1059},
+    "Yanbu": {"lat": 24.0896, "lon": 38.0618},
+    "Jizan": {"lat": 16.8892, "lon": 42.5511},
+    "Jubail": {"lat": 27.0174, "lon": 49.6590}
+}
+_SAUDI_PORTS_LIST = [{"name": name, **coords} for name, coords in _SAUDI_PORTS.items()]
+
+# AIS navigational status text indexed by status code (0-15)
+_NAV_STATUS = (
+    "Under way using engine", "At anchor", "Not under command",
+    "Restricted manoeuvrability", "Constrained by her draught", "Moored",
+    "Aground", "Engaged in Fishing", "Under way sailing",
+    "Unknown", "Unknown", "Unknown", "Unknown", "Unknown", "Unknown",
+    "Default"
+)
+
+# AIS ship type category indexed by type code (0-99)
+_VESSEL_TYPE = ["Other"] * 100
+_VESSEL_TYPE[30:33] = ["Fishing"] * 3
+_VESSEL_TYPE[60:70] = ["Passenger"] * 10
+_VESSEL_TYPE[70:80] = ["Cargo"] * 10
+_VESSEL_TYPE[80:90] = ["Tanker"] * 10
+_VESSEL_TYPE = tuple(_VESSEL_TYPE)
 
 @frappe.whitelist()
 def get_live_vessels(latitude=None, longitude=None, radius_km=50):
@@ -40,60 +74,66 @@ def get_vessels_near_port(port_name, radius_km=100):
     Get vessels near a specific Saudi port
     """
     try:
-        # Saudi Arabia port coordinates
-        saudi_ports = {
-            "Jeddah": {"lat": 21.4858, "lon": 39.1925},
-            "Dammam": {"lat": 26.3927, "lon": 50.1059},
-            "Yanbu": {"lat": 24.0896, "lon": 38.0618},
-            "Jizan": {"lat": 16.8892, "lon": 42.5511},
-            "Jubail": {"lat": 27.0174, "lon": 49.6590}
-        }
-        
-        if port_name not in saudi_ports:
+        port_coords = _SAUDI_PORTS.get(port_name)
+        if not port_coords:
             return {"error": "Port not found"}
-            
-        port_coords = saudi_ports[port_name]
-        
-        # Get all vessels with position data
-        vessels = frappe.get_all(
-            'Vessels',
-            filters={
-                'ais_last_position_lat': ['!=', 0],
-                'ais_last_position_lon': ['!=', 0],
-                'ais_last_position_lat': ['is', 'not null'],
-                'ais_last_position_lon': ['is', 'not null']
-            },
-            fields=[
-                'name', 'vessel_name', 'imo_number', 'ais_mmsi',
-                'ais_last_position_lat', 'ais_last_position_lon',
-                'ais_speed', 'ais_course', 'ais_status',
-                'ais_destination', 'ais_last_update', 'vessel_type'
-            ]
-        )
         
-        # Calculate distances and filter
-        nearby_vessels = []
+        # Only fetch vessels inside the bounding box around the port; the exact
+        # Haversine check below rejects the corners of the box
+        bounds = get_bounding_box(port_coords["lat"], port_coords["lon"], float(radius_km))
+        if bounds["lon_min"] is None:
+            lon_condition = "ais_last_position_lon IS NOT NULL"
+        elif bounds["lon_min"] < -180 or bounds["lon_max"] > 180:
+            # The box crosses the antimeridian; match both wrapped halves
+            bounds["lon_min"] = (bounds["lon_min"] + 180) % 360 - 180
+            bounds["lon_max"] = (bounds["lon_max"] + 180) % 360 - 180
+            lon_condition = "(ais_last_position_lon >= %(lon_min)s OR ais_last_position_lon <= %(lon_max)s)"
+        else:
+            lon_condition = "ais_last_position_lon BETWEEN %(lon_min)s AND %(lon_max)s"
+        vessels = frappe.db.sql(f"""
+            SELECT name, vessel_name, imo_number, ais_mmsi,
+                ais_last_position_lat, ais_last_position_lon,
+                ais_speed, ais_course, ais_status,
+                ais_destination, ais_last_update, vessel_type
+            FROM `tabVessels`
+            WHERE ais_last_position_lat BETWEEN %(lat_min)s AND %(lat_max)s
+                AND {lon_condition}
+                AND ais_last_position_lat != 0
+                AND ais_last_position_lon != 0
+        """, bounds, as_dict=True)
+        
+        # Build coordinate arrays in one pass, skipping rows without a usable position
+        positioned = []
+        lats = []
+        lons = []
         for vessel in vessels:
             if vessel.ais_last_position_lat and vessel.ais_last_position_lon:
                 try:
-                    distance = calculate_distance_km(
-                        port_coords["lat"], port_coords["lon"],
-                        float(vessel.ais_last_position_lat), float(vessel.ais_last_position_lon)
-                    )
-                    
-                    if distance <= radius_km:
-                        vessel["distance_to_port"] = round(distance, 2)
-                        nearby_vessels.append(vessel)
+                    lat = float(vessel.ais_last_position_lat)
+                    lon = float(vessel.ais_last_position_lon)
                 except (ValueError, TypeError) as e:
-                    print(f"Error calculating distance for vessel {vessel.ais_mmsi}: {e}")
+                    logger.debug("Error calculating distance for vessel %s: %s", vessel.ais_mmsi, e)
                     continue
+                positioned.append(vessel)
+                lats.append(lat)
+                lons.append(lon)
         
-        # Sort by distance
-        nearby_vessels.sort(key=lambda x: x.get("distance_to_port", 0))
+        # Calculate all distances at once and keep the 20 closest within radius
+        distances = calculate_distance_km(
+            port_coords["lat"], port_coords["lon"], np.asarray(lats), np.asarray(lons)
+        )
+        within = np.flatnonzero(distances <= float(radius_km))
+        closest = within[np.argsort(distances[within], kind="stable")[:20]]
+        
+        nearby_vessels = []
+        for i in closest:
+            vessel = positioned[i]
+            vessel["distance_to_port"] = round(float(distances[i]), 2)
+            nearby_vessels.append(vessel)
         
         return {
             "port": port_name,
-            "vessels": nearby_vessels[:20]  # Limit to 20 closest
+            "vessels": nearby_vessels
         }
         
     except Exception as e:
@@ -101,52 +141,108 @@ def get_vessels_near_port(port_name, radius_km=100):
         return {"error": str(e)}
 
 # Global variables for performance optimization with size limits
-vessel_cache = {}
-update_queue = defaultdict(dict)
-last_batch_time = time.time()
-MAX_CACHE_SIZE = 10000  # Prevent memory leaks
+UPDATE_RATE_LIMIT_SECONDS = 30  # Minimum time between updates for the same vessel
+FORCE_UPDATE_SECONDS = 300  # Update regardless of movement after this long
+BULK_CHUNK_SIZE = 1000  # Rows per multi-row INSERT statement
+BULK_LOAD_THRESHOLD = 500  # Batches larger than this are written with LOAD DATA LOCAL INFILE
+VESSEL_IDENTITY_TTL_SECONDS = 3600  # Lifetime of the MMSI -> vessel identity cache
+VESSEL_POSITION_FORMAT = struct.Struct("<ff")  # Cached lat/lon as float32
+
+# Runs Redis lookups alongside database queries in update_vessel_ais_batch
+_LOOKUP_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vessel-lookup")
 
 @frappe.whitelist()
 def update_vessel_ais_batch(vessels_data):
     """
     Optimized batch update for multiple vessels
     """
+    if isinstance(vessels_data, str):
+        vessels_data = json.loads(vessels_data)
+        
+    # HTTP callers may send coordinates as strings; the batch path compares plain floats
+    for vessel_data in vessels_data or []:
+        try:
+            coerce_vessel_position(vessel_data)
+        except (TypeError, ValueError):
+            logger.warning(f"Dropping invalid position for MMSI {vessel_data.get('mmsi')}")
+            vessel_data['latitude'] = vessel_data['longitude'] = None
+            
+    return write_vessel_ais_batch(vessels_data)
+
+def write_vessel_ais_batch(vessels_data, now=None, rate_limit=True):
+    """
+    Write a batch of vessel updates and inserts in one transaction
+    
+    `now` is the timestamp written to every row; defaults to the current time.
+    With `rate_limit` off, existing vessels are updated regardless of recent writes and
+    the batch does not count towards the rate limit; used for static data, which must not
+    be dropped behind the position updates that set it.
+    """
     try:
         if not vessels_data:
             return {"status": "success", "updated": 0}
             
-        updated_count = 0
-        existing_vessels = {}
+        taken_imos = set()
+        # One timestamp for every row written by this batch
+        now = now or datetime.now()
         
         # Get all MMSI numbers from the batch
         mmsi_list = [str(v.get('mmsi')) for v in vessels_data if v.get('mmsi')]
         
-        # Also collect IMO numbers to check for existing vessels by IMO
-        imo_numbers = []
-        for v in vessels_data:
-            if v.get('imo_number') and isinstance(v.get('imo_number'), int):
-                imo_numbers.append(str(v['imo_number']))
+        # Rate limit state for the whole batch is fetched on the lookup thread
+        # while the vessel lookups below run, so the round-trips overlap
+        pending_rate_limits = rate_limit and _LOOKUP_EXECUTOR.submit(
+            get_rate_limited_vessels, frappe.cache(), mmsi_list, get_rate_limit_keys(mmsi_list)
+        )
+        
+        # Known vessels come from the Redis identity cache; only misses go to the database
+        existing_vessels = get_cached_vessel_identities(mmsi_list)
+        missed_mmsis = [mmsi for mmsi in mmsi_list if mmsi not in existing_vessels]
         
-        if mmsi_list:
+        if missed_mmsis:
+            # Also collect IMO numbers to check for existing vessels by IMO
+            missed = set(missed_mmsis)
+            imo_numbers = [
+                str(v['imo_number']) for v in vessels_data
+                if str(v.get('mmsi')) in missed and v.get('imo_number') and isinstance(v.get('imo_number'), int)
+            ]
+            
             # Single query to check all existing vessels by MMSI and IMO
-            existing_records = frappe.db.sql("""
-                SELECT name, ais_mmsi, ais_last_update, vessel_name, imo_number
+            conditions = ["ais_mmsi IN %(mmsi_list)s"]
+            if imo_numbers:
+                conditions.append("imo_number IN %(imo_list)s")
+            existing_records = frappe.db.sql(f"""
+                SELECT name, ais_mmsi, vessel_name, imo_number,
+                    ais_last_position_lat, ais_last_position_lon
                 FROM `tabVessels` 
-                WHERE ais_mmsi IN %(mmsi_list)s OR imo_number IN %(imo_list)s
-            """, {"mmsi_list": mmsi_list, "imo_list": imo_numbers + ['dummy']}, as_dict=True)
+                WHERE {' OR '.join(conditions)}
+            """, {"mmsi_list": missed_mmsis, "imo_list": imo_numbers}, as_dict=True)
             
             for record in existing_records:
                 existing_vessels[record.ais_mmsi] = record
                 # Also index by IMO for vessels that might have different MMSI
                 if record.imo_number and not record.imo_number.startswith('AIS-'):
                     existing_vessels[f"IMO-{record.imo_number}"] = record
+            
+            # Single query for every IMO number new vessels in this batch might take
+            taken_imos = get_taken_imo_numbers(missed_mmsis, imo_numbers)
         
-        # Prepare batch updates and inserts
-        updates = []
+        rate_limited = pending_rate_limits.result() if pending_rate_limits else {}
+        
+        # Work on per-field columns instead of per-vessel dicts when building parameters
+        batch = pivot_vessels_data(vessels_data)
+        
+        # Classify vessels by batch position, then build update rows per group in one pass
+        update_rows = []
+        update_records = []
+        mmsi_rows = []
+        mmsi_records = []
         inserts = []
+        inserted = {}
+        identities = {}
         
-        for vessel_data in vessels_data:
-            mmsi = str(vessel_data.get('mmsi'))
+        for i, vessel_data in enumerate(vessels_data):
+            mmsi = batch["mmsi"][i]
             if not mmsi:
                 continue
                 
@@ -154,32 +250,64 @@ def update_vessel_ais_batch(vessels_data):
             existing_record = existing_vessels.get(mmsi)
             
             # Also check if vessel exists by IMO number
-            if not existing_record and vessel_data.get('imo_number') and isinstance(vessel_data.get('imo_number'), int):
-                imo_key = f"IMO-{vessel_data['imo_number']}"
-                existing_record = existing_vessels.get(imo_key)
+            if not existing_record and batch["imo_number"][i]:
+                existing_record = existing_vessels.get(f"IMO-{batch['imo_number'][i]}")
                 if existing_record:
                     # Update MMSI for this existing vessel found by IMO
-                    updates.append(prepare_mmsi_update(mmsi, vessel_data, existing_record))
+                    mmsi_rows.append(i)
+                    mmsi_records.append(existing_record)
                     continue
             
-            if not should_update_vessel(mmsi, vessel_data, existing_record):
+            if rate_limit and not should_update_vessel(mmsi, vessel_data, existing_record, rate_limited):
                 continue
                 
             if existing_record:
                 # Prepare update
-                updates.append(prepare_vessel_update(mmsi, vessel_data, existing_record))
+                update_rows.append(i)
+                update_records.append(existing_record)
             else:
                 # Prepare insert
-                inserts.append(prepare_vessel_insert(mmsi, vessel_data))
+                inserts.append(prepare_vessel_insert(mmsi, vessel_data, taken_imos, now))
+                inserted[mmsi] = dict(zip(INSERT_COLUMNS, inserts[-1]))
+        
+        updates = prepare_vessel_updates(batch, update_rows, update_records, now)
+        updates += prepare_mmsi_updates(batch, mmsi_rows, mmsi_records, now)
+        for i, record, update in zip(update_rows + mmsi_rows, update_records + mmsi_records, updates):
+            identities[batch["mmsi"][i]] = merge_vessel_update(record, update)
+        updated_mmsis = [batch["mmsi"][i] for i in update_rows]
+        
+        # Large bursts (cold start, backfill) go through LOAD DATA instead of multi-row VALUES.
+        # Creating the staging table is DDL and commits, so it happens before this batch writes anything
+        bulk_load = len(vessels_data) > BULK_LOAD_THRESHOLD
+        if bulk_load:
+            ensure_vessel_staging_table()
         
         # Execute batch updates
         if updates:
-            execute_batch_updates(updates)
-            updated_count += len(updates)
+            execute_batch_updates(updates, bulk_load)
             
         if inserts:
-            execute_batch_inserts(inserts)
-            updated_count += len(inserts)
+            execute_batch_inserts(inserts, bulk_load)
+            
+        # Updates matching no row (vessel deleted or renamed under a cached identity) and inserts
+        # colliding on another unique key write nothing; count and cache only the rows that exist
+        written = set(frappe.db.sql_list(
+            "SELECT name FROM `tabVessels` WHERE name IN %s",
+            ([row[0] for row in updates] + [row[0] for row in inserts],)
+        )) if updates or inserts else set()
+        identities.update(inserted)
+        stale_mmsis = [mmsi for mmsi, record in identities.items() if record['name'] not in written]
+        for mmsi in stale_mmsis:
+            del identities[mmsi]
+        updated_count = len(identities)
+        
+        # Updates and inserts land in one transaction
+        frappe.db.commit()
+        if rate_limit:
+            mark_vessels_updated([mmsi for mmsi in updated_mmsis if mmsi in identities])
+        cache_vessel_identities(identities)
+        # The next batch looks these vessels up in the database again instead of trusting the cache
+        forget_vessel_identities(stale_mmsis)
         
         return {"status": "success", "updated": updated_count}
         
@@ -187,117 +315,303 @@ def update_vessel_ais_batch(vessels_data):
         frappe.log_error(f'Error in batch vessel update: {e}')
         return {"status": "error", "message": str(e)}
 
-def should_update_vessel(mmsi, new_data, existing_record):
+def get_cached_vessel_identities(mmsi_list):
+    """
+    Get existing vessel records for a batch from the Redis identity cache with one MGET
+    """
+    if not mmsi_list:
+        return {}
+        
+    cache = frappe.cache()
+    cached = cache.mget([cache.make_key(f"vessel_identity:{mmsi}") for mmsi in mmsi_list])
+    
+    existing_vessels = {}
+    for mmsi, value in zip(mmsi_list, cached):
+        if value:
+            lat, lon = VESSEL_POSITION_FORMAT.unpack_from(value)
+            name, vessel_name, imo_number = json.loads(value[VESSEL_POSITION_FORMAT.size:])
+            existing_vessels[mmsi] = frappe._dict(
+                name=name, ais_mmsi=mmsi, vessel_name=vessel_name, imo_number=imo_number,
+                ais_last_position_lat=None if lat != lat else lat,
+                ais_last_position_lon=None if lon != lon else lon
+            )
+    return existing_vessels
+
+def cache_vessel_identities(identities):
+    """
+    Store MMSI -> vessel identity and last position in Redis for later batches
+    
+    Each vessel has its own key, so entries expire individually after
+    VESSEL_IDENTITY_TTL_SECONDS without a write.
+    """
+    if not identities:
+        return
+        
+    cache = frappe.cache()
+    pipeline = cache.pipeline()
+    for mmsi, record in identities.items():
+        pipeline.setex(
+            cache.make_key(f"vessel_identity:{mmsi}"), VESSEL_IDENTITY_TTL_SECONDS, encode_vessel_identity(record)
+        )
+    pipeline.execute()
+
+def forget_vessel_identities(mmsi_list):
+    """
+    Drop cached vessel identities, so later batches read those vessels from the database
+    """
+    if not mmsi_list:
+        return
+        
+    cache = frappe.cache()
+    cache.delete(*[cache.make_key(f"vessel_identity:{mmsi}") for mmsi in mmsi_list])
+
+def encode_vessel_identity(record):
+    """Encode a vessel identity as float32 lat/lon (NaN when missing) followed by JSON text fields"""
+    lat = record.get('ais_last_position_lat')
+    lon = record.get('ais_last_position_lon')
+    position = VESSEL_POSITION_FORMAT.pack(
+        float('nan') if lat is None else lat, float('nan') if lon is None else lon
+    )
+    return position + json.dumps([
+        record.get('name'), record.get('vessel_name'), record.get('imo_number')
+    ]).encode()
+
+def merge_vessel_update(existing_record, update_row):
+    """Apply the non-NULL values of an update row to an existing vessel record"""
+    merged = dict(existing_record)
+    merged.update((c, v) for c, v in zip(UPDATE_COLUMNS, update_row) if v is not None)
+    return merged
+
+def get_taken_imo_numbers(mmsi_list, imo_numbers):
+    """
+    Get IMO numbers already used that collide with real or AIS-generated IMOs for the batch
+    """
+    conditions = ["imo_number IN %s"]
+    values = [imo_numbers + [f"AIS-{mmsi}" for mmsi in mmsi_list]]
+    
+    # AIS-generated IMOs may carry a "-<counter>" suffix; prefix matches stay index-friendly
+    for mmsi in mmsi_list:
+        conditions.append("imo_number LIKE %s")
+        values.append(f"AIS-{mmsi}-%")
+    
+    return set(frappe.db.sql_list(
+        f"SELECT imo_number FROM `tabVessels` WHERE {' OR '.join(conditions)}",
+        tuple(values)
+    ))
+
+def get_rate_limit_keys(mmsi_list):
+    """Get the rate limit keys for a batch, then the force-update keys, in MMSI order"""
+    cache = frappe.cache()
+    keys = [cache.make_key(f"vessel_update:{mmsi}") for mmsi in mmsi_list]
+    keys += [cache.make_key(f"vessel_update_force:{mmsi}") for mmsi in mmsi_list]
+    return keys
+
+def get_rate_limited_vessels(cache, mmsi_list, keys):
+    """
+    Get rate limit state for a batch with one Redis round-trip
+    
+    Returns MMSI -> True for vessels updated within the rate limit window and
+    MMSI -> False for vessels only within the force-update window. Takes the
+    cache client and prebuilt keys so it can run on the lookup thread, which
+    has no site context.
+    """
+    if not mmsi_list:
+        return {}
+        
+    results = cache.mget(keys)
+    
+    count = len(mmsi_list)
+    return {
+        mmsi: bool(results[i])
+        for i, mmsi in enumerate(mmsi_list)
+        if results[i] or results[count + i]
+    }
+
+def should_update_vessel(mmsi, new_data, existing_record, rate_limited):
     """
     Rate limiting: Only update if significant change or time elapsed
     """
     if not existing_record:
         return True  # Always insert new vessels
         
-    # Check cache first with size limit
-    cache_key = f"vessel_update_{mmsi}"
-    
-    # Prevent memory leak - clear old cache entries
-    if len(vessel_cache) > MAX_CACHE_SIZE:
-        # Keep only recent 5000 entries
-        sorted_cache = sorted(vessel_cache.items(), key=lambda x: x[1], reverse=True)
-        vessel_cache.clear()
-        vessel_cache.update(dict(sorted_cache[:5000]))
-    
-    last_update = vessel_cache.get(cache_key)
-    current_time = time.time()
+    recently_updated = rate_limited.get(mmsi)
     
     # Rate limit: minimum 30 seconds between updates for same vessel
-    if last_update and (current_time - last_update) < 30:
+    if recently_updated:
         return False
         
     # Check if position changed significantly (>0.001 degrees ≈ 100 meters)
     if new_data.get('latitude') and new_data.get('longitude'):
-        try:
-            lat_change = abs(float(new_data['latitude']) - float(existing_record.get('ais_last_position_lat', 0)))
-            lon_change = abs(float(new_data['longitude']) - float(existing_record.get('ais_last_position_lon', 0)))
-            
-            if lat_change > 0.001 or lon_change > 0.001:
-                vessel_cache[cache_key] = current_time
-                return True
-        except (ValueError, TypeError):
-            pass
+        dlat = new_data['latitude'] - (existing_record.get('ais_last_position_lat') or 0)
+        dlon = new_data['longitude'] - (existing_record.get('ais_last_position_lon') or 0)
+        
+        if dlat * dlat + dlon * dlon > 1e-6:
+            return True
     
     # Force update every 5 minutes regardless
-    if not last_update or (current_time - last_update) > 300:
-        vessel_cache[cache_key] = current_time
-        return True
+    return recently_updated is None
+
+def mark_vessels_updated(mmsi_list):
+    """
+    Record vessel updates in Redis for the rate limit and force-update windows in one round-trip
+    """
+    if not mmsi_list:
+        return
         
-    return False
+    cache = frappe.cache()
+    current_time = time.time()
+    pipeline = cache.pipeline()
+    for mmsi in mmsi_list:
+        pipeline.setex(cache.make_key(f"vessel_update:{mmsi}"), UPDATE_RATE_LIMIT_SECONDS, current_time)
+        pipeline.setex(cache.make_key(f"vessel_update_force:{mmsi}"), FORCE_UPDATE_SECONDS, current_time)
+    pipeline.execute()
 
-def prepare_vessel_update(mmsi, vessel_data, existing_record):
+def build_bulk_upsert_sql(columns, on_duplicate):
     """
-    Prepare SQL update statement for existing vessel
+    Build the reusable parts of a multi-row INSERT ... ON DUPLICATE KEY UPDATE into `tabVessels`
+    
+    Target columns in `on_duplicate` are qualified with `tabVessels` so the clause also works
+    for the INSERT ... SELECT from the staging table in `from_staging`.
+    """
+    fields = ", ".join(f"`{c}`" for c in columns)
+    return {
+        "columns": columns,
+        "insert": f"INSERT INTO `tabVessels` ({fields}) VALUES ",
+        "row": f"({', '.join(['%s'] * len(columns))})",
+        "on_duplicate": f" ON DUPLICATE KEY UPDATE {on_duplicate}",
+        "from_staging": (
+            f"INSERT INTO `tabVessels` ({fields}) SELECT {fields} FROM `tabVessels_staging`"
+            f" ON DUPLICATE KEY UPDATE {on_duplicate}"
+        )
+    }
+
+def build_bulk_update_sql(columns):
     """
-    set_clauses = []
-    values = {"vessel_name": existing_record['name']}
+    Build the reusable parts of a multi-row UPDATE of existing `tabVessels` rows
     
-    if vessel_data.get('latitude'):
-        set_clauses.append("ais_last_position_lat = %(latitude)s")
-        values["latitude"] = float(vessel_data['latitude'])
-        
-    if vessel_data.get('longitude'):
-        set_clauses.append("ais_last_position_lon = %(longitude)s")
-        values["longitude"] = float(vessel_data['longitude'])
-        
-    if vessel_data.get('speed') is not None:
-        set_clauses.append("ais_speed = %(speed)s")
-        values["speed"] = float(vessel_data['speed'])
-        
-    if vessel_data.get('course') is not None:
-        set_clauses.append("ais_course = %(course)s")
-        values["course"] = float(vessel_data['course'])
-        
-    if vessel_data.get('status'):
-        set_clauses.append("ais_status = %(status)s")
-        values["status"] = vessel_data['status']
-        
-    if vessel_data.get('destination'):
-        set_clauses.append("ais_destination = %(destination)s")
-        values["destination"] = vessel_data['destination'][:250] if len(str(vessel_data['destination'])) > 250 else vessel_data['destination']
+    Rows are joined on `name` (the first column) from a derived table, so rows that no longer
+    exist are skipped. A NULL in any other column keeps the current value.
+    """
+    fields = ", ".join(f"`{c}`" for c in columns)
+    assignments = ", ".join(
+        f"`tabVessels`.`{c}` = COALESCE(`updates`.`{c}`, `tabVessels`.`{c}`)" for c in columns[1:]
+    )
+    return {
+        "columns": columns,
+        "join": "UPDATE `tabVessels` JOIN (",
+        "first_row": "SELECT " + ", ".join(f"%s AS `{c}`" for c in columns),
+        "row": "SELECT " + ", ".join(["%s"] * len(columns)),
+        "set": f") AS `updates` ON `updates`.`name` = `tabVessels`.`name` SET {assignments}",
+        "from_staging": (
+            f"UPDATE `tabVessels` JOIN (SELECT {fields} FROM `tabVessels_staging`) AS `updates`"
+            f" ON `updates`.`name` = `tabVessels`.`name` SET {assignments}"
+        )
+    }
+
+# Every vessel update shares one column order; NULL means "keep the current value"
+UPDATE_COLUMNS = (
+    "name", "ais_mmsi", "vessel_name", "imo_number",
+    "ais_last_position_lat", "ais_last_position_lon", "ais_speed", "ais_course",
+    "ais_status", "ais_destination", "ais_last_update", "modified", "modified_by"
+)
+UPDATE_SQL = build_bulk_update_sql(UPDATE_COLUMNS)
+
+def pivot_vessels_data(vessels_data):
+    """
+    Pivot the batch from a list of dicts into per-field columns in one pass
+    
+    Numeric fields become float64 arrays with NaN for missing values (a zero
+    latitude/longitude counts as missing); text fields become lists with None.
+    """
+    def numeric(field, zero_is_missing=False):
+        values = np.array(
+            [np.nan if v.get(field) is None else v[field] for v in vessels_data], dtype=np.float64
+        )
+        if zero_is_missing:
+            values[values == 0] = np.nan
+        return values
         
-    # Update vessel name only if empty - handle existing vessel name properly
-    if vessel_data.get('vessel_name') and (not existing_record.get('vessel_name') or existing_record.get('vessel_name').startswith('Unknown Vessel')):
-        clean_name = vessel_data['vessel_name'].strip()[:140]  # Limit length
-        set_clauses.append("vessel_name = %(new_vessel_name)s")
-        values["new_vessel_name"] = clean_name
+    def text(field, limit):
+        return [str(v[field]).strip()[:limit] or None if v.get(field) else None for v in vessels_data]
         
-    # Update IMO number only if current is AIS-generated and we have real IMO
-    if vessel_data.get('imo_number') and isinstance(vessel_data['imo_number'], int):
-        set_clauses.append("imo_number = %(imo_number)s")
-        values["imo_number"] = str(vessel_data['imo_number'])
-    
-    set_clauses.append("ais_last_update = %(update_time)s")
-    set_clauses.append("modified = %(modified_time)s")
-    values["update_time"] = datetime.now()
-    values["modified_time"] = datetime.now()
-    
     return {
-        "sql": f"UPDATE `tabVessels` SET {', '.join(set_clauses)} WHERE name = %(vessel_name)s",
-        "values": values
+        "mmsi": [str(v.get('mmsi')) for v in vessels_data],
+        "latitude": numeric('latitude', zero_is_missing=True),
+        "longitude": numeric('longitude', zero_is_missing=True),
+        "speed": numeric('speed'),
+        "course": numeric('course'),
+        "status": [v.get('status') or None for v in vessels_data],
+        "destination": text('destination', 250),
+        "vessel_name": text('vessel_name', 250),
+        "imo_number": [
+            str(v['imo_number']) if v.get('imo_number') and isinstance(v['imo_number'], int) else None
+            for v in vessels_data
+        ]
     }
 
-def prepare_vessel_insert(mmsi, vessel_data):
+def to_sql_values(values):
+    """Convert a float array to Python floats with None in place of NaN"""
+    return [None if value != value else value for value in values.tolist()]
+
+def prepare_vessel_updates(batch, rows, existing_records, now):
     """
-    Prepare SQL insert for new vessel - handle Link fields properly and avoid duplicates
+    Prepare update rows in UPDATE_COLUMNS order for existing vessels at the given batch positions
+    """
+    idx = np.asarray(rows, dtype=np.intp)
+    
+    # Update vessel name only if empty - handle existing vessel name properly
+    vessel_names = [
+        batch["vessel_name"][i][:140]
+        if batch["vessel_name"][i] and (not record.get('vessel_name') or record.get('vessel_name').startswith('Unknown Vessel'))
+        else None
+        for i, record in zip(rows, existing_records)
+    ]
+    
+    # Update IMO number only if current is AIS-generated and we have real IMO
+    return list(zip(
+        [record['name'] for record in existing_records],
+        repeat(None),
+        vessel_names,
+        [batch["imo_number"][i] for i in rows],
+        to_sql_values(batch["latitude"][idx]),
+        to_sql_values(batch["longitude"][idx]),
+        to_sql_values(batch["speed"][idx]),
+        to_sql_values(batch["course"][idx]),
+        [batch["status"][i] for i in rows],
+        [batch["destination"][i] for i in rows],
+        repeat(now),
+        repeat(now),
+        repeat(None)
+    ))
+
+# Every new vessel is written with the same columns; rows colliding on an existing key
+# (e.g. a duplicate IMO) are skipped by the no-op update
+INSERT_COLUMNS = (
+    "name", "vessel_name", "imo_number", "ais_mmsi", "grt", "dwt",
+    "ais_last_position_lat", "ais_last_position_lon", "ais_speed", "ais_course",
+    "ais_status", "ais_destination", "ais_last_update", "creation", "modified",
+    "owner", "modified_by"
+)
+INSERT_SQL = build_bulk_upsert_sql(INSERT_COLUMNS, "`tabVessels`.`name` = `tabVessels`.`name`")
+
+# Every column either statement loads through the staging table
+STAGING_COLUMNS = UPDATE_COLUMNS + tuple(c for c in INSERT_COLUMNS if c not in UPDATE_COLUMNS)
+
+def prepare_vessel_insert(mmsi, vessel_data, taken_imos, now):
+    """
+    Prepare insert row for new vessel in INSERT_COLUMNS order - handle Link fields properly and avoid duplicates
     """
     vessel_name_raw = vessel_data.get('vessel_name', '') or ''
     vessel_name = vessel_name_raw.strip() if vessel_name_raw else f"Unknown Vessel {mmsi}"
     # Limit vessel name length
     vessel_name = vessel_name[:140] if vessel_name else f"Unknown Vessel {mmsi}"
     
-    # Handle IMO number with duplicate checking
+    # Handle IMO number with duplicate checking against the batch's taken IMOs
     imo_number = None
     if vessel_data.get('imo_number') and isinstance(vessel_data.get('imo_number'), int):
         proposed_imo = str(vessel_data['imo_number'])
         # Check if this IMO already exists
-        existing_imo = frappe.db.exists('Vessels', {'imo_number': proposed_imo})
-        if not existing_imo:
+        if proposed_imo not in taken_imos:
             imo_number = proposed_imo
         else:
             # If IMO exists, use AIS-based IMO to avoid conflict
@@ -309,231 +623,294 @@ def prepare_vessel_insert(mmsi, vessel_data):
     if imo_number.startswith('AIS-'):
         counter = 1
         base_imo = imo_number
-        while frappe.db.exists('Vessels', {'imo_number': imo_number}):
+        while imo_number in taken_imos:
             imo_number = f"{base_imo}-{counter}"
             counter += 1
     
-    values = {
-        "name": frappe.generate_hash(length=10),
-        "vessel_name": vessel_name,
-        "imo_number": imo_number,
-        "ais_mmsi": str(mmsi),
-        "grt": "0",  # Default to 0 instead of "Unknown"
-        "dwt": "0",  # Default to 0 instead of "Unknown"
-        "ais_last_update": datetime.now(),
-        "creation": datetime.now(),
-        "modified": datetime.now(),
-        "owner": "Administrator",
-        "modified_by": "Administrator"
-    }
+    # Reserve the IMO so later vessels in the same batch cannot reuse it
+    taken_imos.add(imo_number)
     
     # Handle position data
-    if vessel_data.get('latitude'):
-        values["ais_last_position_lat"] = float(vessel_data['latitude'])
-    if vessel_data.get('longitude'):
-        values["ais_last_position_lon"] = float(vessel_data['longitude'])
-    if vessel_data.get('speed') is not None:
-        values["ais_speed"] = float(vessel_data['speed'])
-    if vessel_data.get('course') is not None:
-        values["ais_course"] = float(vessel_data['course'])
-    if vessel_data.get('status'):
-        values["ais_status"] = vessel_data['status']
+    latitude = vessel_data.get('latitude')
+    longitude = vessel_data.get('longitude')
+    speed = vessel_data.get('speed')
+    course = vessel_data.get('course')
+    
+    # Limit destination length
+    destination = None
     if vessel_data.get('destination'):
-        # Limit destination length
-        dest = str(vessel_data['destination']).strip()[:250]
-        if dest:
-            values["ais_destination"] = dest
+        destination = str(vessel_data['destination']).strip()[:250] or None
     
     # Skip Link fields for now - they need proper validation
     # call_sign, vessel_type, flag will be left empty for AIS-only vessels
     
-    fields = ", ".join([f"`{k}`" for k in values.keys()])
-    placeholders = ", ".join([f"%({k})s" for k in values.keys()])
-    
-    return {
-        "sql": f"INSERT INTO `tabVessels` ({fields}) VALUES ({placeholders})",
-        "values": values
-    }
+    return (
+        frappe.generate_hash(length=10),
+        vessel_name,
+        imo_number,
+        str(mmsi),
+        "0",  # grt - default to 0 instead of "Unknown"
+        "0",  # dwt - default to 0 instead of "Unknown"
+        float(latitude) if latitude else None,
+        float(longitude) if longitude else None,
+        float(speed) if speed is not None else None,
+        float(course) if course is not None else None,
+        vessel_data.get('status') or None,
+        destination,
+        now,
+        now,
+        now,
+        "Administrator",
+        "Administrator"
+    )
 
-def prepare_mmsi_update(mmsi, vessel_data, existing_record):
-    """Prepare MMSI update for vessel found by IMO"""
-    update_data = {
-        'ais_mmsi': str(mmsi),
-        'modified': datetime.now(),
-        'modified_by': 'Administrator'
-    }
+def prepare_mmsi_updates(batch, rows, existing_records, now):
+    """Prepare MMSI update rows in UPDATE_COLUMNS order for vessels found by IMO"""
+    idx = np.asarray(rows, dtype=np.intp)
     
     # Update vessel name if different and provided
-    if vessel_data.get('vessel_name'):
-        vessel_name = str(vessel_data['vessel_name']).strip()[:250]
-        if vessel_name and vessel_name != existing_record.get('vessel_name'):
-            update_data['vessel_name'] = vessel_name
-    
-    # Update AIS data
-    if vessel_data.get('latitude'):
-        update_data["ais_last_position_lat"] = float(vessel_data['latitude'])
-    if vessel_data.get('longitude'):
-        update_data["ais_last_position_lon"] = float(vessel_data['longitude'])
-    if vessel_data.get('speed') is not None:
-        update_data["ais_speed"] = float(vessel_data['speed'])
-    if vessel_data.get('course') is not None:
-        update_data["ais_course"] = float(vessel_data['course'])
-    if vessel_data.get('status'):
-        update_data["ais_status"] = vessel_data['status']
-    if vessel_data.get('destination'):
-        dest = str(vessel_data['destination']).strip()[:250]
-        if dest:
-            update_data["ais_destination"] = dest
+    vessel_names = [
+        batch["vessel_name"][i] if batch["vessel_name"][i] != record.get('vessel_name') else None
+        for i, record in zip(rows, existing_records)
+    ]
     
-    update_data["ais_last_update"] = datetime.now()
-    
-    return {
-        'name': existing_record.get('name'),
-        'data': update_data
-    }
+    return list(zip(
+        [record.get('name') for record in existing_records],
+        [batch["mmsi"][i] for i in rows],
+        vessel_names,
+        repeat(None),
+        to_sql_values(batch["latitude"][idx]),
+        to_sql_values(batch["longitude"][idx]),
+        to_sql_values(batch["speed"][idx]),
+        to_sql_values(batch["course"][idx]),
+        [batch["status"][i] for i in rows],
+        [batch["destination"][i] for i in rows],
+        repeat(now),
+        repeat(now),
+        repeat('Administrator')
+    ))
 
-def execute_batch_updates(updates):
+def execute_batch_updates(updates, bulk_load=False):
     """
-    Execute multiple updates in a single transaction
+    Execute multiple updates with the precompiled update statement; the caller commits
     """
     if not updates:
         return
         
     try:
-        for update in updates:
-            # Handle both SQL format (from prepare_vessel_update) and data format (from prepare_mmsi_update)
-            if "sql" in update and "values" in update:
-                # SQL format
-                frappe.db.sql(update["sql"], update["values"])
-            elif "name" in update and "data" in update:
-                # Data format - use frappe.db.set_value for multiple fields
-                frappe.db.set_value("Vessels", update["name"], update["data"])
-        frappe.db.commit()
+        if bulk_load:
+            execute_bulk_load(UPDATE_SQL, updates, execute_bulk_update)
+        else:
+            execute_bulk_update(UPDATE_SQL, updates)
     except Exception as e:
         frappe.db.rollback()
         frappe.log_error(f"Batch update error: {e}")
         raise e
 
-def execute_batch_inserts(inserts):
+def execute_bulk_upsert(sql, rows):
+    """
+    Write many rows to `tabVessels` with one statement built by build_bulk_upsert_sql
+    """
+    # Chunk rows to keep each statement well under max_allowed_packet
+    for start in range(0, len(rows), BULK_CHUNK_SIZE):
+        chunk = rows[start:start + BULK_CHUNK_SIZE]
+        frappe.db.sql(
+            sql["insert"] + ", ".join([sql["row"]] * len(chunk)) + sql["on_duplicate"],
+            tuple(value for row in chunk for value in row)
+        )
+
+def ensure_vessel_staging_table():
     """
-    Execute multiple inserts in a single transaction with duplicate handling
+    Create the connection's temporary staging table for LOAD DATA, if it does not exist yet
+    
+    Columns are copied from `tabVessels` through an outer join so they are all nullable.
+    The table lives until the connection closes and is emptied before each load, so it
+    never has to be dropped mid-transaction. Goes through sql_ddl, which commits first.
+    """
+    fields = ", ".join(f"`tabVessels`.`{c}`" for c in STAGING_COLUMNS)
+    frappe.db.sql_ddl(f"""
+        CREATE TEMPORARY TABLE IF NOT EXISTS `tabVessels_staging`
+        SELECT {fields} FROM (SELECT 1) AS `seed` LEFT JOIN `tabVessels` ON 0 LIMIT 0
+    """)
+
+def execute_bulk_update(sql, rows):
+    """
+    Update many existing `tabVessels` rows with one statement built by build_bulk_update_sql
+    """
+    for start in range(0, len(rows), BULK_CHUNK_SIZE):
+        chunk = rows[start:start + BULK_CHUNK_SIZE]
+        frappe.db.sql(
+            sql["join"] + " UNION ALL ".join([sql["first_row"]] + [sql["row"]] * (len(chunk) - 1)) + sql["set"],
+            tuple(value for row in chunk for value in row)
+        )
+
+def execute_bulk_load(sql, rows, fallback):
+    """
+    Write many rows to `tabVessels` through LOAD DATA LOCAL INFILE into the staging table,
+    then apply them with the statement's `from_staging` query
+    
+    The staging table must already exist (see ensure_vessel_staging_table). `fallback`
+    writes the rows with multi-row statements when LOAD DATA is unavailable.
+    """
+    columns = sql["columns"]
+    fields = ", ".join(f"`{c}`" for c in columns)
+    
+    # PyMySQL streams LOAD DATA LOCAL from a client-side file, so spool the rows to a temp file
+    with tempfile.NamedTemporaryFile("w", suffix=".tsv", encoding="utf-8") as buffer:
+        for row in rows:
+            buffer.write("\t".join(to_tsv_field(value) for value in row))
+            buffer.write("\n")
+        buffer.flush()
+        
+        try:
+            frappe.db.sql("DELETE FROM `tabVessels_staging`")
+            frappe.db.sql(f"""
+                LOAD DATA LOCAL INFILE %s INTO TABLE `tabVessels_staging`
+                CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({fields})
+            """, (buffer.name,))
+        except Exception as e:
+            # LOAD DATA LOCAL needs local_infile on both client and server; use multi-row VALUES otherwise
+            logger.error("Bulk load failed, falling back to multi-row statements: %s", e)
+            fallback(sql, rows)
+            return
+            
+        frappe.db.sql(sql["from_staging"])
+
+def to_tsv_field(value):
+    """Encode a value for LOAD DATA's default tab-separated format"""
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+def execute_batch_inserts(inserts, bulk_load=False):
+    """
+    Execute multiple inserts with duplicate handling; the caller commits
     """
     if not inserts:
         return
         
     try:
-        for insert in inserts:
-            try:
-                frappe.db.sql(insert["sql"], insert["values"])
-            except Exception as e:
-                if "Duplicate entry" in str(e) and "imo_number" in str(e):
-                    # Handle duplicate IMO by modifying the IMO number
-                    print(f"Duplicate IMO detected, skipping insert for MMSI: {insert['values'].get('ais_mmsi')}")
-                    continue
-                else:
-                    raise e
-        frappe.db.commit()
+        if bulk_load:
+            execute_bulk_load(INSERT_SQL, inserts, execute_bulk_upsert)
+        else:
+            execute_bulk_upsert(INSERT_SQL, inserts)
     except Exception as e:
         frappe.db.rollback()
-        print(f"Batch insert error: {e}")
+        logger.error("Batch insert error: %s", e)
         raise e
 
+def parse_position_report(message_data):
+    """
+    Extract vessel fields from a PositionReport stream message
+    """
+    position = message_data.get('Message', {}).get('PositionReport', {})
+    metadata = message_data.get('MetaData', {})
+    
+    vessel_data = {
+        'mmsi': position.get('UserID') or metadata.get('MMSI'),
+        'latitude': position.get('Latitude') or metadata.get('latitude'),
+        'longitude': position.get('Longitude') or metadata.get('longitude'),
+        'speed': position.get('Sog'),
+        'course': position.get('Cog'),
+        'status': get_navigation_status(position.get('NavigationalStatus', 15)),
+        'vessel_name': metadata.get('ShipName')
+    }
+    return coerce_vessel_position(vessel_data)
+
+def parse_ship_static_data(message_data):
+    """
+    Extract vessel fields from a ShipStaticData stream message
+    """
+    static = message_data.get('Message', {}).get('ShipStaticData', {})
+    metadata = message_data.get('MetaData', {})
+    
+    vessel_data = {
+        'mmsi': static.get('UserID') or metadata.get('MMSI'),
+        'vessel_name': static.get('Name') or metadata.get('ShipName'),
+        'destination': static.get('Destination'),
+        'call_sign': static.get('CallSign'),
+        'imo_number': static.get('ImoNumber'),
+        'vessel_type': get_vessel_type(static.get('Type', 0))
+    }
+    
+    # Add position from metadata if available
+    if metadata.get('latitude') and metadata.get('longitude'):
+        vessel_data.update({
+            'latitude': metadata['latitude'],
+            'longitude': metadata['longitude']
+        })
+    return coerce_vessel_position(vessel_data)
+
+def coerce_vessel_position(vessel_data):
+    """Parse coordinates once here so the batch path compares plain floats"""
+    if vessel_data.get('mmsi'):
+        if vessel_data.get('latitude') is not None:
+            vessel_data['latitude'] = float(vessel_data['latitude'])
+        if vessel_data.get('longitude') is not None:
+            vessel_data['longitude'] = float(vessel_data['longitude'])
+    return vessel_data
+
+_AIS_MESSAGE_PARSERS = {
+    'PositionReport': parse_position_report,
+    'ShipStaticData': parse_ship_static_data
+}
+
+def parse_ais_message(message_data):
+    """
+    Extract vessel fields from a raw AIS stream message of any supported type
+    """
+    parse = _AIS_MESSAGE_PARSERS.get(message_data.get('MessageType'))
+    return parse(message_data) if parse else {}
+
 @frappe.whitelist()
 def process_ais_message(message_data):
     """
-    Process single AIS message and add to batch queue
+    Process single AIS message and write it straight away
     """
-    global update_queue, last_batch_time
-    
     try:
-        vessel_data = {}
-        
-        # Handle PositionReport
-        if message_data.get('MessageType') == 'PositionReport':
-            position = message_data.get('Message', {}).get('PositionReport', {})
-            metadata = message_data.get('MetaData', {})
-            
-            vessel_data = {
-                'mmsi': position.get('UserID') or metadata.get('MMSI'),
-                'latitude': position.get('Latitude') or metadata.get('latitude'),
-                'longitude': position.get('Longitude') or metadata.get('longitude'),
-                'speed': position.get('Sog'),
-                'course': position.get('Cog'),
-                'status': get_navigation_status(position.get('NavigationalStatus', 15)),
-                'vessel_name': metadata.get('ShipName')
-            }
-            
-        # Handle ShipStaticData  
-        elif message_data.get('MessageType') == 'ShipStaticData':
-            static = message_data.get('Message', {}).get('ShipStaticData', {})
-            metadata = message_data.get('MetaData', {})
+        if isinstance(message_data, str):
+            message_data = json.loads(message_data)
             
-            vessel_data = {
-                'mmsi': static.get('UserID') or metadata.get('MMSI'),
-                'vessel_name': static.get('Name') or metadata.get('ShipName'),
-                'destination': static.get('Destination'),
-                'call_sign': static.get('CallSign'),
-                'imo_number': static.get('ImoNumber'),
-                'vessel_type': get_vessel_type(static.get('Type', 0))
-            }
-            
-            # Add position from metadata if available
-            if metadata.get('latitude') and metadata.get('longitude'):
-                vessel_data.update({
-                    'latitude': metadata['latitude'],
-                    'longitude': metadata['longitude']
-                })
-        
-        if vessel_data.get('mmsi'):
-            mmsi = str(vessel_data['mmsi'])
-            update_queue[mmsi].update(vessel_data)
-            
-            # Process batch every 10 seconds or 50 vessels
-            current_time = time.time()
-            if (current_time - last_batch_time > 10) or len(update_queue) >= 50:
-                process_batch_queue()
-                last_batch_time = current_time
-        
-        return {"status": "success"}
+        return bulk_process_ais_messages([message_data], message_data.get('MessageType'))
         
     except Exception as e:
-        print(f"Error processing AIS message: {e}")
+        logger.debug("Error processing AIS message: %s", e)
         return {"status": "error", "message": str(e)}
 
-def process_batch_queue():
+def bulk_process_ais_messages(messages, message_type=None):
     """
-    Process the queued vessel updates in batch
-    """
-    global update_queue
+    Write a buffer of raw AIS messages with one batch update and a single commit
     
-    if not update_queue:
-        return
+    When every message has the same `message_type`, its parser is picked once for the whole buffer.
+    """
+    parse = _AIS_MESSAGE_PARSERS.get(message_type, parse_ais_message)
+    # Every row from this flush carries the flush time
+    now = datetime.now()
+    vessels = {}
+    for message_data in messages:
+        try:
+            vessel_data = parse(message_data)
+        except Exception as e:
+            logger.debug("Error parsing AIS message: %s", e)
+            continue
         
-    vessels_data = list(update_queue.values())
-    update_queue.clear()
+        if vessel_data.get('mmsi'):
+            # Later messages for the same vessel overwrite earlier fields
+            vessels.setdefault(str(vessel_data['mmsi']), {}).update(vessel_data)
     
-    # Process in background to avoid blocking
-    frappe.enqueue(
-        'vessel_tracker.vessel_tracker.api.live_vessels.update_vessel_ais_batch',
-        vessels_data=vessels_data,
-        queue='long'
-    )
+    # Static data updates names and identifiers, which the position rate limit must not hold back
+    return write_vessel_ais_batch(list(vessels.values()), now, rate_limit=message_type != 'ShipStaticData')
 
 def get_navigation_status(status_code):
     """Get navigation status text from AIS code"""
-    status_map = {
-        0: "Under way using engine", 1: "At anchor", 2: "Not under command",
-        3: "Restricted manoeuvrability", 4: "Constrained by her draught", 5: "Moored",
-        6: "Aground", 7: "Engaged in Fishing", 8: "Under way sailing", 15: "Default"
-    }
-    return status_map.get(status_code, "Unknown")
+    if type(status_code) is int and 0 <= status_code < len(_NAV_STATUS):
+        return _NAV_STATUS[status_code]
+    return "Unknown"
 
 def get_vessel_type(type_code):
     """Get vessel type from AIS type code"""
-    if 30 <= type_code <= 32: return "Fishing"
-    if 60 <= type_code <= 69: return "Passenger"
-    if 70 <= type_code <= 79: return "Cargo"
-    if 80 <= type_code <= 89: return "Tanker"
+    if type(type_code) is int and 0 <= type_code < len(_VESSEL_TYPE):
+        return _VESSEL_TYPE[type_code]
     return "Other"
 
 def create_or_get_link_record(doctype, field_value):
@@ -565,7 +942,7 @@ def create_or_get_link_record(doctype, field_value):
             return field_value
             
     except Exception as e:
-        print(f"Error creating {doctype} record: {e}")
+        logger.error("Error creating %s record: %s", doctype, e)
         
     return None
 
@@ -576,8 +953,8 @@ def update_vessel_ais(mmsi, latitude, longitude, speed=None, course=None, status
     """
     vessel_data = {
         'mmsi': mmsi,
-        'latitude': latitude,
-        'longitude': longitude,
+        'latitude': float(latitude),
+        'longitude': float(longitude),
         'speed': speed,
         'course': course,
         'status': status,
@@ -593,38 +970,12 @@ def get_saudi_ports():
     Get list of Saudi Arabian ports for filtering
     """
     try:
-        ports = [
-            {"name": "Jeddah", "lat": 21.4858, "lon": 39.1925},
-            {"name": "Dammam", "lat": 26.3927, "lon": 50.1059},
-            {"name": "Yanbu", "lat": 24.0896, "lon": 38.0618},
-            {"name": "Jizan", "lat": 16.8892, "lon": 42.5511},
-            {"name": "Jubail", "lat": 27.0174, "lon": 49.6590}
-        ]
-        
-        return {"ports": ports}
+        return {"ports": _SAUDI_PORTS_LIST}
         
     except Exception as e:
         frappe.log_error(f'Error getting ports: {e}')
         return {"error": str(e)}
 
-def calculate_distance_km(lat1, lon1, lat2, lon2):
-    """
-    Calculate distance between two coordinates in kilometers using Haversine formula
-    """
-    from math import radians, cos, sin, asin, sqrt
-    
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(radians, [float(lat1), float(lon1), float(lat2), float(lon2)])
-    
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
-    r = 6371  # Radius of earth in kilometers
-    
-    return c * r
-
 @frappe.whitelist()
 def test_vessel_data():
     """
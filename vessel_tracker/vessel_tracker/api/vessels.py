@@ -1,4 +1,47 @@
+import time
+from collections import defaultdict
+from math import asin, ceil, cos, degrees, radians, sin, sqrt
 
+import frappe
+import numpy as np
+
+try:
+    from rtree import index as rtree_index
+except ImportError:  # rtree is optional; location searches fall back to a full scan
+    rtree_index = None
+
+try:
+    import h3
+except ImportError:  # h3 is optional; small-radius searches use the R-tree without it
+    h3 = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy path is used without it
+    njit = None
+
+VESSEL_LOCATION_FIELDS = [
+    'name', 'vessel_name', 'imo_number', 'vessel_type',
+    'ais_last_position_lat', 'ais_last_position_lon',
+    'ais_speed', 'ais_course', 'ais_status', 'ais_last_update'
+]
+RTREE_MAX_AGE_SECONDS = 60  # Rebuild the in-process index so stream updates from other workers show up
+VESSEL_INDEX_VERSION_KEY = "vessel_index_version"  # Bumped by update_vessel_ais_data in any worker
+VESSEL_POSITIONS_CACHE_KEY = "vessel_positions"
+VESSEL_POSITIONS_TTL_SECONDS = 60  # Bounds staleness from AIS stream writes, which do not invalidate
+H3_RESOLUTION = 5  # Hexagons of roughly 250 km² (8.5 km average edge)
+H3_MIN_EDGE_KM = 6.0  # Below the smallest hexagon edge at H3_RESOLUTION, so rings never under-cover
+H3_MAX_RING = 12  # Searches needing a wider ring of cells use the R-tree instead
+NUMBA_MIN_VESSELS = 2000  # Below this, NumPy beats the JIT kernel's call overhead
+
+# In-process R-tree over vessel positions, built lazily by get_vessel_rtree
+_VESSEL_RTREE = None
+
+# In-process H3 cell -> vessel names buckets, built lazily by get_vessel_cells
+_VESSEL_BY_CELL = None
+
+# Set by get_haversine_kernel on first use: the compiled kernel, or False when it is unavailable
+_HAVERSINE_KERNEL = None
 
 @frappe.whitelist()
 def get_vessel_ais_data(vessel_name=None, imo_number=None, mmsi=None):
@@ -43,36 +86,63 @@ def search_vessels_by_location(latitude, longitude, radius_km=50):
     """
     Search vessels within a radius of given coordinates
     """
+    # Positions are read with the query builder and shared through the cache, neither of which
+    # applies permissions, so check read access to Vessels up front
+    frappe.has_permission('Vessels', 'read', throw=True)
+    
     try:
-        # Get all vessels with AIS position data
-        vessels = frappe.get_all(
-            'Vessels',
-            filters={
-                'ais_last_position_lat': ['!=', ''],
-                'ais_last_position_lon': ['!=', '']
-            },
-            fields=[
-                'name', 'vessel_name', 'imo_number', 'vessel_type',
-                'ais_last_position_lat', 'ais_last_position_lon',
-                'ais_speed', 'ais_course', 'ais_status', 'ais_last_update'
-            ]
-        )
+        latitude = float(latitude)
+        longitude = float(longitude)
+        radius_km = float(radius_km)
         
-        nearby_vessels = []
+        # Ring of cells around the search cell that covers the radius plus the corner of the search cell
+        ring = ceil((radius_km + H3_MIN_EDGE_KM) / (1.5 * H3_MIN_EDGE_KM))
+        cells = get_vessel_cells() if ring <= H3_MAX_RING else None
+        rtree = None if cells else get_vessel_rtree()
         
-        for vessel in vessels:
-            if vessel.ais_last_position_lat and vessel.ais_last_position_lon:
-                distance = calculate_distance_km(
-                    latitude, longitude,
-                    vessel.ais_last_position_lat, vessel.ais_last_position_lon
-                )
-                
-                if distance <= radius_km:
-                    vessel.distance_km = round(distance, 2)
-                    nearby_vessels.append(vessel)
+        if cells:
+            # Only vessels bucketed in nearby cells
+            positioned = [
+                cells.vessels[name]
+                for cell in h3.grid_disk(h3.latlng_to_cell(latitude, longitude, H3_RESOLUTION), ring)
+                for name in cells.cells.get(cell, ())
+            ]
+        elif rtree:
+            # Only vessels inside the search box, over-scanned by √2 so no vessel within radius is missed
+            dlat = radius_km / 111.0 * sqrt(2)
+            dlon = dlat / max(cos(radians(latitude)), 1e-6)
+            positioned = [
+                rtree.vessels[i] for i in
+                rtree.index.intersection((longitude - dlon, latitude - dlat, longitude + dlon, latitude + dlat))
+            ]
+        else:
+            # All positioned vessels, with coordinate arrays and latitude trig ready from the Redis cache
+            positions = get_vessel_positions()
+            # Cheap rectangular prefilter so the Haversine only runs on vessels near the search point
+            candidates = get_bounding_box_candidates(
+                latitude, longitude, radius_km, positions["lats"], positions["lons"]
+            )
+            positioned = [positions["vessels"][i] for i in candidates.tolist()]
+            
+        # Calculate all distances at once and keep those within radius, sorted by distance
+        if cells or rtree:
+            lats = np.asarray([v.ais_last_position_lat for v in positioned], dtype=np.float64)
+            lons = np.asarray([v.ais_last_position_lon for v in positioned], dtype=np.float64)
+            distances = calculate_distance_km(latitude, longitude, lats, lons)
+        else:
+            distances = calculate_distance_km_from_trig(
+                latitude, longitude,
+                positions["cos_lats"][candidates], positions["sin_lats"][candidates], positions["lons"][candidates]
+            )
+        within = np.flatnonzero(distances <= radius_km)
+        order = within[np.argsort(distances[within], kind="stable")]
         
-        # Sort by distance
-        nearby_vessels.sort(key=lambda x: x.distance_km)
+        nearby_vessels = []
+        for i in order:
+            # Copy so index entries are not mutated by the response
+            vessel = frappe._dict(positioned[i])
+            vessel.distance_km = round(float(distances[i]), 2)
+            nearby_vessels.append(vessel)
         
         return nearby_vessels
         
@@ -81,50 +151,389 @@ def search_vessels_by_location(latitude, longitude, radius_km=50):
         return []
 
 
+def get_bounding_box(latitude, longitude, radius_km):
+    """
+    Get the latitude/longitude box that encloses a search circle
+    
+    The longitude bounds are None when the circle reaches a pole and so covers every longitude,
+    and may fall outside ±180 when the box crosses the antimeridian.
+    """
+    latitude = float(latitude)
+    longitude = float(longitude)
+    # Angular radius, widened by about a metre so float32 coordinates on the circle are kept
+    angle = float(radius_km) / 6371 + 2e-7
+    dlat = degrees(angle)
+    bounds = {
+        "lat_min": latitude - dlat,
+        "lat_max": latitude + dlat,
+        "lon_min": None,
+        "lon_max": None
+    }
+    
+    if abs(latitude) + dlat < 90:
+        # The circle's widest longitude span, reached poleward of the centre
+        dlon = degrees(asin(sin(angle) / cos(radians(latitude))))
+        bounds["lon_min"] = longitude - dlon
+        bounds["lon_max"] = longitude + dlon
+        
+    return bounds
+
+
+def get_bounding_box_candidates(latitude, longitude, radius_km, lats, lons):
+    """
+    Get indices of the positions inside the latitude/longitude box that encloses the search circle
+    """
+    bounds = get_bounding_box(latitude, longitude, radius_km)
+    mask = (lats >= bounds["lat_min"]) & (lats <= bounds["lat_max"])
+    
+    if bounds["lon_min"] is not None:
+        # Wrap differences into [-180, 180) so boxes across the antimeridian still match
+        dlon = (bounds["lon_max"] - bounds["lon_min"]) / 2
+        mask &= np.abs((lons - np.float32(longitude) + 180) % 360 - 180) <= dlon
+        
+    return np.flatnonzero(mask)
+
+
+def get_positioned_vessels():
+    """
+    Get all vessels with AIS position data
+    """
+    # Frappe's "is set" filter compiles to a string comparison; ask for IS NOT NULL directly
+    Vessels = frappe.qb.DocType('Vessels')
+    return (
+        frappe.qb.from_(Vessels)
+        .select(*(Vessels[field] for field in VESSEL_LOCATION_FIELDS))
+        .where(Vessels.ais_last_position_lat.isnotnull() & Vessels.ais_last_position_lon.isnotnull())
+    ).run(as_dict=True)
+
+
+def get_vessel_positions():
+    """
+    Get positioned vessels and their coordinate arrays, cached in Redis
+    
+    Returns a dict of `vessels` rows with matching float32 `lats` and `lons` arrays,
+    plus float64 `cos_lats` and `sin_lats` for calculate_distance_km_from_trig.
+    """
+    cache = frappe.cache()
+    positions = cache.get_value(VESSEL_POSITIONS_CACHE_KEY)
+    if positions is None:
+        vessels = [
+            vessel for vessel in get_positioned_vessels()
+            if vessel.ais_last_position_lat and vessel.ais_last_position_lon
+        ]
+        lats = np.asarray([v.ais_last_position_lat for v in vessels], dtype=np.float64)
+        positions = {
+            "vessels": vessels,
+            # Coordinates are stored compactly; float32 keeps them to well under a metre
+            "lats": lats.astype(np.float32),
+            "lons": np.asarray([v.ais_last_position_lon for v in vessels], dtype=np.float32),
+            # Latitude trig changes only when vessels move, so searches reuse it. It stays float64:
+            # the cosine form of the distance cancels to tiny values for nearby vessels
+            "cos_lats": np.cos(np.radians(lats)),
+            "sin_lats": np.sin(np.radians(lats))
+        }
+        cache.set_value(VESSEL_POSITIONS_CACHE_KEY, positions, expires_in_sec=VESSEL_POSITIONS_TTL_SECONDS)
+        
+    return positions
+
+
+def get_vessel_rtree():
+    """
+    Get the in-process R-tree of vessel positions, rebuilding it when missing or stale
+    
+    Entries are point boxes (lon, lat, lon, lat) whose integer ids index `vessels`.
+    Returns None when rtree is not installed.
+    """
+    global _VESSEL_RTREE
+    
+    if not rtree_index:
+        return None
+        
+    version = get_vessel_index_version()
+    if is_vessel_index_current(_VESSEL_RTREE, version):
+        return _VESSEL_RTREE
+        
+    # Copy so index updates do not touch the cached list
+    vessels = list(get_vessel_positions()["vessels"])
+    # Index the rows' exact coordinates, not the float32 arrays, so update_vessel_rtree deletes match
+    entries = []
+    for i, vessel in enumerate(vessels):
+        lat = float(vessel.ais_last_position_lat)
+        lon = float(vessel.ais_last_position_lon)
+        entries.append((i, (lon, lat, lon, lat), None))
+    
+    # Bulk loading is much faster than inserting points one by one, but rejects empty input
+    idx = rtree_index.Index(entries) if entries else rtree_index.Index()
+    _VESSEL_RTREE = frappe._dict(
+        index=idx,
+        vessels=vessels,
+        ids={vessel.name: i for i, vessel in enumerate(vessels)},
+        built_at=time.monotonic(),
+        version=version
+    )
+    return _VESSEL_RTREE
+
+
+def get_vessel_cells():
+    """
+    Get the in-process H3 buckets of vessel names by cell, rebuilding them when missing or stale
+    
+    Returns None when h3 is not installed.
+    """
+    global _VESSEL_BY_CELL
+    
+    if not h3:
+        return None
+        
+    version = get_vessel_index_version()
+    if is_vessel_index_current(_VESSEL_BY_CELL, version):
+        return _VESSEL_BY_CELL
+        
+    cells = defaultdict(set)
+    vessels = {}
+    for vessel in get_vessel_positions()["vessels"]:
+        # Bucket by the rows' exact coordinates, as update_vessel_cells does
+        lat = float(vessel.ais_last_position_lat)
+        lon = float(vessel.ais_last_position_lon)
+        cells[h3.latlng_to_cell(lat, lon, H3_RESOLUTION)].add(vessel.name)
+        vessels[vessel.name] = vessel
+        
+    _VESSEL_BY_CELL = frappe._dict(cells=cells, vessels=vessels, built_at=time.monotonic(), version=version)
+    return _VESSEL_BY_CELL
+
+
+def get_vessel_index_version():
+    """
+    Get the shared version of vessel positions written through update_vessel_ais_data
+    """
+    cache = frappe.cache()
+    return int(cache.get(cache.make_key(VESSEL_INDEX_VERSION_KEY)) or 0)
+
+
+def bump_vessel_index_version():
+    """
+    Mark every worker's in-process vessel indexes stale, returning the new version
+    """
+    cache = frappe.cache()
+    return cache.incr(cache.make_key(VESSEL_INDEX_VERSION_KEY))
+
+
+def is_vessel_index_current(index, version):
+    """
+    Check an in-process vessel index against the shared version and its age
+    
+    The age bound still applies because AIS stream batches do not bump the version.
+    """
+    return bool(
+        index
+        and index.version == version
+        and time.monotonic() - index.built_at < RTREE_MAX_AGE_SECONDS
+    )
+
+
+def adopt_vessel_index_version(index, version):
+    """
+    Move a patched index to `version` if the only change it missed is the one just patched in
+    """
+    if index.version == version - 1:
+        index.version = version
+
+
+def update_vessel_cells(name, updates, version):
+    """
+    Move a vessel to the H3 cell of its new position, if the buckets are built
+    """
+    if not _VESSEL_BY_CELL:
+        return
+        
+    old = _VESSEL_BY_CELL.vessels.get(name)
+    if old:
+        old_cell = h3.latlng_to_cell(
+            float(old.ais_last_position_lat), float(old.ais_last_position_lon), H3_RESOLUTION
+        )
+        _VESSEL_BY_CELL.cells[old_cell].discard(name)
+        row = frappe._dict(old, **{
+            field: value for field, value in updates.items() if field in VESSEL_LOCATION_FIELDS
+        })
+    else:
+        # Not bucketed yet; load the rest of its search fields once
+        row = frappe.db.get_value('Vessels', name, VESSEL_LOCATION_FIELDS, as_dict=True)
+        if not row:
+            return
+        row.update(updates)
+        
+    cell = h3.latlng_to_cell(float(row.ais_last_position_lat), float(row.ais_last_position_lon), H3_RESOLUTION)
+    _VESSEL_BY_CELL.cells[cell].add(name)
+    _VESSEL_BY_CELL.vessels[name] = row
+    adopt_vessel_index_version(_VESSEL_BY_CELL, version)
+
+
+def update_vessel_rtree(name, updates, version):
+    """
+    Move a vessel to its new position in the in-process R-tree, if the index is built
+    
+    `updates` holds the changed fields, including both position fields, and `version` is
+    the shared index version bumped for this update.
+    """
+    if not _VESSEL_RTREE:
+        return
+        
+    lat = float(updates['ais_last_position_lat'])
+    lon = float(updates['ais_last_position_lon'])
+    
+    i = _VESSEL_RTREE.ids.get(name)
+    if i is None:
+        # Not indexed yet; load the rest of its search fields once
+        row = frappe.db.get_value('Vessels', name, VESSEL_LOCATION_FIELDS, as_dict=True)
+        if not row:
+            return
+        row.update(updates)
+        i = len(_VESSEL_RTREE.vessels)
+        _VESSEL_RTREE.vessels.append(row)
+        _VESSEL_RTREE.ids[name] = i
+    else:
+        old = _VESSEL_RTREE.vessels[i]
+        old_lat = float(old.ais_last_position_lat)
+        old_lon = float(old.ais_last_position_lon)
+        _VESSEL_RTREE.index.delete(i, (old_lon, old_lat, old_lon, old_lat))
+        _VESSEL_RTREE.vessels[i] = frappe._dict(old, **{
+            field: value for field, value in updates.items() if field in VESSEL_LOCATION_FIELDS
+        })
+        
+    _VESSEL_RTREE.index.insert(i, (lon, lat, lon, lat))
+    adopt_vessel_index_version(_VESSEL_RTREE, version)
+
+
 @frappe.whitelist()
 def update_vessel_ais_data(imo_number, mmsi, latitude, longitude, speed=None, course=None, status=None):
     """
     Update vessel AIS data from external sources
     """
     try:
-        vessel = frappe.get_doc('Vessels', {'imo_number': imo_number})
+        # Position updates skip the document lifecycle: one lookup, one UPDATE
+        name = frappe.db.get_value('Vessels', {'imo_number': imo_number}, 'name')
+        if not name:
+            frappe.local.response.http_status_code = 404
+            return {"status": "error", "message": "Vessel not found"}
         
-        vessel.ais_mmsi = mmsi
-        vessel.ais_last_position_lat = latitude
-        vessel.ais_last_position_lon = longitude
-        vessel.ais_last_update = frappe.utils.now()
+        updates = {
+            'ais_mmsi': mmsi,
+            'ais_last_position_lat': latitude,
+            'ais_last_position_lon': longitude,
+            'ais_last_update': frappe.utils.now()
+        }
         
         if speed is not None:
-            vessel.ais_speed = speed
+            updates['ais_speed'] = speed
         if course is not None:
-            vessel.ais_course = course
+            updates['ais_course'] = course
         if status:
-            vessel.ais_status = status
+            updates['ais_status'] = status
             
-        vessel.save()
+        frappe.db.set_value('Vessels', name, updates, update_modified=False)
         frappe.db.commit()
         
+        # Next search reloads positions, and other workers rebuild their indexes on the new
+        # version; this worker's indexes are patched in place
+        frappe.cache().delete_value(VESSEL_POSITIONS_CACHE_KEY)
+        version = bump_vessel_index_version()
+        update_vessel_cells(name, updates, version)
+        update_vessel_rtree(name, updates, version)
+        
         return {"status": "success", "message": "Vessel AIS data updated"}
         
     except Exception as e:
+        frappe.db.rollback()
         frappe.log_error(f'Error updating vessel AIS data: {e}')
+        frappe.local.response.http_status_code = 500
         return {"status": "error", "message": str(e)}
 
 
 def calculate_distance_km(lat1, lon1, lat2, lon2):
     """
     Calculate distance between two coordinates in kilometers
+    
+    Array inputs are computed in one vectorized pass and return an array of distances.
+    Positions may be stored as float32, but distances are always computed in float64.
+    """
+    if np.isscalar(lat2):
+        # Convert to radians
+        lat1, lon1, lat2, lon2 = map(radians, [float(lat1), float(lon1), float(lat2), float(lon2)])
+        
+        # Haversine formula
+        dlat = lat2 - lat1
+        dlon = lon2 - lon1
+        a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
+        c = 2 * asin(sqrt(a))
+        r = 6371  # Radius of earth in kilometers
+        
+        return c * r
+        
+    # Large arrays from one point go through the fused, parallel Numba kernel when available
+    kernel = np.isscalar(lat1) and np.size(lat2) > NUMBA_MIN_VESSELS and get_haversine_kernel()
+    if kernel:
+        distances = np.empty(np.size(lat2), dtype=np.float64)
+        kernel(
+            float(lat1), float(lon1),
+            np.ascontiguousarray(lat2, dtype=np.float64), np.ascontiguousarray(lon2, dtype=np.float64),
+            distances
+        )
+        return distances
+        
+    lat1r, lon1r, lat2r, lon2r = (
+        np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2)
+    )
+    a = np.sin((lat2r - lat1r) / 2) ** 2 + np.cos(lat1r) * np.cos(lat2r) * np.sin((lon2r - lon1r) / 2) ** 2
+    
+    return 2 * 6371 * np.arcsin(np.sqrt(a))
+
+
+def calculate_distance_km_from_trig(lat1, lon1, cos_lats, sin_lats, lons):
+    """
+    Calculate distances in kilometers from one point to many, given the cosine and sine of their latitudes
+    
+    Uses hav(θ) = (1 - sin φ1 sin φ2 - cos φ1 cos φ2 cos Δλ) / 2, so each row needs one cos besides arcsin.
     """
-    from math import radians, cos, sin, asin, sqrt
+    lat1 = radians(float(lat1))
+    dlon = np.radians(np.asarray(lons).astype(np.float64, copy=False)) - radians(float(lon1))
+    a = (1 - sin(lat1) * sin_lats - cos(lat1) * cos_lats * np.cos(dlon)) / 2
     
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(radians, [float(lat1), float(lon1), float(lat2), float(lon2)])
+    # Rounding can push a just outside [0, 1] for coincident or antipodal points
+    return 2 * 6371 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+if njit:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _haversine_bulk(lat0, lon0, lats, lons, out):
+        """Haversine distances in kilometers from one point, written into `out` without temporaries"""
+        lat0 = radians(lat0)
+        lon0 = radians(lon0)
+        cos_lat0 = cos(lat0)
+        for i in prange(lats.shape[0]):
+            lat = radians(lats[i])
+            dlat = lat - lat0
+            dlon = radians(lons[i]) - lon0
+            a = sin(dlat / 2) ** 2 + cos_lat0 * cos(lat) * sin(dlon / 2) ** 2
+            out[i] = 2 * 6371 * asin(sqrt(a))
+
+
+def get_haversine_kernel():
+    """
+    Get the Numba Haversine kernel, compiling it on the first search large enough to use it
     
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
-    r = 6371  # Radius of earth in kilometers
+    Returns None when Numba is not installed or the kernel fails to compile; the failure is
+    logged once and later searches stay on the NumPy path.
+    """
+    global _HAVERSINE_KERNEL
     
-    return c * r
+    if _HAVERSINE_KERNEL is None:
+        _HAVERSINE_KERNEL = False
+        if njit:
+            try:
+                probe = np.zeros(1)
+                _haversine_bulk(0.0, 0.0, probe, probe, np.empty_like(probe))
+                _HAVERSINE_KERNEL = _haversine_bulk
+            except Exception as e:
+                frappe.log_error(f'Numba Haversine kernel unavailable, using NumPy: {e}')
+                
+    return _HAVERSINE_KERNEL or None
@@ -0,0 +1,8 @@
+from vessel_tracker.patches import add_vessel_position_index
+
+
+def after_install():
+    """
+    Set up database indexes; patches are marked complete on a fresh install without running
+    """
+    add_vessel_position_index.execute()
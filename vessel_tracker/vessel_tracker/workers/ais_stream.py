@@ -1,61 +1,210 @@
 # worker.py
-import json
+import orjson
 import asyncio
-import websockets
 import time
 import frappe
+from vessel_tracker.vessel_tracker.api.live_vessels import bulk_process_ais_messages
 
-async def connect_ais_stream():
+AIS_BUFFER_MAX_MESSAGES = 500  # Flush a message buffer once it holds this many messages
+AIS_BUFFER_MAX_SECONDS = 1.0  # ...or flush position reports this often
+AIS_STATIC_BUFFER_MAX_SECONDS = 10.0  # ...and ship static data this often; it rarely changes
+AIS_PUBLISH_MAX_MESSAGES = 100  # Publish buffered messages to the frontend once this many are held
+AIS_PUBLISH_MAX_SECONDS = 0.25  # ...or this often
+AIS_STREAM_BOUNDING_BOX = [[36.0, 15.0], [52.0, 33.0]]  # [SW_lon, SW_lat], [NE_lon, NE_lat] - covers Red Sea to Persian Gulf
+AIS_STREAM_SHARD_GRID = 2  # Split the bounding box into GRID x GRID tiles, one worker process each
+AIS_STREAM_QUEUE = "ais_stream"  # Dedicated RQ queue; needs GRID x GRID workers, see the README
+AIS_STREAM_JOB_TIMEOUT = 24 * 60 * 60  # Shards are killed after this long and respawned by the scheduler
+AIS_STREAM_LOCK_SECONDS = 30  # Lifetime of the lock that serializes shard enqueueing
+
+# Same log as the batch writer in live_vessels
+logger = frappe.logger("ais", allow_site=False)
+
+def flush_ais_buffer(buffer, message_type):
+    """
+    Hand the buffered messages of one type to one bulk database write and empty the buffer
+    """
+    if not buffer:
+        return
+    
+    messages = buffer[:]
+    buffer.clear()
     try:
-        async with websockets.connect("wss://stream.aisstream.io/v0/stream") as websocket:
+        bulk_process_ais_messages(messages, message_type)
+    except Exception as e:
+        # The buffered messages are dropped; keep a record of it in the Error Log
+        frappe.log_error(f"AIS Stream Flush Error ({message_type}, {len(messages)} messages): {e}")
+
+async def flush_ais_buffer_periodically(buffer, message_type, interval):
+    """
+    Flush the buffer on a timer so messages are written even when the stream pauses
+    """
+    while True:
+        await asyncio.sleep(interval)
+        flush_ais_buffer(buffer, message_type)
+
+def publish_ais_buffer(publish_buffer):
+    """
+    Publish the buffered messages to the frontend as one realtime event and empty the buffer
+    """
+    if not publish_buffer:
+        return
+    
+    messages = publish_buffer[:]
+    publish_buffer.clear()
+    try:
+        frappe.publish_realtime(event="ais_stream_batch", message=messages)
+    except Exception as e:
+        logger.error("AIS Stream Publish Error: %s", e)
+
+async def publish_ais_buffer_periodically(publish_buffer):
+    """
+    Publish the buffer on a timer so the map keeps moving when the stream is quiet
+    """
+    while True:
+        await asyncio.sleep(AIS_PUBLISH_MAX_SECONDS)
+        publish_ais_buffer(publish_buffer)
+
+async def connect_ais_stream(bounding_box=None):
+    # Position reports dominate the stream; keep them apart from static data so each flush parses one type
+    position_buffer = []
+    static_buffer = []
+    publish_buffer = []
+    
+    # Imported here so the scheduler entry point and helpers load without the websocket client
+    import websockets
+    
+    try:
+        # AIS frames are small JSON that compresses poorly; skip per-frame deflate and cap frames at 64 KiB.
+        # Explicit pings keep the connection alive without relying on proxy keepalives
+        async with websockets.connect(
+            "wss://stream.aisstream.io/v0/stream",
+            compression=None,
+            max_size=2**16,
+            max_queue=1024,
+            ping_interval=20,
+            ping_timeout=20,
+            close_timeout=5
+        ) as websocket:
             subscribe_message = {
                 "APIKey": frappe.conf.get("AIS_API_KEY"),
-                "BoundingBoxes": [[[36.0, 15.0], [52.0, 33.0]]],  # [SW_lon, SW_lat], [NE_lon, NE_lat] - covers Red Sea to Persian Gulf
+                "BoundingBoxes": [bounding_box or AIS_STREAM_BOUNDING_BOX],
                 "FilterMessageTypes": ["PositionReport", "ShipStaticData"]
             }
 
-            subscribe_message_json = json.dumps(subscribe_message)
+            # websockets sends bytes as a binary frame, so decode to keep the subscription a text frame
+            subscribe_message_json = orjson.dumps(subscribe_message).decode()
             await websocket.send(subscribe_message_json)
 
-            async for message_json in websocket:
-                try:
-                    data = json.loads(message_json)
-                    
-                    # Process AIS message for database storage
-                    frappe.call('vessel_tracker.vessel_tracker.api.live_vessels.process_ais_message', 
-                                message_data=data)
+            # Messages are written in bulk: on size here, on time by the flusher tasks
+            flushers = [
+                asyncio.create_task(flush_ais_buffer_periodically(
+                    position_buffer, "PositionReport", AIS_BUFFER_MAX_SECONDS
+                )),
+                asyncio.create_task(flush_ais_buffer_periodically(
+                    static_buffer, "ShipStaticData", AIS_STATIC_BUFFER_MAX_SECONDS
+                ))
+            ]
+            publisher = asyncio.create_task(publish_ais_buffer_periodically(publish_buffer))
+
+            try:
+                async for message_json in websocket:
+                    try:
+                        data = orjson.loads(message_json)
                     
-                    # Also publish to realtime for frontend
-                    frappe.publish_realtime(
-                        event="ais_stream",
-                        message=data,
-                    )
-                except Exception as e:
-                    print(f"AIS Stream Message Error: {e}")
+                        # Buffer the AIS message for the next bulk database write of its type
+                        message_type = data.get("MessageType")
+                        if message_type == "PositionReport":
+                            position_buffer.append(data)
+                            if len(position_buffer) >= AIS_BUFFER_MAX_MESSAGES:
+                                flush_ais_buffer(position_buffer, message_type)
+                        elif message_type == "ShipStaticData":
+                            static_buffer.append(data)
+                            if len(static_buffer) >= AIS_BUFFER_MAX_MESSAGES:
+                                flush_ais_buffer(static_buffer, message_type)
                     
+                        # Also publish to realtime for frontend, coalesced into batches
+                        publish_buffer.append(data)
+                        if len(publish_buffer) >= AIS_PUBLISH_MAX_MESSAGES:
+                            publish_ais_buffer(publish_buffer)
+                    except Exception as e:
+                        logger.debug("AIS Stream Message Error: %s", e)
+            finally:
+                for flusher in flushers:
+                    flusher.cancel()
+                publisher.cancel()
+                flush_ais_buffer(position_buffer, "PositionReport")
+                flush_ais_buffer(static_buffer, "ShipStaticData")
+                publish_ais_buffer(publish_buffer)
+
     except Exception as e:
-        print(f"AIS Stream Reconnect: {e}")
+        logger.warning("AIS Stream Reconnect: %s", e)
         await asyncio.sleep(5)
 
-def run():
+def split_bounding_box(bounding_box, grid):
+    """
+    Split a [[SW_lon, SW_lat], [NE_lon, NE_lat]] box into grid x grid tiles
+    """
+    (west, south), (east, north) = bounding_box
+    dlon = (east - west) / grid
+    dlat = (north - south) / grid
+    return [
+        [[west + i * dlon, south + j * dlat], [west + (i + 1) * dlon, south + (j + 1) * dlat]]
+        for j in range(grid) for i in range(grid)
+    ]
+
+def start_ais_stream_shards():
+    """
+    Enqueue one stream worker per tile of the subscription bounding box, so ingest scales across processes
+    
+    Runs every minute from the scheduler; only shards without a queued or running job are enqueued.
+    Shards run for up to a day each, so they get their own queue instead of starving the `long` workers.
+    """
+    cache = frappe.cache()
+    # Concurrent scheduler ticks would both see a shard missing; the NX lock lets one of them enqueue.
+    # It is left to expire so a tick right behind this one does not run before the new jobs show up
+    if not cache.set(cache.make_key("ais_stream_enqueue_lock"), 1, ex=AIS_STREAM_LOCK_SECONDS, nx=True):
+        return
+    
+    running = {
+        job.job_name for job in frappe.get_all(
+            "RQ Job",
+            filters={"queue": AIS_STREAM_QUEUE, "status": ["in", ["queued", "started"]]},
+            fields=["job_name"]
+        )
+    }
+    
+    for i, bounding_box in enumerate(split_bounding_box(AIS_STREAM_BOUNDING_BOX, AIS_STREAM_SHARD_GRID)):
+        job_name = f"ais_stream_worker_{i}"
+        if job_name in running:
+            continue
+            
+        frappe.enqueue(
+            run,
+            queue=AIS_STREAM_QUEUE,
+            timeout=AIS_STREAM_JOB_TIMEOUT,
+            job_name=job_name,
+            bounding_box=bounding_box
+        )
+
+def run(bounding_box=None, site=None):
     import frappe
-    import os
     
-    # Get the site name from current working directory or default to first site
+    # Get the site name from the bench's sites directory or default to the bench's default site.
+    # frappe is not initialised yet, so both lookups are given the sites path explicitly
+    sites_path = getattr(frappe.local, "sites_path", None) or "."
+    try:
+        site_name = site or frappe.get_sites(sites_path)[0]
+    except Exception:
+        site_name = frappe.get_site_config(sites_path=sites_path).get("default_site") or "fmh.psc-s.com"
+    
     try:
-        # Try to get site from sites directory
-        sites_path = "/home/frappe/frappe-bench/sites"
-        sites = [d for d in os.listdir(sites_path) 
-                if os.path.isdir(os.path.join(sites_path, d)) and d not in ['assets', '__pycache__']]
-        site_name = sites[0] if sites else "fmh.psc-s.com"
-        
         frappe.init(site=site_name)
         frappe.connect()
         
     except Exception as e:
-        print(f"Frappe initialization error: {e}")
+        logger.error("Frappe initialization error: %s", e)
         # Fallback initialization
         frappe.init(site="fmh.psc-s.com")
         frappe.connect()
     
-    asyncio.run(connect_ais_stream())
+    asyncio.run(connect_ais_stream(bounding_box))